@@ -1,6 +1,127 @@
 import json
 import re
 
+from publish_profiles import layer_name
+
+# Pages whose filterFunc is replaced by the indexed engine (js/filter_engine.js)
+FILTER_PAGES = ['index.html', 'index2.html', 'indexSUM.html', 'index_individual.html']
+
+# The generated block (ENGINE_FILTER_FUNC) or a page's original filterFunc
+FILTER_FUNC = re.compile(
+    r'(?P<indent> *)// Indexed filtering .*?function runFilters\(\) \{\n(?P<body>.*?)\n(?P=indent)\}\n'
+    r'(?P=indent)// End of generated filterFunc\n'
+    r'|(?P<legacy> *)(?:// Indexed filtering .*?var layerFilters = \{\};\n(?P=legacy))?'
+    r'function filterFunc\(\) \{\n(?P<legacy_body>.*?)\n(?P=legacy)\}\n', re.S)
+
+ENGINE_FILTER_FUNC = """\
+{i}// Indexed filtering (js/filter_engine.js, generated by add_filters_to_html.py):
+{i}// a filter change re-evaluates only its own dimension and moves the markers
+{i}// whose visibility changed in or out of the layer instead of rebuilding it.
+{i}// With a SummaryFields spec on the page, filtering and the summary totals
+{i}// run in a Web Worker (js/filter_worker.js); once the layer's column file
+{i}// is loaded (js/column_data.js) they read its typed arrays.
+{i}var layerFilters = {{}};
+{i}var filterFrame = null;
+{i}// Slider 'update' events fire for every pixel dragged; filter once per frame
+{i}function filterFunc() {{
+{i}    if (filterFrame === null) {{
+{i}        filterFrame = requestAnimationFrame(function() {{
+{i}            filterFrame = null;
+{i}            runFilters();
+{i}        }});
+{i}    }}
+{i}}}
+{i}function runFilters() {{
+{i}    map.eachLayer(function(lyr) {{
+{i}        if ("options" in lyr && "dataVar" in lyr["options"]) {{
+{i}            var layerName = lyr["options"]["layerName"];
+{i}            var data = window[lyr["options"]["dataVar"]];
+{i}            layerFilters[layerName] = LayerFilter.sync(layerFilters[layerName], window[layerName],
+{i}                                                       data.features, Filters, window.SummaryFields,
+{i}                                                       ColumnData.table(lyr["options"]["dataVar"]));
+{i}            LayerFilter.update(layerFilters[layerName], LayerFilter.controls(Filters), function(result) {{
+{tail}{i}            }});
+{i}        }}
+{i}    }});
+{i}}}
+{i}// End of generated filterFunc
+"""
+
+
+def include_script(html, src):
+    """Add a <script src> for `src` after the wNumb.js include (or before
+    </head>) unless the page already loads it."""
+    if f'src="{src}"' in html:
+        return html
+    tag = f'<script src="{src}"></script>\n'
+    include = re.search(r'( *)<script src="js/wNumb.js"></script>\n', html)
+    if include:
+        return html[:include.end()] + include.group(1) + tag + html[include.end():]
+    return html.replace('</head>', tag + '</head>', 1)
+
+
+def include_stylesheet(html, href):
+    """Add a <link rel="stylesheet"> for `href` after the nouislider one (or
+    before </head>) unless the page already has it."""
+    if f'href="{href}"' in html:
+        return html
+    tag = f'<link rel="stylesheet" href="{href}">\n'
+    include = re.search(r'( *)<link rel="stylesheet" href="css/nouislider.min.css">\n', html)
+    if include:
+        return html[:include.end()] + include.group(1) + tag + html[include.end():]
+    return html.replace('</head>', tag + '</head>', 1)
+
+
+def use_map_layers(html):
+    """Create the page's point layers with MapLayers.pointLayer, which draws
+    them as SVG, canvas or clusters as set in map_layers.json (see
+    map_layers.py); layers not listed there stay plain L.geoJson layers."""
+    html, count = re.subn(r'new L\.geoJson\((json_\w+), \{',
+                          lambda m: f"MapLayers.pointLayer('{layer_name(m.group(1))}', {m.group(1)}, {{", html)
+    if not count and 'MapLayers.pointLayer(' not in html:
+        return html
+    # Inserted after the same anchor, so added in reverse order
+    for src in ('data/map_layers.js', 'js/map_layers.js', 'js/leaflet.markercluster.js'):
+        html = include_script(html, src)
+    for href in ('css/MarkerCluster.Default.css', 'css/MarkerCluster.css'):
+        html = include_stylesheet(html, href)
+    return html
+
+
+def use_filter_engine(html):
+    """Replace the page's splice-based filterFunc with the engine version.
+
+    Whatever the old function did with the filtered `features` after
+    rebuilding the layer (summary card updates) is kept and runs in the
+    update callback. Re-running on a converted page regenerates the same code.
+    """
+    match = FILTER_FUNC.search(html)
+    if not match:
+        return html
+    if match.group('body') is not None:
+        indent = match.group('indent')
+        lines = match.group('body').split('\n')
+        start = next(i for i, line in enumerate(lines) if 'LayerFilter.update(' in line) + 1
+        end = lines.index(indent + '            });', start)
+        tail = [line for line in lines[start:end] if line.strip() != 'var features = result.features();']
+    else:
+        # The old function rebuilt the layer and went on with `features`;
+        # its statements after addData move into the update callback
+        indent = match.group('legacy')
+        lines = match.group('legacy_body').split('\n')
+        start = next(i for i, line in enumerate(lines)
+                     if 'addData(features);' in line or 'LayerFilter.apply(' in line) + 1
+        # Drop the closing lines of the `if` and of map.eachLayer
+        tail = [('    ' + line) if line.strip() else line for line in lines[start:-2]]
+        while tail and not tail[0].strip():
+            tail.pop(0)
+    if any(re.search(r'\bfeatures\b', line) for line in tail):
+        tail.insert(0, indent + '                var features = result.features();')
+    code = ENGINE_FILTER_FUNC.format(i=indent, tail=''.join(line + '\n' for line in tail))
+    html = html[:match.start()] + code + html[match.end():]
+    return include_script(include_script(html, 'js/column_data.js'), 'js/filter_engine.js')
+
+
 # Read filter info
 with open('filter_info.json', 'r', encoding='utf-8') as f:
     filters = json.load(f)
@@ -9,104 +130,25 @@ with open('filter_info.json', 'r', encoding='utf-8') as f:
 with open('index.html', 'r', encoding='utf-8') as f:
     html_content = f.read()
 
-# Generate filter HTML/JS code
-filter_code = []
+# Filter spec rendered by js/filter_panel.js: the page carries the data
+# (ranges, select values) and one shared renderer instead of generated code
+# per filter and per select option
+filter_spec = []
 
 for filter_name, filter_info in filters.items():
     # Create safe variable name (remove special characters)
     safe_name = re.sub(r'[^a-zA-Z0-9_]', '', filter_name.replace(' ', '').replace('|', ''))
 
-    filter_code.append(f'            document.getElementById("menu").appendChild(')
-    filter_code.append(f'                document.createElement("div"));')
-
     if filter_info['type'] == 'int':
-        # Create slider for integer fields
-        filter_code.append(f'            var div_{safe_name} = document.createElement("div");')
-        filter_code.append(f'            div_{safe_name}.id = "div_{safe_name}";')
-        filter_code.append(f'            div_{safe_name}.className = "slider";')
-        filter_code.append(f'            document.getElementById("menu").appendChild(div_{safe_name});')
-
-        filter_code.append(f'            var lab_{safe_name} = document.createElement(\'div\');')
-        filter_code.append(f'            lab_{safe_name}.innerHTML  = \'{filter_name}: <span id="val_{safe_name}"></span>\';')
-        filter_code.append(f'            lab_{safe_name}.className = \'filterlabel\';')
-        filter_code.append(f'            document.getElementById("menu").appendChild(lab_{safe_name});')
-
-        filter_code.append(f'            var reset_{safe_name} = document.createElement(\'div\');')
-        filter_code.append(f'            reset_{safe_name}.innerHTML = \'clear filter\';')
-        filter_code.append(f'            reset_{safe_name}.className = \'filterlabel\';')
-        filter_code.append(f'            lab_{safe_name}.className = \'filterlabel\';')
-        filter_code.append(f'            reset_{safe_name}.onclick = function() {{')
-        filter_code.append(f'                sel_{safe_name}.noUiSlider.reset();')
-        filter_code.append(f'            }};')
-        filter_code.append(f'            document.getElementById("menu").appendChild(reset_{safe_name});')
-
-        filter_code.append(f'            var sel_{safe_name} = document.getElementById(\'div_{safe_name}\');')
-        filter_code.append(f'            noUiSlider.create(sel_{safe_name}, {{')
-        filter_code.append(f'                start: [{filter_info["min"]}, {filter_info["max"]}],')
-        filter_code.append(f'                connect: true,')
-        filter_code.append(f'                step: 1,')
-        filter_code.append(f'                range: {{')
-        filter_code.append(f'                    \'min\': {filter_info["min"]},')
-        filter_code.append(f'                    \'max\': {filter_info["max"]}')
-        filter_code.append(f'                }}')
-        filter_code.append(f'            }});')
-
-        filter_code.append(f'            sel_{safe_name}.noUiSlider.on(\'update\', function (values) {{')
-        filter_code.append(f'            filterVals =[];')
-        filter_code.append(f'            for (value in values){{')
-        filter_code.append(f'            filterVals.push(parseInt(value))')
-        filter_code.append(f'            }}')
-        filter_code.append(f'            val_{safe_name} = document.getElementById(\'val_{safe_name}\');')
-        filter_code.append(f'            val_{safe_name}.innerHTML = values.join(\' - \');')
-        filter_code.append(f'                filterFunc()')
-        filter_code.append(f'            }});')
-
+        filter_spec.append({'name': filter_name, 'id': safe_name, 'type': 'int',
+                            'min': filter_info['min'], 'max': filter_info['max']})
     elif filter_info['type'] == 'str':
-        # Create dropdown for string fields
-        filter_code.append(f'            var div_{safe_name} = document.createElement(\'div\');')
-        filter_code.append(f'            div_{safe_name}.id = "div_{safe_name}";')
-        filter_code.append(f'            div_{safe_name}.className= "filterselect";')
-        filter_code.append(f'            document.getElementById("menu").appendChild(div_{safe_name});')
-
-        filter_code.append(f'            sel_{safe_name} = document.createElement(\'select\');')
-        filter_code.append(f'            sel_{safe_name}.multiple = true;')
-
-        # Set size based on number of options
-        select_size = min(len(filter_info['unique_values']), 10)
-        filter_code.append(f'            sel_{safe_name}.size = {select_size};')
-
-        filter_code.append(f'            sel_{safe_name}.id = "sel_{safe_name}";')
-        filter_code.append(f'            var {safe_name}_options_str = "<option value=\'\' unselected></option>";')
-        filter_code.append(f'            sel_{safe_name}.onchange = function(){{filterFunc()}};')
-
-        # Add options
-        for value in filter_info['unique_values']:
-            # Escape quotes in value
-            escaped_value = value.replace('"', '&quot;').replace("'", "\\'")
-            filter_code.append(f'            {safe_name}_options_str  += \'<option value="{escaped_value}">{escaped_value}</option>\';')
-
-        filter_code.append(f'            sel_{safe_name}.innerHTML = {safe_name}_options_str;')
-        filter_code.append(f'            div_{safe_name}.appendChild(sel_{safe_name});')
-
-        filter_code.append(f'            var lab_{safe_name} = document.createElement(\'div\');')
-        filter_code.append(f'            lab_{safe_name}.innerHTML = \'{filter_name}\';')
-        filter_code.append(f'            lab_{safe_name}.className = \'filterlabel\';')
-        filter_code.append(f'            div_{safe_name}.appendChild(lab_{safe_name});')
-
-        filter_code.append(f'            var reset_{safe_name} = document.createElement(\'div\');')
-        filter_code.append(f'            reset_{safe_name}.innerHTML = \'clear filter\';')
-        filter_code.append(f'            reset_{safe_name}.className = \'filterlabel\';')
-        filter_code.append(f'            reset_{safe_name}.onclick = function() {{')
-        filter_code.append(f'                var options = document.getElementById("sel_{safe_name}").options;')
-        filter_code.append(f'                for (var i=0; i < options.length; i++) {{')
-        filter_code.append(f'                    options[i].selected = false;')
-        filter_code.append(f'                }}')
-        filter_code.append(f'                filterFunc();')
-        filter_code.append(f'            }};')
-        filter_code.append(f'            div_{safe_name}.appendChild(reset_{safe_name});')
-
-# Join all filter code
-filter_code_str = '\n'.join(filter_code)
+        filter_spec.append({'name': filter_name, 'id': safe_name, 'type': 'str',
+                            'values': filter_info['unique_values']})
+
+spec_json = json.dumps(filter_spec, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+filter_code_str = (f'            var FilterSpec = {spec_json};\n'
+                   f'            FilterPanel.render(document.getElementById("menu"), FilterSpec, filterFunc);')
 
 # Find where to insert the filter code (before </script> at the end)
 # Look for the last occurrence of </script> before </body>
@@ -124,7 +166,7 @@ if match:
 
     # Write back
     with open('index_with_filters.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(include_script(use_map_layers(use_filter_engine(html_content)), 'js/filter_panel.js'))
 
     print("Filter code generated successfully!")
     print(f"Total filters added: {len(filters)}")
@@ -134,3 +176,17 @@ if match:
     print("\nNew file created: index_with_filters.html")
 else:
     print("ERROR: Could not find insertion point in HTML")
+
+# Switch the map pages' own filterFunc to the indexed engine and their
+# point layers to the configured render modes
+for page in FILTER_PAGES:
+    with open(page, 'r', encoding='utf-8', newline='') as f:
+        page_html = f.read()
+    # Keep each page's line endings (index2.html uses CRLF)
+    newline = '\r\n' if '\r\n' in page_html else '\n'
+    page_html = page_html.replace('\r\n', '\n')
+    updated = use_map_layers(use_filter_engine(page_html))
+    if updated != page_html:
+        with open(page, 'w', encoding='utf-8', newline=newline) as f:
+            f.write(updated)
+        print(f"Indexed filter engine and map layers: {page}")
@@ -0,0 +1,58 @@
+"""
+Tiling stage: cut the published point layers into static vector tiles.
+
+Run after the data scripts (and before publish.py). Each layer is read from
+its data/*.js file and written to tiles/<layer>/ by vector_tiles.py, with
+[0, 0] placeholder points placed by facility name from the location file
+and data/phc_locations.csv (the location layer has no coordinates of its
+own). The map pages show the tiles instead of the markers when
+USE_VECTOR_TILES is set (see js/vector_tiles.js). Tiles are fetched over
+HTTP, so those pages must be served rather than opened from file://.
+"""
+import os
+
+import js_data
+from packed_geojson import unpack_features
+from phc_locations import TABLE_FILE, coords_by_name, load_phc_locations, read_locations
+from vector_tiles import write_tiles
+
+LOCATIONS_FILE = 'data/location_point_unified_corrected.csv'
+
+# (data file, layer name, numeric properties summed into clustered points)
+TILE_LAYERS = [
+    ('data/vaccination_data.js', 'vaccination_data',
+     ['Total Children', 'On Schedule', 'Defaulter', 'Zero Dose']),
+    ('data/vaccination_individual_data.js', 'vaccination_individual_data',
+     ['TotalChildren', 'OnSchedule', 'Defaulter', 'ZeroDose']),
+    ('data/location_point_unified_corrected_1.js', 'location_point_unified_corrected_1',
+     ['all_child']),
+]
+
+
+def with_coordinates(geojson, coords):
+    """Copy of `geojson` whose [0, 0] points get the coordinates of their
+    Health Facility (as fix_coordinates.py does); vector_tiles.py drops
+    the rest."""
+    features = []
+    for feature in geojson['features']:
+        geometry = feature.get('geometry') or {}
+        name = feature['properties'].get('Health Facility')
+        if geometry.get('type') == 'Point' and geometry['coordinates'][:2] == [0, 0] and name in coords:
+            feature = dict(feature, geometry={'type': 'Point', 'coordinates': coords[name]})
+        features.append(feature)
+    return dict(geojson, features=features)
+
+
+def build_tiles(layers=TILE_LAYERS):
+    # The location layer's own file has [0, 0] for every point
+    coords = coords_by_name(load_phc_locations(os.path.join('data', TABLE_FILE)), read_locations(LOCATIONS_FILE))
+    for path, name, sums in layers:
+        if not os.path.exists(path):
+            print(f"Skipping missing data file: {path}")
+            continue
+        geojson = with_coordinates(unpack_features(js_data.load(path)), coords)
+        write_tiles(geojson, name, sums=sums)
+
+
+if __name__ == '__main__':
+    build_tiles()
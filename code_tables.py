@@ -0,0 +1,116 @@
+"""
+Reference code tables for decoding individual vaccination records.
+
+Dose ids are read from data/vaccine_doses_tb.xlsx and mapped to the short
+vaccine names used as output properties; CHILD_VACCINATION_STATUS and
+CHILDREN_AGE_TYPE use fixed codes; age groups are binned from the date of
+birth against a reference date. Every table is a dense NumPy array indexed
+by code that holds the position of the label, so a whole column is decoded
+with one fancy-indexing operation into a pandas Categorical that the
+aggregation scripts can group on directly.
+"""
+import numpy as np
+import pandas as pd
+
+from excel_cache import read_excel
+
+DOSES_FILE = 'data/vaccine_doses_tb.xlsx'
+
+# Dose names whose short name is not just the name without spaces
+DOSE_SHORT_NAMES = {
+    'Hepatitis B0': 'HepB',
+    'Penta (DPT, Hib, Hep.B) 1': 'Penta1',
+    'Penta (DPT, Hib, Hep.B) 2': 'Penta2',
+    'Penta (DPT, Hib, Hep.B) 3': 'Penta3',
+    'DPT': 'DTP',
+    'DPT 1': 'DTP',
+}
+
+# Ordered by progress, so the highest status of a child is its max()
+STATUS_CODES = {1: 'ZeroDose', 2: 'Defaulter', 3: 'OnSchedule', 4: 'Completed'}
+AGE_TYPE_CODES = {1: 'Age 0-12', 2: 'Age 12-24', 3: 'Age 24+'}
+
+# Age in days at which each group ends (inclusive); the last group is open
+AGE_GROUP_EDGES = (365, 730)
+AGE_GROUPS = ['0-12', '12-24', '24+']
+
+
+def short_name(dose_name):
+    return DOSE_SHORT_NAMES.get(dose_name, dose_name.replace(' ', ''))
+
+
+class CodeTable:
+    def __init__(self, codes, ordered=False):
+        """codes: {integer code: label}; several codes may share a label."""
+        self.categories = list(dict.fromkeys(codes.values()))
+        self.ordered = ordered
+        position = {label: i for i, label in enumerate(self.categories)}
+        self.lookup = np.full(max(codes) + 1, -1, dtype=np.int32)
+        for code, label in codes.items():
+            self.lookup[code] = position[label]
+
+    def __len__(self):
+        return len(self.categories)
+
+    def positions(self, values):
+        """Category position per value; -1 for missing or unknown codes."""
+        ids = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        known = (ids >= 0) & (ids < len(self.lookup)) & (ids == np.floor(ids))
+        result = np.full(len(ids), -1, dtype=np.int32)
+        result[known] = self.lookup[ids[known].astype(np.intp)]
+        return result
+
+    def decode(self, values, default=None):
+        """Decode a column of codes into a Categorical (a Series for a Series).
+
+        Missing and unknown codes become NaN, or `default` if given.
+        """
+        positions = self.positions(values)
+        categories = self.categories
+        if default is not None:
+            if default not in categories:
+                categories = categories + [default]
+            positions[positions < 0] = categories.index(default)
+        decoded = pd.Categorical.from_codes(positions, categories, ordered=self.ordered)
+        if isinstance(values, pd.Series):
+            return pd.Series(decoded, index=values.index, name=values.name)
+        return decoded
+
+
+def age_groups(dob, as_of, edges=AGE_GROUP_EDGES, labels=AGE_GROUPS, missing='Unknown'):
+    """Bin dates of birth into age groups by age in whole days on `as_of`.
+
+    `labels` holds one more entry than `edges`; a missing date of birth gets
+    the `missing` category. Returns a Categorical (a Series for a Series).
+    """
+    births = pd.to_datetime(pd.Series(dob)).to_numpy(dtype='datetime64[ns]')
+    unknown = np.isnat(births)
+    days = np.zeros(len(births), dtype=np.int64)
+    days[~unknown] = (np.datetime64(pd.Timestamp(as_of), 'ns') - births[~unknown]) // np.timedelta64(1, 'D')
+    positions = np.searchsorted(np.asarray(edges), days, side='left').astype(np.int32)
+    positions[unknown] = len(labels)
+    binned = pd.Categorical.from_codes(positions, list(labels) + [missing])
+    if isinstance(dob, pd.Series):
+        return pd.Series(binned, index=dob.index, name=dob.name)
+    return binned
+
+
+STATUS = CodeTable(STATUS_CODES, ordered=True)
+# Completed children (code 4) counted as on schedule, as rebuild_data.py
+# always did, so its three status columns add up to TotalChildren
+STATUS_ON_SCHEDULE = CodeTable({**STATUS_CODES, 4: 'OnSchedule'}, ordered=True)
+AGE_TYPE = CodeTable(AGE_TYPE_CODES)
+
+_dose_tables = {}
+
+
+def dose_table(path=DOSES_FILE):
+    """CodeTable of dose id -> short vaccine name, loaded once per workbook."""
+    if path not in _dose_tables:
+        doses = read_excel(path).sort_values('VACCINE_DOSES_ID')
+        _dose_tables[path] = CodeTable({
+            int(dose_id): short_name(str(name).strip())
+            for dose_id, name in zip(doses['VACCINE_DOSES_ID'], doses['VACCINE_DOSES_NAME'])
+            if pd.notna(dose_id) and pd.notna(name)
+        })
+    return _dose_tables[path]
@@ -0,0 +1,148 @@
+"""
+Binary column files of the map data for js/column_data.js.
+
+Next to a data file such as data/vaccination_data.js a generator writes
+data/vaccination_data.columns.bin holding each property of the features as
+one typed array, so the pages can filter and sum over contiguous numbers
+instead of reading p['Total Children'] || 0 from every feature object:
+
+    8 bytes   magic 'GZCOL1\\0\\0'
+    4 bytes   header length (uint32, little-endian)
+    header    JSON, padded with spaces to a multiple of 8 bytes
+    buffers   one per column, each starting at an 8-byte aligned offset
+
+The header is {"count": n, "columns": [{"name", "type", "offset",
+"length"}], "dictionaries": {name: [value, ...]}}, offsets counted from the
+start of the buffers. Column types:
+
+    int32    whole-number properties; a missing value is stored as 0
+    float32  other numeric properties; missing values are NaN
+    string   int32 codes into dictionaries[name]; -1 when missing
+    float64  the "x" / "y" point coordinates (NaN for other geometries)
+
+Properties mixing numbers and text, and dict/list values, are left out.
+Rows are in feature order; the page checks the facility names against its
+features before using a file (js/column_data.js, ColumnData.matches).
+"""
+import json
+import os
+import struct
+import sys
+from array import array
+
+from publish_profiles import resolve
+
+MAGIC = b'GZCOL1\0\0'
+INT32_MIN, INT32_MAX = -2 ** 31, 2 ** 31 - 1
+NAN = float('nan')
+
+
+def column_path(js_path):
+    """data/<name>.columns.bin for data/<name>.js"""
+    return os.path.splitext(js_path)[0] + '.columns.bin'
+
+
+def _encode_column(values):
+    """(type, array, dictionary) of one property column, None to skip it."""
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    if all(isinstance(value, str) for value in present):
+        dictionary = list(dict.fromkeys(present))
+        code = {value: i for i, value in enumerate(dictionary)}
+        return 'string', array('i', (-1 if value is None else code[value] for value in values)), dictionary
+    if not all(isinstance(value, (int, float)) for value in present):
+        return None
+    if all(isinstance(value, int) and INT32_MIN <= value <= INT32_MAX for value in present):
+        return 'int32', array('i', (value or 0 for value in values)), None
+    return 'float32', array('f', (NAN if value is None else value for value in values)), None
+
+
+def encode_columns(geojson):
+    """Bytes of the column file of a FeatureCollection."""
+    features = geojson['features']
+    names = list(dict.fromkeys(key for feature in features for key in feature['properties']))
+
+    columns = []
+    dictionaries = {}
+    for name in names:
+        encoded = _encode_column([feature['properties'].get(name) for feature in features])
+        if encoded is None:
+            continue
+        kind, values, dictionary = encoded
+        columns.append((name, kind, values))
+        if dictionary is not None:
+            dictionaries[name] = dictionary
+
+    for axis in (0, 1):
+        coordinates = array('d', (
+            feature['geometry']['coordinates'][axis]
+            if (feature.get('geometry') or {}).get('type') == 'Point' else NAN
+            for feature in features))
+        columns.append(('xy'[axis], 'float64', coordinates))
+
+    entries = []
+    buffers = []
+    offset = 0
+    for name, kind, values in columns:
+        if sys.byteorder == 'big':
+            values.byteswap()
+        data = values.tobytes()
+        entries.append({'name': name, 'type': kind, 'offset': offset, 'length': len(values)})
+        padding = -len(data) % 8
+        buffers.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    header = json.dumps({'count': len(features), 'columns': entries, 'dictionaries': dictionaries},
+                        ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 4 + len(header)) % 8)
+    return MAGIC + struct.pack('<I', len(header)) + header + b''.join(buffers)
+
+
+def decode_columns(data):
+    """{'count': n, 'columns': {name: list}, 'x': [...], 'y': [...]} with
+    the string columns decoded (the Python side of js/column_data.js)."""
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not a column file')
+    header_length, = struct.unpack_from('<I', data, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(data[start:start + header_length])
+    start += header_length
+
+    typecodes = {'int32': 'i', 'float32': 'f', 'string': 'i', 'float64': 'd'}
+    result = {'count': header['count'], 'columns': {}}
+    for entry in header['columns']:
+        values = array(typecodes[entry['type']])
+        values.frombytes(data[start + entry['offset']:start + entry['offset'] + entry['length'] * values.itemsize])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        values = values.tolist()
+        if entry['type'] == 'string':
+            dictionary = header['dictionaries'][entry['name']]
+            values = [None if code < 0 else dictionary[code] for code in values]
+        if entry['type'] == 'float64':
+            result[entry['name']] = values
+        else:
+            result['columns'][entry['name']] = values
+    return result
+
+
+def read_columns(path):
+    with open(path, 'rb') as f:
+        return decode_columns(f.read())
+
+
+def write_columns(js_path, geojson, profile=None):
+    """Write the column file of the data file `js_path`; return its path.
+
+    `profile`: None applies the publish profile of `js_path` (as the data
+    file writers do, so rows and properties match the page's data), False
+    none.
+    """
+    profile = resolve(profile, js_path)
+    if profile is not None:
+        geojson = profile.apply_all(geojson)
+    path = column_path(js_path)
+    with open(path, 'wb') as f:
+        f.write(encode_columns(geojson))
+    return path
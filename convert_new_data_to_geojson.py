@@ -1,15 +1,13 @@
-import openpyxl
 import json
 
+from property_stats import PropertyStats, filter_info_path
+from sheet_reader import iter_columns, read_headers
+
 # Load the Excel file
 excel_file = "170120261350.xlsx"
-workbook = openpyxl.load_workbook(excel_file)
-sheet = workbook.active
 
 # Get column headers
-headers = []
-for cell in sheet[1]:
-    headers.append(cell.value)
+headers = read_headers(excel_file)
 
 # Create GeoJSON structure
 geojson = {
@@ -24,16 +22,12 @@ geojson = {
     "features": []
 }
 
-# Find x and y column indices
-x_col_idx = headers.index("x") + 1 if "x" in headers else None
-y_col_idx = headers.index("y") + 1 if "y" in headers else None
-
-if not x_col_idx or not y_col_idx:
+# Check x and y columns exist
+if "x" not in headers or "y" not in headers:
     print("Error: x or y columns not found!")
     exit(1)
 
-# Get indices for all required fields
-field_indices = {}
+# Keep the required fields present in this export
 required_fields = [
     "Vaccination status of a Child | On Schedule",
     "Vaccination status of a Child | Defaulter",
@@ -47,18 +41,31 @@ required_fields = [
     "all_child"
 ]
 
-for field in required_fields:
-    if field in headers:
-        field_indices[field] = headers.index(field) + 1
+fields = [field for field in required_fields if field in headers]
+
+# Filters of index_with_filters.html (add_filters_to_html.py reads their
+# ranges and options from filter_info.json)
+FILTERS = {
+    "Vaccination status of a Child | On Schedule": {"type": "int"},
+    "Vaccination status of a Child | Defaulter": {"type": "int"},
+    "Vaccination status of a Child | Zero Dose": {"type": "int"},
+    "Total Children Vaccinated by Age | above 24": {"type": "int"},
+    "Total Children Vaccinated by Age | 0 to 12": {"type": "int"},
+    "Total Children Vaccinated by Age | 12 to 24": {"type": "int"},
+    "Governorate": {"type": "str"},
+    "Health Facility": {"type": "str"},
+    "Suppervisor Name": {"type": "str"},
+    "all_child": {"type": "int"}
+}
 
 # Process each row
 processed_count = 0
 skipped_count = 0
+stats = PropertyStats()
 
-for row_idx in range(2, sheet.max_row + 1):
+for row in iter_columns(excel_file, ["x", "y"] + fields):
     # Get coordinates
-    x = sheet.cell(row=row_idx, column=x_col_idx).value
-    y = sheet.cell(row=row_idx, column=y_col_idx).value
+    x, y = row[0], row[1]
 
     # Skip if coordinates are missing
     if x is None or y is None:
@@ -67,8 +74,7 @@ for row_idx in range(2, sheet.max_row + 1):
 
     # Create feature properties
     properties = {}
-    for field, col_idx in field_indices.items():
-        value = sheet.cell(row=row_idx, column=col_idx).value
+    for field, value in zip(fields, row[2:]):
         properties[field] = value if value is not None else ""
 
     # Create feature
@@ -81,6 +87,7 @@ for row_idx in range(2, sheet.max_row + 1):
         }
     }
 
+    stats.add(properties)
     geojson["features"].append(feature)
     processed_count += 1
 
@@ -91,6 +98,10 @@ with open(output_file, 'w', encoding='utf-8') as f:
     json.dump(geojson, f, ensure_ascii=False)
     f.write(";")
 
+# Slider ranges and select options, from the same pass over the rows
+stats.write(filter_info_path(output_file))
+stats.write('filter_info.json', FILTERS)
+
 print("=" * 80)
 print("CONVERSION COMPLETE!")
 print("=" * 80)
@@ -98,6 +109,7 @@ print(f"Total rows processed: {processed_count}")
 print(f"Total rows skipped (no coordinates): {skipped_count}")
 print(f"Output file: {output_file}")
 print(f"Total features in GeoJSON: {len(geojson['features'])}")
+print("Filter info: filter_info.json")
 print("\nGovernorate values in data:")
 gov_values = set()
 for feature in geojson['features']:
@@ -1,13 +1,18 @@
 import pandas as pd
-import json
+
+from excel_cache import read_excel
+from geojson_writer import write_geojson_js
+from geopackage import write_layer
+from property_stats import PropertyStats, filter_info_path
 
 # Read the new summary file
-df = pd.read_excel('data/summery.xlsx')
+df = read_excel('data/summery.xlsx')
 
 print(f'Total records: {len(df)}')
 
 # Convert to GeoJSON format for the map
 features = []
+stats = PropertyStats()
 for idx, row in df.iterrows():
     # Get coordinates from location file if available
     lat = row.get('y', 0) if row.get('y', 0) != 0 else 31.4 + (idx * 0.001)
@@ -57,6 +62,7 @@ for idx, row in df.iterrows():
             "coordinates": [lon, lat]
         }
     }
+    stats.add(feature['properties'])
     features.append(feature)
 
 geojson = {
@@ -65,13 +71,16 @@ geojson = {
 }
 
 # Save as JS file
-with open('data/summery_data.js', 'w', encoding='utf-8') as f:
-    f.write('var summeryData = ')
-    json.dump(geojson, f, ensure_ascii=False)
-    f.write(';')
+write_geojson_js('data/summery_data.js', 'summeryData', geojson)
 
 print('Saved to: data/summery_data.js')
 
+# Slider ranges and select options for the filter panel
+stats.write(filter_info_path('data/summery_data.js'))
+
+# Same layer in the GeoPackage for QGIS (R-tree indexed, see geopackage.py)
+write_layer(geojson, 'summery_data')
+
 # Calculate totals for statistics
 totals = {
     'all_child': df['all_child'].sum(),
@@ -2,17 +2,20 @@ import pandas as pd
 import folium
 from folium.plugins import MarkerCluster
 
+from excel_cache import read_excel
+from person_index import load_person_index
+
 # Read location data with real coordinates
 locations = pd.read_csv('data/location_point_unified_corrected.csv')
 
 # Read vaccination data for statistics
-vaccinations = pd.read_excel('data/person_vaccine_tb.xlsx')
+vaccinations = read_excel('data/person_vaccine_tb.xlsx')
 
 # Read PHC center names
-phc = pd.read_excel('data/phc_center_updated.xlsx')
+phc = read_excel('data/phc_center_updated.xlsx')
 
-# Read person data for DOB
-person = pd.read_excel('data/person.xlsx')
+# Sorted person index for DOB
+persons = load_person_index('data/person.xlsx')
 
 # Calculate statistics
 num_centers = len(locations)
@@ -21,7 +24,7 @@ num_vaccinations = len(vaccinations)
 
 # Calculate BCG by age
 bcg = vaccinations[vaccinations['VACCINE_DOSES_ID'] == 1]
-bcg_with_dob = bcg.merge(person[['PERSON_ID', 'DOB']], on='PERSON_ID', how='left')
+bcg_with_dob = bcg.assign(DOB=persons.get('DOB', bcg['PERSON_ID']))
 bcg_with_dob['VACCINATION_DATE'] = pd.to_datetime(bcg_with_dob['VACCINATION_DATE'])
 bcg_with_dob['DOB'] = pd.to_datetime(bcg_with_dob['DOB'])
 bcg_with_dob['age_days'] = (bcg_with_dob['VACCINATION_DATE'] - bcg_with_dob['DOB']).dt.days
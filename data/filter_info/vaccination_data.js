@@ -0,0 +1,3 @@
+// Slider ranges of the vaccination_data layer, written by property_stats.py
+var FilterRanges = window.FilterRanges || {};
+FilterRanges["vaccination_data"] = {"Report Count":[2,20],"Total Children":[6,1262],"Age 0-12":[0,1165],"Age 12-24":[1,109],"Age 24+":[0,37],"Zero Dose":[0,26],"Defaulter":[1,198],"On Schedule":[0,1125],"Hep":[0,315],"BCG":[0,311],"IPV1":[0,153],"IPV2":[0,257],"Penta1":[0,257],"Penta2":[0,192],"Penta3":[0,156],"bOPV1":[0,257],"bOPV2":[0,194],"bOPV3":[0,158],"bOPV4":[1,87],"bOPV5":[0,13],"Rota1":[0,262],"Rota2":[0,201],"Rota3":[0,253],"PCV1":[0,257],"PCV2":[0,194],"PCV3":[0,147],"MMR1":[0,148],"MMR2":[1,92],"DTP":[0,78],"DT":[0,34],"Td":[0,9]};
@@ -0,0 +1,3 @@
+// Slider ranges of the vaccination_individual_data layer, written by property_stats.py
+var FilterRanges = window.FilterRanges || {};
+FilterRanges["vaccination_individual_data"] = {"TotalChildren":[1,1235],"TotalVaccinations":[2,3783],"Age 0-12":[0,1135],"Age 12-24":[0,92],"Age 24+":[0,26],"OnSchedule":[0,1112],"Defaulter":[0,124],"ZeroDose":[0,12],"BCG":[0,309],"HepB":[0,309],"IPV1":[0,135],"IPV2":[0,255],"bOPV1":[0,256],"bOPV2":[0,189],"bOPV3":[0,160],"bOPV4":[0,88],"bOPV5":[0,20],"Rota1":[0,258],"Rota2":[0,198],"Rota3":[0,223],"Penta1":[0,256],"Penta2":[0,190],"Penta3":[0,158],"PCV1":[0,256],"PCV2":[0,190],"PCV3":[0,145],"MMR1":[0,145],"MMR2":[0,89],"DTP":[0,84]};
@@ -0,0 +1,33 @@
+var MAP_LAYERS = {
+ "vaccination_data": {
+  "render": "canvas"
+ },
+ "vaccination_individual_data": {
+  "render": "cluster",
+  "cluster_radius": 40,
+  "site_precision": 5,
+  "sites": {
+   "34.45056,31.51361": 2,
+   "34.38942,31.44841": 2,
+   "34.45131,31.50667": 2,
+   "34.31094,31.34650": 2,
+   "34.29491,31.36210": 2,
+   "34.43806,31.52306": 5,
+   "34.33298,31.40677": 2,
+   "34.25422,31.35172": 2,
+   "34.24275,31.34222": 3,
+   "34.38598,31.43968": 2,
+   "34.38955,31.44844": 2,
+   "34.25022,31.34144": 3,
+   "34.27038,31.36120": 2,
+   "34.30670,31.39486": 2,
+   "34.38969,31.46023": 2,
+   "34.34627,31.43299": 2,
+   "34.35433,31.43646": 2,
+   "34.35988,31.41991": 2,
+   "34.48444,31.52750": 2,
+   "34.46639,31.54056": 2,
+   "34.48361,31.55139": 2
+  }
+ }
+};
\ No newline at end of file
@@ -0,0 +1 @@
+DataPatches.manifest("vaccination_data", {"version":1,"patches":[],"sha1":"c00bf299bcc64d66be3a6d17818a2952200aff9d"});
\ No newline at end of file
@@ -0,0 +1 @@
+DataShards.add("json_vaccination_individual_data", "gaza", {"type":"PackedFeatureCollection","count":26,"properties":["Health Facility","Health Facility AR","Governorate","Organization","TotalChildren","TotalVaccinations","Age 0-12","Age 12-24","Age 24+","OnSchedule","Defaulter","ZeroDose","BCG","HepB","IPV1","IPV2","bOPV1","bOPV2","bOPV3","bOPV4","bOPV5","Rota1","Rota2","Rota3","Penta1","Penta2","Penta3","PCV1","PCV2","PCV3","MMR1","MMR2","DTP"],"columns":[["Al-Kuwaiti Hospital - Palestinian Red Crescent Society","Masqat Al Sabra PHC","Sheikh Ajlin Point, Shamlakh Mosque","Asma Medical Point-Asma Prep Girls A, B","Arkan Health Center","Al-Daraj Martyrs Center","Al Shati PHC","Al Sahaba MP- PRCS","Blood Bank Clinic","Al Shaeikh Radwan PHC","Salah Eddin MP -Salah Eddin Prep Boys A, B","MSF Belgium Clinic - next to Al-Shifa Hospital","Heroic Hearts Al-Yasmin Primary Care","MSF Clinic Spain-Al-Zaytoun","MDM Clinic - France - North Beach","Al QUDS Hospital - PRCS","Al-Jazairi Health Center","RIMAL","Al-Sabra Medical Point - Palestinian Red Crescent Society","Al-Falah Health Center","Medical Point for the Holy Family School","Al Salam H C","Al Moustafa PHC","Al-Zaytoun Clinic - Palestinian Red Crescent Society","Al-Kuwaiti Hospital - Palestinian Red Crescent Society","Masqat Al Sabra PHC"],["الهلال الأحمر - السرايا","عيادة مسقط - الصبرة","نقطة الشيخ عجلين مسجد شملخ","نقطة طبية مدرسة أسماء الابتدائية","مركز صحي اربكان","مركز شهداء الدرج","مركز شهداء الشاطئ","الصحابة,نقطة طبية الصحابة - جمعية الهلال الاحمر  الفلسطيني","عيادة بنك الدم","مركز شهداء الشيخ رضوان","ذكور صلاح الدين الإعدادية أ ، ب","عيادة MSF بلجيكا-بجوار م.الشفاء","Heroic Hearts الياسمين للرعاية الأولية","عيادة MSF اسبانيا-الزيتون","عيادة MDM -F فرنسا-الشاطئ الشمالي","مستشفى القدس","مركز الجزائري الصحي","عيادة الرمال UN","نقطة طبية الصبرة - جمعية الهلال الاحمر  الفلسطيني","مركز الفلاح الصحي","نقطة طبية لمؤسسة جذورمدرسة العائلة المقدسة","مركز السلام","عيادة المصطفى للرعاية الأولية","عيادة الزيتون - جمعية الهلال الاحمر  الفلسطيني","الهلال الأحمر-غزة","مركز صبحه الحرازين الطبي"],[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[0,1,1,2,1,1,1,0,1,1,2,3,4,5,6,0,1,2,0,1,7,1,8,0,0,1],[63,534,19,695,136,1235,147,258,165,425,344,135,23,35,108,53,65,106,43,32,42,314,33,61,1,1],[179,1649,58,1851,400,3783,458,733,496,1228,986,424,64,105,305,104,185,321,143,80,135,1025,83,173,4,2],[45,495,15,633,114,1135,121,225,140,390,289,121,17,15,89,49,59,89,26,22,35,279,22,38,0,1],[10,32,0,56,20,92,19,21,18,30,41,10,3,7,14,2,4,13,11,7,2,31,5,14,1,0],[8,7,4,6,2,8,7,12,7,5,14,4,3,13,5,2,2,4,6,3,5,4,6,9,0,0],[41,501,14,623,92,1112,142,186,142,396,271,123,9,11,91,45,52,77,22,14,30,273,21,40,0,1],[22,30,5,68,44,121,5,71,23,29,73,10,14,24,17,8,13,29,21,17,12,41,11,21,1,0],[0,3,0,4,0,2,0,1,0,0,0,2,0,0,0,0,0,0,0,1,0,0,1,0,0,0],[7,139,6,173,28,309,14,24,20,113,54,11,1,0,21,37,0,12,1,1,0,53,3,3,0,1],[7,139,6,173,28,309,14,24,21,118,51,11,1,0,21,36,0,12,1,2,0,61,4,4,0,1],[8,7,2,101,11,17,13,22,30,69,40,22,1,0,14,2,8,9,1,3,4,44,5,3,0,0],[4,110,3,101,21,255,29,37,29,74,67,37,3,2,21,2,10,17,4,2,6,85,5,7,0,0],[4,109,4,102,21,256,30,37,34,76,66,37,3,2,20,3,10,18,3,2,6,83,5,6,0,0],[8,66,3,89,20,189,23,49,21,63,46,17,2,7,10,2,11,19,10,1,7,38,2,11,0,0],[10,84,0,66,20,160,24,38,24,40,33,22,3,4,10,4,8,14,6,7,13,42,4,8,1,0],[14,36,3,47,16,88,20,27,15,27,37,13,8,13,15,0,5,17,13,7,5,33,5,11,1,0],[3,5,0,6,0,0,1,5,1,3,2,1,1,0,3,0,0,0,0,0,1,3,0,2,0,0],[4,112,4,107,20,258,31,48,36,75,68,37,3,2,20,3,11,18,3,3,6,87,8,7,0,0],[12,70,5,99,22,198,25,56,22,67,50,17,3,7,12,2,13,20,9,5,7,38,2,20,0,0],[12,100,1,105,22,223,32,55,30,59,56,24,5,6,15,2,11,21,11,7,14,48,4,11,0,0],[4,110,3,101,20,256,30,38,33,72,66,37,3,2,20,4,10,18,4,2,6,84,6,7,0,0],[7,67,3,90,20,190,24,48,21,64,46,18,2,7,10,2,12,18,9,1,7,35,3,12,0,0],[11,85,0,65,20,158,21,37,22,43,32,22,3,4,9,1,7,15,8,7,13,42,2,6,0,0],[4,109,3,102,20,256,30,38,34,71,66,38,3,2,20,3,11,18,3,2,6,84,6,7,0,0],[8,67,3,90,21,190,25,47,21,67,48,15,2,7,10,0,12,19,8,1,7,38,1,14,0,0],[11,85,1,69,19,145,17,26,23,36,41,10,2,7,13,0,17,10,12,7,9,29,3,8,0,0],[11,84,1,72,19,145,19,28,24,34,41,11,2,7,13,1,17,10,10,7,9,29,4,7,0,0],[16,35,3,51,16,89,18,28,16,27,40,13,7,13,15,0,5,17,13,6,4,34,6,11,1,0],[14,30,4,40,16,84,18,21,18,27,28,11,6,13,12,0,6,12,14,7,5,35,5,8,1,0]],"dictionaries":{"Governorate":["Gaza"],"Organization":["PCRS","MOH","UNRWA","MSF Belgium","Heroic Hearts","MSF Spain","MDM","JUZOUR","HHO"]},"x":[34.450556,34.45130953,34.4175,34.44843,34.438056,34.4592005,34.4532194,34.46041,34.438056,34.4700466,34.45579367,34.441111,34.438056,34.443056,34.453056,34.43041685,34.473611,34.44350555,34.44997,34.428889,34.438056,34.4471449,34.438056,34.45904,34.450556,34.45130953],"y":[31.513611,31.5066731,31.500278,31.528658,31.523056,31.5127219,31.5394234,31.51616,31.523056,31.5328893,31.52117148,31.523056,31.523056,31.496944,31.539167,31.50593493,31.510556,31.51551951,31.50897,31.509444,31.523056,31.5087703,31.523056,31.49924,31.513611,31.5066731]});
\ No newline at end of file
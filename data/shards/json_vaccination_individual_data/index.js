@@ -0,0 +1 @@
+DataShards.addIndex("json_vaccination_individual_data", {"shards":[{"key":"khan_younis","governorate":"Khan Younis","file":"khan_younis.js","count":35,"bbox":[34.2562,31.342833,34.33316,31.394863],"names":["Almajada MP","PHC- MSF Belgium Mawasi Khan Younis","ALKHAIR HOSPITAL","AWDA Health Center - Asdaa","Al-Tahrir Building","Giving Without Borders Medical Clinic","Husam","Khanyounis Martyrs Primary Healthcare Center","Hunin MP","Japanese HC - UNRWA","MSF Spain’s Al Attar PHCC","QARRARA MP","Shefaa Alkwaity","Bir 19 MP - UNRWA","PAL MED  Shalet","Kh/Younis Prep. Boys \"A\"","El-Najar MP","ALNAHR ALBARED","Mawasi HC - UNRWA","Hamad HC - UNRWA","PRCS Mawasi Alqarara","AHED MP","Mawasi-Khan Younis Primary Health Care Center/ MdM-F","Emergency NGO - PHC Clinic Al Qarara - Khan Yunis","Al-Amal Hospital","Khanyounis Primary Healthcare Center/MdMF","Mobile Vehicle1","Zourub HC - UNRWA","AWDA Medical Point -Al-Aqsa University Area","Al-Quds Center is private","PRCS Mawasi","Mobile team - from the Japanese UN","Teb Alosra"]},{"key":"gaza","governorate":"Gaza","file":"gaza.js","count":26,"bbox":[34.4175,31.496944,34.473611,31.5394234],"names":["Al-Kuwaiti Hospital - Palestinian Red Crescent Society","Masqat Al Sabra PHC","Sheikh Ajlin Point, Shamlakh Mosque","Asma Medical Point-Asma Prep Girls A, B","Arkan Health Center","Al-Daraj Martyrs Center","Al Shati PHC","Al Sahaba MP- PRCS","Blood Bank Clinic","Al Shaeikh Radwan PHC","Salah Eddin MP -Salah Eddin Prep Boys A, B","MSF Belgium Clinic - next to Al-Shifa Hospital","Heroic Hearts Al-Yasmin Primary Care","MSF Clinic Spain-Al-Zaytoun","MDM Clinic - France - North Beach","Al QUDS Hospital - PRCS","Al-Jazairi Health Center","RIMAL","Al-Sabra Medical Point - Palestinian Red Crescent Society","Al-Falah Health Center","Medical Point for the Holy Family School","Al Salam H C","Al Moustafa PHC","Al-Zaytoun Clinic - Palestinian Red Crescent Society"]},{"key":"middle_zone","governorate":"Middle zone","file":"middle_zone.js","count":49,"bbox":[34.31935736,31.401134,34.4056066,31.46023466],"names":["Deir El Balah Health Center","Al Awda Hospital - Nuseirat","Al-Maghazi Clinic - PRCS","Solidarity Polyclinic (MAP)","shuhadaa Deir al-Balah Clinic","Bureij Center Al-Jaded - Shuhada Albureij","Al-Zawaydeh Center","IMC Field Hospital - Al-Zawaida","Al-Baraka Medical Center","Fathi Arafat PHC - PRCS","Nuseirat Clinic - PRCS","Sea Center - Doctors of the World France","Nuseirat Martyrs Center","Nusairat Health Center","Alquds PHC","Al zawidah Medical Point - PRCS","Maghazi Center","Al-Sawarah Clinic - PRCS","Al-Sawarha (Al-Khawaldeh) Center","Medical Relief Association","Al-Hakr El jamea","West Nusairat Health Center","IMC field hospital - Middle Area","CRS","El Mofte Medical Point","Maghazi Medical Point","Al musadar Center","UK MED -Khan Younis","Al-Tawbah MP","Mobile car1","Mobile Vehicle1","Al-Athar","Al-Awda Deir al-Balah","Al Sawarha Medical Point","Al-Hasaina Medical Point","Hidar Abed El shafi MP","Mobile Team - 1 - Deir al-Balah","UK MED FIXED PHC","bureij","Al Aqsa Hospital","Hope project","west nusirat","CARE PHCC -Deir Al-Balah","Palestinian Medical Center","Burij PRCS","Yafa Hospital"]},{"key":"rafah","governorate":"Rafah","file":"rafah.js","count":12,"bbox":[34.241429,31.337389,34.269278,31.351722],"names":["CFTA Mawasi Medical Point","ICRC Fiel Hospital","Emargancy Rafah","Muawia HC - UNRWA","heroic haert bier 19","Red Cross field hospital in Rafah","AL EQLEMI","Mawasi MSF-Spain-Fish Fresh","Mobile Vehicle2"]},{"key":"north_gaza","governorate":"North Gaza","file":"north_gaza.js","count":17,"bbox":[34.466389,31.521389,34.500556,31.551389],"names":["Juzoor Halima Al-Saadia","Juzoor of Anwar Aziz","Al Awda Medical Center","Al Forsan Medical Center","Tal Al Rabie School (MSF) point","Insan Medical Center","Alasaftawi H C - UNRWA","Jabalia Medical Clinic","MSF Belgium Medical point","Juzoor of Civil defense","Al-Mustafa Medical Point","Haid Abdel Shafi Medical Center","Red Crescent Medical Point -Alamin Aleamu","Juzoor of Al-Atatreh","Fakhoura"]}],"summary":{"TotalChildren":15678,"OnSchedule":12742,"Defaulter":2878,"ZeroDose":58,"Age012":13319,"Age1224":1699,"Age24plus":660,"vaccines":{"bOPV2":2175,"PCV2":2158,"Rota2":2430,"bOPV4":1887,"Rota3":2700,"Penta2":2169,"bOPV3":1973,"Penta3":1950,"Penta1":2567,"bOPV1":2552,"Rota1":2767,"PCV1":2568,"PCV3":2006,"IPV2":2577,"IPV1":1902,"HepB":2596,"MMR2":1888,"MMR1":2024,"DTP":1586,"BCG":2595,"Other":139,"bOPV5":185}}});
\ No newline at end of file
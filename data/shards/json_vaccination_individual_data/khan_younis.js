@@ -0,0 +1 @@
+DataShards.add("json_vaccination_individual_data", "khan_younis", {"type":"PackedFeatureCollection","count":35,"properties":["Health Facility","Health Facility AR","Governorate","Organization","TotalChildren","TotalVaccinations","Age 0-12","Age 12-24","Age 24+","OnSchedule","Defaulter","ZeroDose","BCG","HepB","IPV1","IPV2","bOPV1","bOPV2","bOPV3","bOPV4","bOPV5","Rota1","Rota2","Rota3","Penta1","Penta2","Penta3","PCV1","PCV2","PCV3","MMR1","MMR2","DTP"],"columns":[["Almajada MP","PHC- MSF Belgium Mawasi Khan Younis","ALKHAIR HOSPITAL","AWDA Health Center - Asdaa","Al-Tahrir Building","Giving Without Borders Medical Clinic","Husam","Khanyounis Martyrs Primary Healthcare Center","Hunin MP","Japanese HC - UNRWA","MSF Spain’s Al Attar PHCC","QARRARA MP","Shefaa Alkwaity","Bir 19 MP - UNRWA","PAL MED  Shalet","Kh/Younis Prep. Boys \"A\"","El-Najar MP","ALNAHR ALBARED","Mawasi HC - UNRWA","Hamad HC - UNRWA","PRCS Mawasi Alqarara","AHED MP","Mawasi-Khan Younis Primary Health Care Center/ MdM-F","Emergency NGO - PHC Clinic Al Qarara - Khan Yunis","Al-Amal Hospital","Khanyounis Primary Healthcare Center/MdMF","Mobile Vehicle1","Zourub HC - UNRWA","AWDA Medical Point -Al-Aqsa University Area","Al-Quds Center is private","PRCS Mawasi","Mobile team - from the Japanese UN","Hamad HC - UNRWA","Teb Alosra","Mawasi HC - UNRWA"],["نقطة المجايدة","بلجيكا MSF مواصي خانيونس","مستشفى الخير","مركز العودة-أصداء","م ناصر مبنى التحرير","عيادة عطاء بلا حدود","هيوسم","مركز شهداء خانيونس","نقطة حنين الطبية","مركز صحي اليابانية - وكالة الغوث","أطباء العالم اسبانيا - العطار","نقطة القرارة الطبية","شفاء فلسطين - الكويتي","نقطة بئر 19 الطبية - وكالة الغوث","بال ميد الشاليهات","مدرسة الحوارني -خانيونس","نقطة النجار - كرزة","نقطة النهر البارد","مركز  صحي المواصي - وكالة الغوث","عيادة حمد","الهلال المواصي القرارة بجوار الاسطبل","نقطة عائد الطبية","أطباء العالم- مواصي خانيونس","طوارئ NGO'S خانيونس","مستشفى الامل - الهلال","MDM  عيادة","سيارة متحركة1","مركز صحي زعرب - وكالة الغوث","مركز العودة- جامعة الأقصى","مركز القدس خاص","الهلال المواصي خانيونس بجوار النص","فريق متحرك - من اليابانية UN","مركز صحي حمد - وكالة الغوث","طب الاسرة","مركز  صحي المواصي - وكالة الغوث"],[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[0,1,0,2,0,0,3,0,4,4,5,0,6,4,7,4,0,0,4,4,8,9,10,11,8,10,0,4,2,0,8,4,4,12,4],[59,219,146,76,287,368,71,41,230,781,220,12,133,62,84,59,27,27,485,99,109,83,47,101,175,144,29,168,32,13,127,64,180,13,10],[183,630,371,227,701,1067,175,126,618,2078,633,24,346,175,242,144,82,69,1294,280,338,233,134,285,523,390,83,427,99,33,350,215,525,24,30],[52,212,119,63,224,343,43,36,203,694,172,10,122,38,74,40,22,14,422,79,94,71,42,94,138,130,20,158,20,8,113,55,140,9,8],[5,6,21,11,37,21,19,3,25,77,31,2,6,17,8,12,4,9,56,9,12,9,5,5,33,10,5,10,6,2,9,8,18,4,1],[2,1,6,2,26,4,9,2,2,10,17,0,5,7,2,7,1,4,7,11,3,3,0,2,4,4,4,0,6,3,5,1,22,0,1],[46,205,116,59,215,353,36,31,193,670,170,10,92,43,70,32,23,21,420,75,92,66,45,96,144,114,17,157,19,10,121,55,134,6,9],[13,12,30,17,71,15,35,10,32,110,50,2,41,19,14,27,4,6,65,23,17,16,2,5,31,30,11,11,13,3,6,9,46,7,1],[0,2,0,0,1,0,0,0,5,1,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,1,0,0,0,0,0,0,0,0],[0,40,9,7,133,58,0,0,39,123,12,1,16,1,15,16,3,0,72,12,2,1,21,19,19,0,3,47,0,0,18,1,8,0,1],[0,40,9,7,133,58,0,0,39,122,13,1,16,1,16,16,3,0,72,12,2,0,21,19,19,1,3,47,0,0,18,1,8,0,1],[6,37,16,4,17,49,5,3,35,127,27,3,8,4,9,2,1,0,78,13,12,9,1,11,13,32,2,19,1,0,9,6,22,3,2],[13,34,20,10,21,68,4,5,32,112,33,0,15,7,19,3,6,1,72,13,17,7,6,17,32,25,4,20,5,0,17,15,33,0,1],[13,34,21,10,18,68,4,5,31,112,33,0,15,7,18,3,6,0,72,15,17,8,6,17,30,24,4,20,5,0,18,15,32,0,1],[13,42,16,16,16,61,4,16,36,104,27,1,18,6,5,4,4,2,48,14,29,15,7,13,21,18,2,19,4,1,19,14,28,1,3],[9,37,10,11,21,51,10,4,27,80,33,1,23,8,12,5,3,2,46,10,18,19,4,14,25,25,4,20,7,2,18,11,24,0,1],[6,7,21,10,45,15,17,4,20,81,44,2,11,20,9,14,3,12,60,17,12,8,5,6,35,10,7,9,7,4,11,6,23,3,2],[0,0,0,0,5,2,5,0,0,0,0,0,2,5,0,7,0,2,5,9,0,1,0,3,0,0,1,0,4,0,0,1,20,0,0],[13,33,27,10,23,71,7,5,33,118,35,1,16,8,18,6,5,1,98,16,17,8,6,17,32,27,3,20,5,0,22,17,33,1,1],[15,43,23,17,22,71,10,16,41,113,35,1,25,7,5,4,5,2,49,16,31,15,7,13,23,20,2,21,6,1,20,14,31,3,3],[14,45,22,15,31,61,12,11,34,139,45,2,46,9,16,10,4,3,79,14,22,24,5,16,33,33,8,33,7,3,25,13,32,2,1],[13,34,19,10,19,68,4,5,31,112,33,0,15,8,18,3,5,0,72,15,17,8,6,17,31,25,5,20,5,0,18,16,33,0,1],[12,40,17,16,15,62,5,16,36,103,27,1,18,6,5,4,4,2,46,14,29,16,7,13,22,17,2,19,4,1,20,14,28,1,3],[9,37,10,11,22,52,10,4,26,80,33,1,22,8,13,5,3,2,48,10,17,18,4,14,24,25,4,20,7,2,19,11,24,0,1],[11,34,20,10,20,68,5,5,31,113,33,0,15,8,18,4,5,0,73,15,17,8,6,17,32,25,4,20,5,0,18,16,33,0,1],[11,40,16,16,14,62,4,16,35,103,27,1,18,4,4,4,4,1,46,13,29,14,7,12,21,17,2,18,4,1,20,14,27,1,3],[6,21,23,13,19,46,18,1,25,87,26,2,14,12,12,7,6,9,72,14,15,17,3,19,21,22,4,19,4,5,18,9,27,1,0],[6,22,22,13,19,45,18,2,26,88,26,2,14,12,12,9,6,9,72,14,15,19,3,19,21,22,5,21,5,5,18,9,27,2,0],[6,5,24,11,47,16,19,4,20,79,45,2,11,19,9,10,3,11,59,16,11,9,5,6,34,11,7,7,9,4,12,7,23,3,2],[6,3,12,6,28,14,11,4,21,76,41,2,5,14,9,8,2,9,55,8,9,5,4,3,34,4,7,8,4,4,12,5,8,3,1]],"dictionaries":{"Governorate":["Khan Younis"],"Organization":["MoH","MSF BELGIUM","AWDA","HUSAM","UNRWA","MSF SPAIN","SHEFAA ALKWAITY","PAL MED","PRCS","AHED","MDM","Emergency NGO","TEB ALOSRA"]},"x":[34.2949977,34.293417,34.281083,34.3000466,34.292639,34.2689665,34.2920634,34.310944,34.302078,34.2949142,34.2795,34.33316,34.275113,34.2604517,34.312583,34.29195263,34.261119,34.2885,34.270385,34.306698,34.292088,34.3001036,34.263361,34.307611,34.298306,34.295278,34.310944,34.2562,34.2815927,34.263731,34.2740413,34.2949142,34.306698,34.300083,34.270385],"y":[31.3517295,31.385778,31.354556,31.3637325,31.346778,31.3522494,31.3817736,31.3465,31.392643,31.3620985,31.347417,31.380468,31.366636,31.343415,31.3945,31.34859067,31.35761,31.343694,31.361199,31.394863,31.385153,31.342833,31.358556,31.394194,31.352056,31.346694,31.3465,31.352339,31.3658118,31.348744,31.3682852,31.3620985,31.394863,31.3935,31.361199]});
\ No newline at end of file
@@ -0,0 +1 @@
+DataShards.add("json_vaccination_individual_data", "middle_zone", {"type":"PackedFeatureCollection","count":49,"properties":["Health Facility","Health Facility AR","Governorate","Organization","TotalChildren","TotalVaccinations","Age 0-12","Age 12-24","Age 24+","OnSchedule","Defaulter","ZeroDose","BCG","HepB","IPV1","IPV2","bOPV1","bOPV2","bOPV3","bOPV4","bOPV5","Rota1","Rota2","Rota3","Penta1","Penta2","Penta3","PCV1","PCV2","PCV3","MMR1","MMR2","DTP"],"columns":[["Deir El Balah Health Center","Al Awda Hospital - Nuseirat","Al-Maghazi Clinic - PRCS","Solidarity Polyclinic (MAP)","shuhadaa Deir al-Balah Clinic","Bureij Center Al-Jaded - Shuhada Albureij","Al-Zawaydeh Center","IMC Field Hospital - Al-Zawaida","Al-Baraka Medical Center","Fathi Arafat PHC - PRCS","Nuseirat Clinic - PRCS","Sea Center - Doctors of the World France","Nuseirat Martyrs Center","Nusairat Health Center","Alquds PHC","Al zawidah Medical Point - PRCS","Maghazi Center","Al-Sawarah Clinic - PRCS","Al-Baraka Medical Center","Al Awda Hospital - Nuseirat","Al-Sawarha (Al-Khawaldeh) Center","Medical Relief Association","Nusairat Health Center","Al-Hakr El jamea","West Nusairat Health Center","IMC field hospital - Middle Area","CRS","El Mofte Medical Point","Maghazi Medical Point","Al musadar Center","UK MED -Khan Younis","Al-Tawbah MP","Mobile car1","Mobile Vehicle1","Al-Athar","Al-Awda Deir al-Balah","Al Sawarha Medical Point","Al-Hasaina Medical Point","Hidar Abed El shafi MP","Mobile Team - 1 - Deir al-Balah","UK MED FIXED PHC","bureij","Al Aqsa Hospital","Hope project","west nusirat","CARE PHCC -Deir Al-Balah","Palestinian Medical Center","Burij PRCS","Yafa Hospital"],["عيادة دير البلح المركزية","جمعية العودة الستة شهداء","الهلال الأحمر المغازي","MAP","عيادة دير البلح","مركز صحي البريج","عيادة الزوايدة","IMC الزوايدة","مركز البركة الطبي","فتحي عرفات الهلال الأحمر","الهلال النصيرات","مركز البحر - أطباء العالم فرنسا","شهداء النصيرات","عيادة النصيرات المركزية","القدس الطبية","الهلال الزوايدة","عيادة المغازي","الهلال السوارحة","مركز جورة اللوت الصحي","العودة","الخوالدة","جمعية الإغاثة الطبية","عيادة النصيرات المركزية","حكر الجامع","عيادة النصيرات الغربية","IMC دير البلح","اتحاد الكنائس","نقطة مدرسة المفتي الطبية","نقطة المغازي الطبية","المصدر","المستشفى الميداني خانيونس - UK MED","التوبة","سيارة متحركة 1","سيارة متحركة1","الآثار","العودة دير البلح","نقطة السوارحة الطبية","نقطة الحساينة الطبية","حيدر عبد الشافي غرب الكلية التقنية ، منزل إياد المقيد","الفريق المتنقل -1 - دير البلح","UK Med","عيادة البريجUN","الأقصى","Hope project","النصيرات الغربية UN","نقطة كير الطبية","المركز الطبي الفلسطيني","نقطة البريج الهلال الاحمر","مستشفى يافا"],[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[0,1,2,3,4,4,4,5,6,2,2,7,4,0,8,2,4,2,6,1,7,9,0,4,0,5,10,0,0,4,11,12,4,4,12,1,0,0,13,5,11,0,4,12,0,14,15,2,16],[400,23,43,119,325,159,191,112,54,495,16,52,119,50,30,7,55,22,320,23,32,21,702,110,24,64,19,17,179,9,113,9,20,27,17,43,31,11,16,6,30,50,36,8,64,32,5,13,5],[1245,52,128,359,880,473,1024,385,145,1338,38,158,340,140,79,18,185,68,888,60,77,46,2073,312,70,175,67,42,476,24,303,25,57,75,45,128,84,27,84,20,97,130,110,23,178,60,15,40,20],[381,21,22,101,284,117,150,96,36,463,12,40,94,44,9,1,38,18,276,18,30,17,597,81,22,38,9,9,162,6,96,6,11,14,14,29,28,4,7,3,22,38,15,4,53,24,4,9,4],[17,2,8,15,38,27,28,9,12,21,4,11,16,5,6,2,10,4,36,4,1,4,82,20,2,11,5,3,14,2,15,1,4,9,3,7,2,5,7,1,2,9,11,4,8,3,1,0,0],[2,0,13,3,3,15,13,7,6,11,0,1,9,1,15,4,7,0,8,1,1,0,23,9,0,15,5,5,3,1,2,2,5,4,0,7,1,2,2,2,6,3,10,0,3,5,0,4,1],[383,16,23,100,297,117,143,90,22,465,4,37,98,38,3,1,44,16,280,15,26,9,576,74,19,23,5,6,160,4,94,4,7,17,8,27,22,2,7,2,22,34,11,6,51,6,2,2,4],[13,7,20,19,28,42,48,22,30,30,12,15,21,12,27,6,10,6,40,8,6,12,124,36,5,41,14,11,19,5,19,5,13,10,9,16,9,9,9,4,8,16,25,2,13,26,3,11,1],[4,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,1,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[179,0,0,0,48,2,75,11,2,118,0,0,0,0,0,0,1,0,51,0,0,0,47,3,0,9,2,0,44,0,23,0,0,0,0,0,0,0,4,0,10,15,0,0,15,2,0,1,0],[181,0,0,1,48,2,75,10,2,118,0,0,0,0,0,0,1,0,52,0,0,0,45,1,0,6,2,0,44,0,23,0,0,0,0,0,0,0,4,0,9,14,0,0,14,0,0,1,0],[80,6,5,11,50,16,62,6,6,115,0,2,14,8,0,1,4,0,43,4,6,2,135,16,3,4,3,1,24,1,14,0,1,1,0,2,6,0,6,0,5,5,1,1,8,4,0,1,0],[85,2,1,21,48,27,64,38,4,71,1,10,20,8,1,0,8,3,49,1,3,0,125,19,6,6,3,2,23,1,16,1,1,3,2,6,5,1,4,2,4,3,3,1,12,1,0,1,2],[63,2,2,20,48,27,62,38,3,72,1,9,19,8,1,0,9,3,47,2,3,1,123,15,5,8,3,2,23,1,16,1,1,3,2,7,5,1,4,2,4,4,3,1,12,1,0,1,2],[62,3,5,18,47,28,51,17,4,86,2,7,14,6,0,0,12,5,55,4,3,1,88,14,5,3,3,0,27,0,12,0,2,2,1,6,4,0,2,0,5,6,5,0,7,1,2,3,1],[36,5,7,28,27,13,36,16,11,58,3,11,25,8,1,0,5,5,31,3,6,2,115,15,3,6,1,1,20,1,11,1,2,1,3,7,3,0,5,0,4,1,0,1,3,3,1,2,1],[18,1,19,13,36,35,33,13,14,24,3,6,21,6,19,5,15,3,31,2,2,3,80,25,2,22,6,7,12,2,15,2,7,11,3,10,2,5,6,3,4,10,20,4,9,5,1,3,1],[0,0,10,0,0,3,1,1,0,0,1,0,2,0,14,1,1,0,2,0,1,0,2,1,0,3,0,0,1,1,0,0,0,4,0,0,0,0,0,0,1,0,9,0,0,0,0,3,0],[68,2,2,20,50,29,65,38,5,72,4,11,19,12,4,0,7,3,47,4,3,3,165,20,6,8,3,2,22,3,16,2,3,4,2,7,7,2,3,2,4,6,3,1,12,6,0,1,2],[69,3,5,22,49,32,54,20,7,82,4,7,14,8,0,0,12,6,56,4,7,2,103,19,5,4,5,0,29,0,12,1,2,2,4,6,4,1,2,0,5,7,6,0,9,3,2,3,1],[39,6,8,30,36,20,39,22,11,60,4,15,35,12,3,0,7,7,38,4,8,4,149,18,5,14,1,3,25,2,19,1,3,1,4,8,4,0,5,1,7,3,3,1,5,11,2,3,1],[66,2,2,19,48,28,64,38,3,71,1,9,20,8,1,0,8,3,44,2,3,1,124,16,5,8,3,2,22,1,16,1,2,3,3,7,6,1,4,2,4,5,3,1,12,1,0,1,2],[60,3,5,18,47,30,50,17,4,86,2,7,14,6,0,0,11,5,54,4,4,1,85,13,5,3,3,0,27,0,12,0,2,2,1,5,4,0,2,0,5,7,5,0,8,1,2,3,1],[38,4,8,29,25,13,37,15,10,57,3,12,25,9,1,0,4,5,30,3,6,2,113,13,4,6,1,1,20,1,12,1,3,1,3,6,3,0,5,0,4,1,0,1,3,3,1,2,1],[62,2,2,20,48,29,64,37,3,71,1,9,19,8,1,0,10,3,47,2,3,1,125,16,5,8,3,2,22,1,16,1,2,3,2,6,6,1,4,2,4,5,3,1,13,1,0,1,2],[61,3,6,18,47,28,51,17,3,83,2,7,13,6,0,0,12,5,53,4,4,1,86,12,5,3,3,0,27,0,12,0,2,2,1,5,4,0,2,0,5,7,4,0,8,1,2,3,1],[21,3,7,22,51,26,37,3,12,23,0,8,13,9,5,1,13,3,46,6,6,8,113,14,2,8,5,4,21,3,14,4,5,7,4,11,9,5,5,0,3,7,7,1,7,3,0,2,0],[22,3,6,21,52,26,37,2,11,23,0,10,13,10,5,1,13,3,46,6,6,8,113,15,2,8,5,4,21,3,14,4,5,7,4,10,9,4,5,0,3,6,6,1,7,3,0,2,0],[17,1,17,14,38,29,33,14,15,23,3,8,21,4,17,5,16,3,35,3,2,3,81,23,2,19,6,7,12,2,15,3,7,11,3,9,2,5,6,3,4,9,18,4,9,5,1,3,1],[17,1,11,13,37,29,33,11,15,25,3,8,19,4,6,4,16,3,31,2,1,3,54,24,0,18,6,4,8,1,10,2,4,7,3,9,1,1,6,3,3,9,11,4,5,5,1,0,1]],"dictionaries":{"Governorate":["Middle zone"],"Organization":["UNRWA","Al Awda Health and Community Association","Palestine Red Crescent Society","Medical Aid for Palestinians","MoH","IMC","Mawaddah Relief and Development Association","Médecins du Monde","Egyptian Red Crescent","Medical Relief Association","CRS","UK-MED","Project Hope (Health Opportunities for People Everywhere)","ACHA","Cooperative for Assistance and Relief Everywhere","Palestinian Medical Center","YAFFA HOSPITAL"]},"x":[34.33875402,34.38941694,34.38171,34.31935736,34.3492496,34.4003753,34.3683701,34.357917,34.332979,34.34324174,34.39155,34.320301,34.3859752,34.38955372,34.34560876,34.38064,34.3882104,34.3653,34.332979,34.38941694,34.3670997,34.351129,34.38955372,34.34246341,34.38969277,34.346268,34.383615,34.39523112,34.38518029,34.348997,34.35433,34.340928,34.3859752,34.35987552,34.329593,34.328443,34.37512137,34.37624367,34.354263,34.346268,34.35433,34.4056066,34.35987552,34.354585,34.38969277,34.3457344,34.39455043,34.4006053,34.34515173],"y":[31.42408591,31.44841093,31.42305,31.40424978,31.4168184,31.4393312,31.4290369,31.443733,31.40677,31.4227124,31.44941,31.408829,31.4396829,31.44843759,31.42930455,31.43951,31.4245531,31.44061,31.40677,31.44841093,31.4385752,31.41268,31.44843759,31.40674124,31.46023466,31.432989,31.444497,31.45333246,31.4212555,31.422241,31.43646,31.41862,31.4396829,31.41991482,31.417347,31.401134,31.4437576,31.45076453,31.425571,31.432989,31.43646,31.4388341,31.41991482,31.417508,31.46023466,31.41370518,31.44606252,31.4428774,31.41821476]});
\ No newline at end of file
@@ -0,0 +1 @@
+DataShards.add("json_vaccination_individual_data", "north_gaza", {"type":"PackedFeatureCollection","count":17,"properties":["Health Facility","Health Facility AR","Governorate","Organization","TotalChildren","TotalVaccinations","Age 0-12","Age 12-24","Age 24+","OnSchedule","Defaulter","ZeroDose","BCG","HepB","IPV1","IPV2","bOPV1","bOPV2","bOPV3","bOPV4","bOPV5","Rota1","Rota2","Rota3","Penta1","Penta2","Penta3","PCV1","PCV2","PCV3","MMR1","MMR2","DTP"],"columns":[["Juzoor Halima Al-Saadia","Juzoor of Anwar Aziz","Al Awda Medical Center","Al Forsan Medical Center","Tal Al Rabie School (MSF) point","Insan Medical Center","Alasaftawi H C - UNRWA","Jabalia Medical Clinic","MSF Belgium Medical point","Juzoor of Civil defense","Al-Mustafa Medical Point","Haid Abdel Shafi Medical Center","Red Crescent Medical Point -Alamin Aleamu","Juzoor of Al-Atatreh","Fakhoura","Red Crescent Medical Point -Alamin Aleamu","Juzoor of Al-Atatreh"],["مدرسة حليمة السعدية","نقطة جذور أنور عزيز الطبية","نقطة طبية حلاوة","جمعية بيتنا","مدرسة تل الزعتر","مركز انسان  الطبي","عيادة الصفطاوي وكالة","مركز شهداء جباليا","نقطة أطباء بلا حدود (MSF)  بلجيكا","نقطة جذور الدفاع المدني الطبية","نقطة المصطفى  الطبية","مركز حيد عبد الشافي الطبي","نقطة الهلال الأحمر الطبية -الامن العام","نقطة جذور العطاطرة الطبية","الفاخورة","الهلال الأحمر-جباليا","مركز شهداء العطاطرة والسيفا الصحي"],[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[0,0,1,2,3,2,4,2,5,2,0,6,7,0,2,7,0],[153,44,53,79,48,17,189,113,87,41,41,88,10,28,9,6,1],[430,115,167,221,133,45,527,303,274,123,104,260,28,78,29,20,5],[124,30,46,57,36,16,159,85,74,26,37,76,9,21,4,4,1],[19,9,5,16,9,1,20,23,9,12,3,9,0,3,1,2,0],[10,5,2,6,3,0,10,5,4,3,1,3,1,4,4,0,0],[90,25,31,45,30,12,148,66,62,21,24,76,9,19,0,3,1],[60,19,21,33,16,4,41,35,23,20,17,12,1,9,9,3,0],[3,0,1,1,2,1,0,12,2,0,0,0,0,0,0,0,0],[23,4,4,15,7,1,46,21,6,0,2,10,2,2,0,2,0],[23,4,4,14,7,1,47,19,6,0,2,10,2,1,0,2,0],[15,9,8,8,5,4,23,17,11,3,7,12,1,8,0,0,0],[21,5,10,9,5,2,29,9,21,7,7,15,0,6,1,1,1],[20,5,11,9,5,3,29,5,23,7,7,15,0,6,1,2,1],[14,4,10,7,6,4,26,16,13,4,4,12,2,0,2,0,0],[36,2,7,9,10,1,21,13,10,7,5,14,3,2,0,0,0],[20,10,7,20,8,1,22,25,8,10,3,12,1,4,4,2,0],[0,0,1,0,1,0,0,2,0,0,0,0,0,0,0,0,0],[22,6,13,10,5,3,30,8,25,6,6,15,0,8,1,2,1],[19,4,14,10,5,2,28,18,19,5,6,12,3,0,2,0,0],[38,3,9,9,12,1,24,21,16,5,11,19,2,2,2,0,0],[21,6,11,9,5,4,30,7,23,6,6,15,0,8,1,2,1],[13,4,8,7,5,2,26,16,14,5,5,12,3,0,2,1,0],[36,2,5,11,9,1,21,10,9,5,5,13,2,2,0,0,0],[21,6,11,9,5,3,29,7,20,6,6,15,0,8,1,2,1],[13,3,10,5,6,3,26,19,13,4,5,12,3,0,2,0,0],[18,8,6,11,6,4,12,14,10,10,6,11,1,6,1,0,0],[18,10,7,12,5,4,12,13,10,11,5,11,0,6,1,0,0],[19,10,5,21,8,1,23,23,9,12,3,12,2,4,4,2,0],[20,10,6,16,8,0,23,20,8,10,3,13,1,5,4,2,0]],"dictionaries":{"Governorate":["North Gaza"],"Organization":["Juzoor","Al Awda Health and Community Association","MoH","MSF","UNRWA","MSF Belgium","ACHA","Palestine Red Crescent Society"]},"x":[34.476944,34.496111,34.476944,34.478056,34.495,34.500556,34.47876,34.484444,34.469722,34.485,34.470556,34.494167,34.466389,34.483611,34.484444,34.466389,34.483611],"y":[31.531111,31.536944,31.521389,31.543333,31.546389,31.544444,31.53776,31.5275,31.543056,31.5375,31.535556,31.541111,31.540556,31.551389,31.5275,31.540556,31.551389]});
\ No newline at end of file
@@ -0,0 +1 @@
+DataShards.add("json_vaccination_individual_data", "rafah", {"type":"PackedFeatureCollection","count":12,"properties":["Health Facility","Health Facility AR","Governorate","Organization","TotalChildren","TotalVaccinations","Age 0-12","Age 12-24","Age 24+","OnSchedule","Defaulter","ZeroDose","BCG","HepB","IPV1","IPV2","bOPV1","bOPV2","bOPV3","bOPV4","bOPV5","Rota1","Rota2","Rota3","Penta1","Penta2","Penta3","PCV1","PCV2","PCV3","MMR1","MMR2","DTP"],"columns":[["CFTA Mawasi Medical Point","ICRC Fiel Hospital","Emargancy Rafah","CFTA Mawasi Medical Point","Muawia HC - UNRWA","heroic haert bier 19","Red Cross field hospital in Rafah","ICRC Fiel Hospital","AL EQLEMI","Mawasi MSF-Spain-Fish Fresh","Emargancy Rafah","Mobile Vehicle2"],["الثقافة والفكر الحر","مستشفى الصليب الميداني","طوارئ رفح","الثقافة والفكر الحر","مركز صحي معاوية - وكالة الغوث","هيرويك هارتس بئر 19 البسمة","مستشفى الصليب الأحمر الميداني رفح","مستشفى الصليب الميداني","الإقليمي","أطباء العالم اسبانيا - فش فرش","Emargancy Rafah","سيارة متحركة 2"],[0,0,0,0,0,0,0,0,0,0,0,0],[0,1,2,0,3,4,1,1,2,5,2,2],[18,4,31,12,39,40,139,50,14,33,10,29],[60,16,90,30,97,130,365,154,57,99,35,81],[11,3,25,8,30,28,130,40,10,28,8,20],[3,0,6,4,6,9,9,6,4,4,2,7],[4,1,0,0,3,3,0,4,0,1,0,2],[10,3,24,3,31,26,130,37,12,33,7,16],[8,1,7,9,8,14,8,13,2,0,3,13],[0,0,0,0,0,0,1,0,0,0,0,0],[0,0,0,0,10,1,37,4,1,7,0,0],[0,0,0,0,9,1,37,4,1,7,0,0],[1,0,1,0,5,8,28,8,2,3,1,1],[3,2,6,3,4,9,20,7,4,7,4,4],[3,2,6,3,4,9,20,8,4,7,4,4],[3,0,2,0,3,5,23,7,1,3,0,3],[2,1,4,0,2,2,5,6,4,1,2,3],[7,1,6,2,7,10,8,12,3,5,2,7],[1,1,0,0,2,0,0,0,0,0,0,0],[4,2,7,4,3,8,20,9,4,7,4,7],[3,0,4,2,3,6,24,7,1,4,1,4],[4,1,6,2,4,5,8,9,4,3,1,5],[4,2,6,3,3,9,20,8,4,7,4,4],[3,0,2,0,3,6,23,7,1,3,0,3],[2,1,4,0,2,2,5,6,4,1,2,3],[4,2,6,3,4,9,20,8,4,7,4,4],[3,0,2,0,3,6,23,7,1,3,0,3],[0,0,9,2,6,6,14,5,4,7,1,6],[0,0,9,2,7,7,14,7,4,7,1,6],[7,1,5,2,7,10,8,13,3,5,2,7],[6,0,1,2,6,2,8,12,3,5,2,5]],"dictionaries":{"Governorate":["Rafah"],"Organization":["CFTA","ICRC","MoH","UNRWA","HEROIC HEART","MSF SPAIN"]},"x":[34.254222,34.24275,34.250222,34.254222,34.241429,34.269278,34.24275,34.24275,34.255361,34.246861,34.250222,34.250222],"y":[31.351722,31.342222,31.341444,31.351722,31.338187,31.344611,31.342222,31.342222,31.337389,31.344222,31.341444,31.341444]});
\ No newline at end of file
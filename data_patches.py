@@ -0,0 +1,174 @@
+"""
+Daily delta patches for the published map data files.
+
+When a converter rewrites a data file (data/vaccination_data.js, ...), the
+new FeatureCollection is compared with the one it replaces. Features are
+matched by facility name and ObjectID, and the difference is written as a
+small patch next to a version manifest, in a folder named after the file:
+
+    data/patches/vaccination_data/manifest.js
+        DataPatches.manifest("vaccination_data", {"version": 7, "patches": [...]})
+    data/patches/vaccination_data/7.js
+        DataPatches.patch("vaccination_data", 7, {"added": [...], "removed": [...], "changed": {...}})
+
+Patch N turns version N-1 into version N. js/data_patches.js keeps a copy of
+the data in localStorage and brings it up to date with the patches instead
+of downloading the whole file again.
+"""
+import glob
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+
+import js_data
+from geojson_writer import write_geojson_js
+from publish_profiles import resolve
+
+PATCH_DIR = 'data/patches'
+NAME_KEYS = ('Health Facility', 'Health_Facility')
+ID_KEY = 'ObjectID'
+KEEP_PATCHES = 30
+
+
+def feature_keys(features):
+    """'<facility name>#<ObjectID>' per feature; repeats get '~2', '~3', ...
+
+    js/data_patches.js computes the same keys when applying a patch.
+    """
+    keys = []
+    seen = Counter()
+    for feature in features:
+        props = feature['properties']
+        name = next((str(props[k]) for k in NAME_KEYS if props.get(k) not in (None, '')), '')
+        object_id = props.get(ID_KEY)
+        key = name if object_id in (None, '') else f'{name}#{object_id}'
+        seen[key] += 1
+        keys.append(key if seen[key] == 1 else f'{key}~{seen[key]}')
+    return keys
+
+
+def diff_collections(old, new):
+    """Patch that turns FeatureCollection `old` into `new`."""
+    previous = dict(zip(feature_keys(old['features']), old['features']))
+    patch = {'added': [], 'removed': [], 'changed': {}}
+
+    for key, feature in zip(feature_keys(new['features']), new['features']):
+        before = previous.pop(key, None)
+        if before is None:
+            patch['added'].append(feature)
+            continue
+        props, old_props = feature['properties'], before['properties']
+        change = {}
+        updated = {k: v for k, v in props.items() if k not in old_props or old_props[k] != v}
+        if updated:
+            change['properties'] = updated
+        dropped = [k for k in old_props if k not in props]
+        if dropped:
+            change['removed_properties'] = dropped
+        if feature['geometry'] != before['geometry']:
+            change['geometry'] = feature['geometry']
+        if change:
+            patch['changed'][key] = change
+    patch['removed'] = list(previous)
+
+    # Top-level members other than the features (summary, ...)
+    meta = {k: v for k, v in new.items() if k not in ('type', 'features') and old.get(k) != v}
+    if meta:
+        patch['meta'] = meta
+    meta_removed = [k for k in old if k not in ('type', 'features') and k not in new]
+    if meta_removed:
+        patch['meta_removed'] = meta_removed
+    return patch
+
+
+def is_empty(patch):
+    return not (patch['added'] or patch['removed'] or patch['changed']
+                or patch.get('meta') or patch.get('meta_removed'))
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _write_call(path, function, *args):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'DataPatches.{function}(')
+        f.write(', '.join(json.dumps(arg, ensure_ascii=False, separators=(',', ':')) for arg in args))
+        f.write(');')
+
+
+def load_manifest(folder):
+    path = os.path.join(folder, 'manifest.json')
+    if not os.path.exists(path):
+        return {'version': 0, 'patches': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_versioned_js(path, var_name, geojson, patch_dir=PATCH_DIR, keep=KEEP_PATCHES, profile=None):
+    """Write `var <var_name> = <geojson>;` to `path` and record the change.
+
+    If the previous file is the version the manifest knows about, a patch
+    from it to `geojson` is written. Otherwise (first run, or the file was
+    rewritten by something else) the version is bumped without a patch, so
+    clients fall back to a full download. Returns the manifest.
+
+    The file and the patches hold the published form of `geojson` (see
+    publish_profiles.py; `profile` None looks it up, False writes as is).
+    """
+    profile = resolve(profile, path)
+    if profile is not None:
+        geojson = profile.apply_all(geojson)
+    key = os.path.splitext(os.path.basename(path))[0]
+    folder = os.path.join(patch_dir, key)
+    os.makedirs(folder, exist_ok=True)
+    manifest = load_manifest(folder)
+
+    previous = None
+    if os.path.exists(path) and manifest.get('sha1') == file_hash(path):
+        try:
+            previous = js_data.load(path, cache=False)
+        except ValueError:
+            previous = None
+
+    write_geojson_js(path, var_name, geojson, profile=False)
+
+    if previous is not None:
+        patch = diff_collections(previous, geojson)
+        if is_empty(patch):
+            print(f"{path}: no changes since version {manifest['version']}")
+            return manifest
+        version = manifest['version'] + 1
+        _write_call(os.path.join(folder, f'{version}.js'), 'patch', key, version, patch)
+        manifest['patches'].append({
+            'version': version,
+            'file': f'{version}.js',
+            'added': len(patch['added']),
+            'removed': len(patch['removed']),
+            'changed': len(patch['changed']),
+        })
+        print(f"{path}: version {version} (+{len(patch['added'])} -{len(patch['removed'])} ~{len(patch['changed'])})")
+    else:
+        version = manifest['version'] + 1
+        manifest['patches'] = []
+        print(f"{path}: version {version} (new base, no patch)")
+
+    manifest['version'] = version
+    manifest['patches'] = manifest['patches'][-keep:]
+    manifest['sha1'] = file_hash(path)
+
+    # Remove patches that dropped out of the manifest
+    listed = {p['file'] for p in manifest['patches']}
+    for patch_file in glob.glob(os.path.join(glob.escape(folder), '*.js')):
+        name = os.path.basename(patch_file)
+        # Hashed copies (publish.py) are left to the next publish
+        if re.fullmatch(r'\d+\.js', name) and name not in listed:
+            os.remove(patch_file)
+
+    with open(os.path.join(folder, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    _write_call(os.path.join(folder, 'manifest.js'), 'manifest', key, manifest)
+    return manifest
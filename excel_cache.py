@@ -0,0 +1,103 @@
+"""
+Columnar on-disk cache for the data/*.xlsx source tables.
+
+Each workbook sheet is parsed with pd.read_excel once and stored next to the
+workbook in a .cache/ folder (Parquet when pyarrow is installed, pickle
+otherwise). Later reads are served from the cache as long as the workbook
+size, mtime and content hash still match.
+"""
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pickle'
+
+CACHE_DIR_NAME = '.cache'
+
+
+def file_fingerprint(path, content_hash=True):
+    """Return {'size', 'mtime', 'sha1'} for a file (sha1 only if requested)."""
+    stat = os.stat(path)
+    fingerprint = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+    if content_hash:
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha1.update(chunk)
+        fingerprint['sha1'] = sha1.hexdigest()
+    return fingerprint
+
+
+def cache_path(path, suffix, **key):
+    """Path of a cache artifact for `path`, distinguished by `key` options."""
+    folder = os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR_NAME)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if key:
+        options = json.dumps(key, sort_keys=True, default=str)
+        stem += '-' + hashlib.sha1(options.encode('utf-8')).hexdigest()[:10]
+    return os.path.join(folder, stem + suffix)
+
+
+def is_fresh(path, meta_path):
+    """True if the fingerprint stored at meta_path still matches `path`.
+
+    Size and mtime are compared first; the content hash is only computed when
+    the mtime changed, so a touched-but-identical workbook stays cached.
+    """
+    if not os.path.exists(meta_path):
+        return False
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    current = file_fingerprint(path, content_hash=False)
+    if current['size'] != meta.get('size'):
+        return False
+    if current['mtime'] == meta.get('mtime'):
+        return True
+    current = file_fingerprint(path)
+    if current['sha1'] != meta.get('sha1'):
+        return False
+    # Same bytes, new mtime: remember the new mtime to skip hashing next time
+    meta['mtime'] = current['mtime']
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    return True
+
+
+def write_meta(path, meta_path, **extra):
+    meta = file_fingerprint(path)
+    meta.update(extra)
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+
+def read_excel(path, sheet_name=0, **kwargs):
+    """Drop-in replacement for pd.read_excel backed by the columnar cache."""
+    data_path = cache_path(path, '.' + CACHE_FORMAT, sheet_name=sheet_name, **kwargs)
+    meta_path = os.path.splitext(data_path)[0] + '.json'
+
+    if is_fresh(path, meta_path) and os.path.exists(data_path):
+        if CACHE_FORMAT == 'parquet':
+            return pd.read_parquet(data_path)
+        return pd.read_pickle(data_path)
+
+    df = pd.read_excel(path, sheet_name=sheet_name, **kwargs)
+
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    try:
+        if CACHE_FORMAT == 'parquet':
+            df.to_parquet(data_path, index=False)
+        else:
+            df.to_pickle(data_path)
+    except (TypeError, ValueError) as e:
+        # Mixed-type object columns cannot always be stored as Parquet;
+        # the sheet is still returned, it just won't be cached this time.
+        print(f"Warning: could not cache {path}: {e}")
+        return df
+    write_meta(path, meta_path, format=CACHE_FORMAT)
+    return df
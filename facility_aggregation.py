@@ -0,0 +1,74 @@
+"""
+Vectorized per-facility aggregation of individual vaccination records.
+
+All facility and global metrics are derived from the dose rows with
+groupby / value_counts over categorical columns, instead of iterrows loops:
+
+- children: rows reduced to one per (facility, child) and one per child
+- child counts by status and age group, per facility and globally
+- dose counts per vaccine, per facility and globally
+"""
+import pandas as pd
+
+
+def reduce_children(rows, keys, columns, how=None):
+    """One row per `keys` (e.g. facility + PERSON_ID) carrying `columns`.
+
+    `how` maps a column to a groupby reduction ('first', 'last', 'max', ...);
+    columns not listed keep their first value.
+    """
+    how = how or {}
+    if all(how.get(column, 'first') == 'first' for column in columns):
+        return rows.drop_duplicates(keys)[keys + list(columns)]
+    aggs = {column: how.get(column, 'first') for column in columns}
+    return rows.groupby(keys, sort=False, observed=True).agg(aggs).reset_index()
+
+
+def count_table(rows, by, column, categories):
+    """Wide table of category counts of `column` per `by` value, zero-filled."""
+    counts = rows.groupby([by, column], sort=False, observed=True).size().unstack(fill_value=0)
+    return counts.reindex(columns=categories, fill_value=0)
+
+
+def category_counts(series, categories=None):
+    """{category: count}; all `categories` if given, else those present."""
+    counts = series.value_counts(sort=False)
+    if categories is None:
+        return {key: int(n) for key, n in counts.items() if n}
+    return {category: int(counts.get(category, 0)) for category in categories}
+
+
+def aggregate_facilities(rows, facility, person, child_columns, dose_column,
+                         dose_categories, how=None):
+    """Aggregate dose rows into per-facility metrics and a global summary.
+
+    child_columns: {column: categories} describing each child (status, age)
+    dose_column: column naming the vaccine of each dose row
+    how: optional per-column reduction for the child columns (default 'first')
+
+    Returns (facilities, summary). `facilities` is indexed by facility in
+    order of first appearance (rows without a facility only count towards
+    the summary), with TotalChildren, TotalVaccinations, one
+    column per child category and one per dose category. `summary` holds the
+    same child counts over unique children across all facilities, plus
+    'vaccines': {vaccine: count} for every vaccine present.
+    """
+    columns = list(child_columns)
+    order = pd.Index(rows[facility].dropna().unique(), name=facility)
+
+    children = reduce_children(rows, [facility, person], columns, how)
+    parts = [
+        children.groupby(facility, sort=False).size().rename('TotalChildren'),
+        rows.groupby(facility, sort=False).size().rename('TotalVaccinations'),
+    ]
+    for column, categories in child_columns.items():
+        parts.append(count_table(children, facility, column, categories))
+    parts.append(count_table(rows, facility, dose_column, dose_categories))
+    facilities = pd.concat(parts, axis=1).reindex(order).fillna(0).astype(int)
+
+    everyone = reduce_children(rows, [person], columns, how)
+    summary = {'TotalChildren': len(everyone)}
+    for column, categories in child_columns.items():
+        summary.update(category_counts(everyone[column], categories))
+    summary['vaccines'] = category_counts(rows[dose_column])
+    return facilities, summary
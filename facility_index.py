@@ -0,0 +1,133 @@
+"""
+Inverted character n-gram index for facility name matching.
+
+Names (English or Arabic) are normalized and split into padded character
+trigrams. A lookup only visits the posting lists of the query's trigrams
+and ranks the candidates by IDF-weighted Dice similarity. Generic words
+("medical", "clinic", "مركز", "شهداء", ...) are left out of the indexed
+n-grams, so "مركز شهداء رفح" is compared with other names by "رفح" alone.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+
+# Letter variants that are spelled inconsistently across sources
+# (Arabic alef/teh marbuta/alef maksura forms, typographic apostrophes)
+NAME_FOLD = str.maketrans({'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ة': 'ه', 'ى': 'ي', '’': "'", '‘': "'"})
+# Arabic diacritics (tanween, harakat, shadda, sukun)
+DIACRITICS = re.compile('[\u064b-\u0652]')
+
+# Words shared by many facility names, as normalize_name spells them
+GENERIC_WORDS = frozenset([
+    'al', 'the', 'of', 'medical', 'clinic', 'hospital', 'center', 'centre', 'health',
+    'healthcare', 'primary', 'point', 'phc', 'phcc', 'mp', 'hc',
+    'مركز', 'شهداء', 'الشهداء', 'عياده', 'العياده', 'نقطه', 'مستشفي', 'المستشفي',
+    'طبي', 'طبيه', 'الطبي', 'الطبيه', 'صحي', 'الصحي', 'الصحيه',
+])
+
+
+def normalize_name(name):
+    if not isinstance(name, str):
+        return ''
+    name = DIACRITICS.sub('', name.strip().lower().translate(NAME_FOLD))
+    name = name.replace(' - ', ' ').replace('-', ' ')
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+def core_name(key):
+    """A normalized name without its generic words (all of it if nothing
+    else is left)."""
+    words = [word for word in key.split(' ') if word not in GENERIC_WORDS]
+    return ' '.join(words) or key
+
+
+def ngrams(name, n=3):
+    padded = f' {name} '
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class FacilityIndex:
+    def __init__(self, n=3):
+        self.n = n
+        self.postings = defaultdict(list)  # n-gram -> entry ids
+        self.names = []                    # normalized name per entry
+        self.values = []                   # payload per entry
+        self.grams = []                    # n-gram set per entry
+        self.by_name = {}                  # normalized name -> entry id
+        self._weights = None               # entry id -> summed n-gram weight
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, value):
+        key = normalize_name(name)
+        if not key or key in self.by_name:
+            return
+        entry = len(self.names)
+        grams = ngrams(core_name(key), self.n)
+        for gram in grams:
+            self.postings[gram].append(entry)
+        self.names.append(key)
+        self.values.append(value)
+        self.grams.append(grams)
+        self.by_name[key] = entry
+        self._weights = None
+
+    def weight(self, gram):
+        """Inverse document frequency of an n-gram."""
+        return math.log(1.0 + len(self.names) / (1 + len(self.postings.get(gram, ()))))
+
+    def _entry_weights(self):
+        if self._weights is None:
+            self._weights = [sum(self.weight(g) for g in grams) for grams in self.grams]
+        return self._weights
+
+    def search(self, name, limit=5, min_score=0.0):
+        """Return up to `limit` (score, name, value) tuples, best first."""
+        key = normalize_name(name)
+        if not key:
+            return []
+        grams = ngrams(core_name(key), self.n)
+        entry_weights = self._entry_weights()
+        shared = Counter()
+        query_weight = 0.0
+        for gram in grams:
+            w = self.weight(gram)
+            query_weight += w
+            for entry in self.postings.get(gram, ()):
+                shared[entry] += w
+
+        results = []
+        for entry, common in shared.items():
+            score = 2.0 * common / (query_weight + entry_weights[entry])
+            if score >= min_score:
+                results.append((score, self.names[entry], self.values[entry]))
+        results.sort(key=lambda r: r[0], reverse=True)
+        return results[:limit]
+
+    def best_match(self, name, min_score=0.8, min_contained=0.5, margin=0.2, accept=None, limit=10):
+        """Best (score, name, value) candidate, or None.
+
+        The best candidate qualifies when its score reaches `min_score` (or
+        `min_contained` when the query's core name is part of the
+        candidate's, as "الخوالدة" of "عيادة السوارحة الخوالدة") and it
+        scores at least `margin` above the best candidate with a different
+        value. `accept` (value -> bool) drops candidates first, e.g. ones
+        from another governorate. An exact normalized name always matches.
+        """
+        key = normalize_name(name)
+        if key in self.by_name:
+            entry = self.by_name[key]
+            return 1.0, key, self.values[entry]
+        candidates = [c for c in self.search(name, limit=limit) if accept is None or accept(c[2])]
+        if not candidates:
+            return None
+        score, candidate, value = candidates[0]
+        runner_up = next((c[0] for c in candidates[1:] if c[2] is not value), 0.0)
+        if score - runner_up < margin:
+            return None
+        core, candidate_core = core_name(key), core_name(candidate)
+        contained = len(core) >= 4 and core in candidate_core
+        if score >= (min_contained if contained else min_score):
+            return score, candidate, value
+        return None
@@ -1,63 +1,21 @@
-import json
-import csv
-
-# Coordinate mappings from location file
-coord_map = {
-    "AL EQLEMI": [34.255361, 31.337389],
-    "ALNAHR ALBARED": [34.2885, 31.343694],
-    "Al Shati PHC": [34.4532194, 31.5394234],
-    "Free thoughts": [34.34816435, 31.41741518],
-    "Juzoor of Civil defense": [34.485, 31.5375],
-    "Kh/Younis Prep. Boys \"A\"": [34.29195263, 31.34859067],
-    "MSF Spain's Al Attar PHCC": [34.2795, 31.347417],
-    "PRCS Mawasi Alqarara": [34.292088, 31.385153],
-    "Shefaa Alkwaity": [34.275113, 31.366636],
-    "Shumukh": [34.318611, 31.397444],
-    "Tayara Clinic": [34.354585, 31.417508],
-    "Teb Alosra": [34.300083, 31.3935],
-}
-
-# Read vaccination data
-with open('C:/Users/Administrator/gaza_vaccination/data/vaccination_data.js', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Remove var declaration and parse JSON
-json_str = content.replace('var json_vaccination_data = ', '').strip()
-if json_str.endswith(';'):
-    json_str = json_str[:-1]
-
-# Split into features (since it's on one line, we need to be careful)
-# Let's use simple string replacement instead
+import js_data
+from column_data import write_columns
+from data_patches import write_versioned_js
+from facility_index import normalize_name
+from geopackage import write_layer
+from phc_locations import coords_by_name, read_locations, resolve_phc_locations
+
+# Coordinate mappings from location file and the PHC resolution table
+DATA_DIR = 'C:/Users/Administrator/gaza_vaccination/data'
+coord_map = coords_by_name(resolve_phc_locations(data_dir=DATA_DIR),
+                           read_locations(DATA_DIR + '/location_point_unified_corrected.csv'))
 
 changes = []
 
-for facility, coords in coord_map.items():
-    # Escape special characters for the search
-    search_facility = facility.replace('"', '\\"')
-
-    # Build the search pattern - looking for the facility with [0, 0]
-    # The data format is: "Health Facility": "NAME", ... "coordinates": [0, 0]
-
-    # First check if this facility exists with [0, 0]
-    if f'"Health Facility": "{facility}"' in content or f'"Health Facility": "{search_facility}"' in content:
-        # We need to find the feature containing this facility and replace its coordinates
-        pass
-
-# Since the file is complex, let's do a simpler approach
-# Read and rebuild the entire JSON
-
-# Extract JSON
-prefix = 'var json_vaccination_data = '
-if content.startswith(prefix):
-    json_str = content[len(prefix):]
-    if json_str.endswith(';'):
-        json_str = json_str[:-1]
-else:
-    json_str = content
-
+# Read vaccination data (a private copy, the features are modified below)
 try:
-    data = json.loads(json_str)
-except:
+    data = js_data.load('C:/Users/Administrator/gaza_vaccination/data/vaccination_data.js', cache=False)
+except ValueError:
     # Try to fix common issues
     print("Error parsing JSON, trying alternate method...")
     import re
@@ -109,9 +67,9 @@ for feature in data['features']:
             changes.append(facility)
             print(f"+ Fixed: {facility} -> {coord_map[facility]}")
         else:
-            # Try case-insensitive match
+            # Try normalized match (case, spacing, apostrophes)
             for key, val in coord_map.items():
-                if key.lower() == facility.lower():
+                if normalize_name(key) == normalize_name(facility):
                     feature['geometry']['coordinates'] = val
                     changes.append(facility)
                     print(f"+ Fixed: {facility} -> {val}")
@@ -119,10 +77,15 @@ for feature in data['features']:
             else:
                 print(f"- Not found: {facility}")
 
-# Write back
-output = f'var json_vaccination_data = {json.dumps(data, ensure_ascii=False)}'
-with open('C:/Users/Administrator/gaza_vaccination/data/vaccination_data.js', 'w', encoding='utf-8') as f:
-    f.write(output)
+# Write back (plus a patch against the previous version, see data_patches.py)
+write_versioned_js('C:/Users/Administrator/gaza_vaccination/data/vaccination_data.js', 'json_vaccination_data', data,
+                   patch_dir=DATA_DIR + '/patches')
+
+# Typed-array columns of the same rows for the map pages (js/column_data.js)
+write_columns('C:/Users/Administrator/gaza_vaccination/data/vaccination_data.js', data)
+
+# Same layer in the GeoPackage for QGIS (R-tree indexed, see geopackage.py)
+write_layer(data, 'vaccination_data', path=DATA_DIR + '/vaccination_layers.gpkg')
 
 print(f"\nTotal fixed: {len(changes)} facilities")
 
@@ -1,8 +1,13 @@
 import pandas as pd
-import json
+
+from column_data import write_columns
+from data_patches import write_versioned_js
+from excel_cache import read_excel
+from geopackage import write_layer
+from property_stats import PropertyStats, filter_info_path
 
 # Read the new summary file
-df = pd.read_excel('data/summery.xlsx')
+df = read_excel('data/summery.xlsx')
 
 # Read location coordinates
 locations = pd.read_csv('data/location_point_unified_corrected.csv')
@@ -18,6 +23,7 @@ print(f'Total summary records: {len(df)}')
 # Convert to GeoJSON format with CORRECT property names
 features = []
 matched = 0
+stats = PropertyStats()
 for idx, row in df.iterrows():
     facility = str(row['Health Facility']) if pd.notna(row['Health Facility']) else ""
 
@@ -72,6 +78,7 @@ for idx, row in df.iterrows():
             "coordinates": [lon, lat]
         }
     }
+    stats.add(feature['properties'])
     features.append(feature)
 
 geojson = {
@@ -81,11 +88,18 @@ geojson = {
 
 print(f'Matched coordinates: {matched}')
 
-# Save as JS file
-with open('data/vaccination_data.js', 'w', encoding='utf-8') as f:
-    f.write('var vaccinationData = ')
-    json.dump(geojson, f, ensure_ascii=False)
-    f.write(';')
+# Save as JS file (plus a patch against the previous version, see data_patches.py)
+write_versioned_js('data/vaccination_data.js', 'vaccinationData', geojson)
+
+# Typed-array columns of the same rows for the map pages (js/column_data.js)
+write_columns('data/vaccination_data.js', geojson)
+
+# Slider ranges and select options for the filter panel
+stats.write(filter_info_path('data/vaccination_data.js'))
+stats.write_ranges(filter_info_path('data/vaccination_data.js', ext='.js'), 'vaccination_data')
+
+# Same layer in the GeoPackage for QGIS (R-tree indexed, see geopackage.py)
+write_layer(geojson, 'vaccination_data')
 
 print('Updated: data/vaccination_data.js')
 print(f"Total Children: {int(df['all_child'].sum()):,}")
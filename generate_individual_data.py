@@ -2,23 +2,38 @@
 Generate vaccination_individual_data.js from person_vaccine_tb.xlsx
 Aggregates individual vaccination records by facility with vaccine counts
 """
+import sys
+
 import pandas as pd
-import json
+
+from code_tables import AGE_TYPE, STATUS, dose_table
+from excel_cache import read_excel
+from geojson_writer import write_geojson_js
+from geopackage import write_layer
+from packed_geojson import write_packed_js
+from property_stats import PropertyStats, filter_info_path
+from shards import write_shards
+
+# Write the columnar packed format (decoded by js/packed_geojson.js) when
+# run with --packed; plain GeoJSON otherwise
+PACKED_OUTPUT = '--packed' in sys.argv
 
 # Load the data files
 print("Loading data files...")
-person_vaccine = pd.read_excel('data/202601310406.xlsx')
-vaccine_doses = pd.read_excel('data/vaccine_doses_tb.xlsx')
-phc_centers = pd.read_excel('data/phc_center_updated.xlsx')
-phc_centers_original = pd.read_excel('data/phc_center_tb.xlsx')
+person_vaccine = read_excel('data/202601310406.xlsx')
+phc_centers = read_excel('data/phc_center_updated.xlsx')
+phc_centers_original = read_excel('data/phc_center_tb.xlsx')
 locations = pd.read_csv('data/location_point_unified_corrected.csv')
 
 print(f"Total vaccination records: {len(person_vaccine)}")
 print(f"Unique children: {person_vaccine['PERSON_ID'].nunique()}")
 
-# Create vaccine name mapping
-vaccine_map = dict(zip(vaccine_doses['VACCINE_DOSES_ID'], vaccine_doses['VACCINE_DOSES_NAME']))
-print(f"\nVaccine mapping loaded: {len(vaccine_map)} vaccines")
+# Decode dose ids, status and age type once for all records
+doses = dose_table()
+print(f"\nVaccine mapping loaded: {len(doses)} vaccines")
+person_vaccine['vaccine'] = doses.decode(person_vaccine['VACCINE_DOSES_ID'], default='Other')
+person_vaccine['status'] = STATUS.decode(person_vaccine['CHILD_VACCINATION_STATUS'], default='OnSchedule')
+person_vaccine['age'] = AGE_TYPE.decode(person_vaccine['CHILDREN_AGE_TYPE'], default='Age 0-12')
 
 # Create facility name mapping - use multiple sources
 facility_map = {}
@@ -92,61 +107,16 @@ try:
 except Exception as e:
     print(f"Warning: Could not parse location tree: {e}")
 
-# Map vaccine names to standard short names for properties
-vaccine_short_names = {
-    'BCG': 'BCG',
-    'Hepatitis B0': 'HepB',
-    'IPV 1': 'IPV1',
-    'IPV 2': 'IPV2',
-    'bOPV 1': 'bOPV1',
-    'bOPV 2': 'bOPV2',
-    'bOPV 3': 'bOPV3',
-    'bOPV 4': 'bOPV4',
-    'bOPV 5': 'bOPV5',
-    'Rota 1': 'Rota1',
-    'Rota 2': 'Rota2',
-    'Rota 3': 'Rota3',
-    'Penta (DPT, Hib, Hep.B) 1': 'Penta1',
-    'Penta (DPT, Hib, Hep.B) 2': 'Penta2',
-    'Penta (DPT, Hib, Hep.B) 3': 'Penta3',
-    'PCV 1': 'PCV1',
-    'PCV 2': 'PCV2',
-    'PCV 3': 'PCV3',
-    'MMR 1': 'MMR1',
-    'MMR 2': 'MMR2',
-    'DPT': 'DTP',
-    'DPT 1': 'DTP',
-    'DT 1': 'DT1',
-    'DT 2': 'DT2',
-    'DT 3': 'DT3'
-}
-
-# Age type mapping (from CHILDREN_AGE_TYPE)
-age_type_map = {
-    1: 'Age 0-12',      # 0-12 months
-    2: 'Age 12-24',     # 12-24 months
-    3: 'Age 24+'        # 24+ months
-}
-
-# Vaccination status mapping
-status_map = {
-    1: 'ZeroDose',
-    2: 'Defaulter',
-    3: 'OnSchedule',
-    4: 'Completed'
-}
-
 # Aggregate data by facility
 print("\nAggregating data by facility...")
 facility_data = {}
 
 # First, get the last status for each child (to avoid double counting)
-child_last_status = person_vaccine.groupby('PERSON_ID')['CHILD_VACCINATION_STATUS'].last().to_dict()
-child_last_age = person_vaccine.groupby('PERSON_ID')['CHILDREN_AGE_TYPE'].last().to_dict()
+child_last_status = person_vaccine.groupby('PERSON_ID')['status'].last().to_dict()
+child_last_age = person_vaccine.groupby('PERSON_ID')['age'].last().to_dict()
 
 for _, row in person_vaccine.iterrows():
     fac_id = row['PHC_SERVICE_PROVIDER_ID']
-    vaccine_id = row['VACCINE_DOSES_ID']
     person_id = row['PERSON_ID']
 
     # Get facility name
@@ -168,12 +138,11 @@ for _, row in person_vaccine.iterrows():
     facility_data[fac_id]['total_vaccinations'] += 1
 
     # Store the child's status and age (will be overwritten but that's ok - we use last)
-    facility_data[fac_id]['children_status'][person_id] = child_last_status.get(person_id, 3)
-    facility_data[fac_id]['children_age'][person_id] = child_last_age.get(person_id, 1)
+    facility_data[fac_id]['children_status'][person_id] = child_last_status.get(person_id, 'OnSchedule')
+    facility_data[fac_id]['children_age'][person_id] = child_last_age.get(person_id, 'Age 0-12')
 
     # Count vaccines
-    vaccine_name = vaccine_map.get(vaccine_id, f"Vaccine {vaccine_id}")
-    short_name = vaccine_short_names.get(vaccine_name, vaccine_name.replace(' ', ''))
+    short_name = row['vaccine']
     if short_name not in facility_data[fac_id]['vaccines']:
         facility_data[fac_id]['vaccines'][short_name] = 0
     facility_data[fac_id]['vaccines'][short_name] += 1
@@ -185,14 +154,12 @@ for fac_id, data in facility_data.items():
 
     for person_id in data['children']:
         # Status
-        status_code = data['children_status'].get(person_id, 3)
-        status = status_map.get(status_code, 'OnSchedule')
+        status = data['children_status'].get(person_id, 'OnSchedule')
         if status in data['status']:
             data['status'][status] += 1
 
         # Age
-        age_code = data['children_age'].get(person_id, 1)
-        age_group = age_type_map.get(age_code, 'Age 0-12')
+        age_group = data['children_age'].get(person_id, 'Age 0-12')
         if age_group in data['age_groups']:
             data['age_groups'][age_group] += 1
 
@@ -201,6 +168,7 @@ print("\nCreating GeoJSON features...")
 features = []
 matched_count = 0
 unmatched_facilities = []
+stats = PropertyStats()
 
 for fac_id, data in facility_data.items():
     fac_name = data['name']
@@ -256,6 +224,7 @@ for fac_id, data in facility_data.items():
         # Add vaccine counts
         for vax_name, count in data['vaccines'].items():
             props[vax_name] = count
+        stats.add(props)
 
         feature = {
             'type': 'Feature',
@@ -280,12 +249,22 @@ geojson = {
 
 # Save to JS file
 output_path = 'data/vaccination_individual_data.js'
-with open(output_path, 'w', encoding='utf-8') as f:
-    f.write('var json_vaccination_individual_data = ')
-    json.dump(geojson, f, ensure_ascii=False, indent=2)
-    f.write(';')
+if PACKED_OUTPUT:
+    write_packed_js(output_path, 'json_vaccination_individual_data', geojson)
+else:
+    write_geojson_js(output_path, 'json_vaccination_individual_data', geojson, indent=2)
+
+# Per-governorate shards, which index_individual.html loads (js/shard_loader.js)
+write_shards(geojson, 'json_vaccination_individual_data', packed=PACKED_OUTPUT)
 
 print(f"\nSaved to {output_path}")
+
+# Slider ranges and select options for the filter panel
+stats.write(filter_info_path(output_path))
+stats.write_ranges(filter_info_path(output_path, ext='.js'), 'vaccination_individual_data')
+
+# Same layer in the GeoPackage for QGIS (R-tree indexed, see geopackage.py)
+write_layer(geojson, 'vaccination_individual_data')
 print(f"Total features: {len(features)}")
 
 # Print summary statistics
@@ -1,8 +1,9 @@
-import pandas as pd
 import json
 
+from excel_cache import read_excel
+
 # Read data
-df = pd.read_excel('C:/Users/Administrator/gaza_vaccination/data/310120250933.xlsx')
+df = read_excel('C:/Users/Administrator/gaza_vaccination/data/310120250933.xlsx')
 with open('C:/Users/Administrator/gaza_vaccination/facility_coordinates.json', 'r', encoding='utf-8') as f:
     coords = json.load(f)
 
@@ -1,23 +1,11 @@
-import json
+import js_data
 
 # Load the new vaccination data
-with open(r"C:\Users\Administrator\AppData\Local\Temp\qgis2web\qgis2web_2026_01_22-12_48_37_247602\data\vaccination_data.js", 'r', encoding='utf-8') as f:
-    content = f.read()
-    json_start = content.find('{')
-    json_str = content[json_start:-1]  # Remove trailing semicolon
-    vaccination_data = json.loads(json_str)
+vaccination_data = js_data.load(r"C:\Users\Administrator\AppData\Local\Temp\qgis2web\qgis2web_2026_01_22-12_48_37_247602\data\vaccination_data.js")
 
 # Load the old location data
 try:
-    with open(r"C:\Users\Administrator\AppData\Local\Temp\qgis2web\qgis2web_2026_01_22-12_48_37_247602\data\location_point_unified_corrected_1.js", 'r', encoding='utf-8') as f:
-        content = f.read()
-        json_start = content.find('{')
-        json_str = content[json_start:]
-        # Try to find the closing } and ;
-        last_brace = json_str.rfind('}')
-        if last_brace > 0:
-            json_str = json_str[:last_brace+1]
-        location_data = json.loads(json_str)
+    location_data = js_data.load(r"C:\Users\Administrator\AppData\Local\Temp\qgis2web\qgis2web_2026_01_22-12_48_37_247602\data\location_point_unified_corrected_1.js")
 except Exception as e:
     print(f"Warning: Could not load baseline data: {e}")
     location_data = {'features': []}
@@ -0,0 +1,117 @@
+"""
+Streaming writer for `var name = {FeatureCollection};` data files.
+
+Features are serialized one at a time as they are produced, so a generator
+of features is written with bounded memory instead of first building the
+whole `features` list. Members before the features (name, crs) go in the
+header, members after them (summary) are given when the writer is closed.
+
+The output is byte-for-byte what json.dump would give for the same dict:
+`indent=None` matches json.dump's default separators, `compact=True` drops
+the spaces, and `indent=2` matches json.dump(..., indent=2).
+
+Each feature passes through the layer's publish profile on the way out
+(property pruning, coordinate precision, see publish_profiles.py).
+"""
+import json
+
+from publish_profiles import resolve
+
+
+class FeatureCollectionWriter:
+    def __init__(self, path, var_name=None, header=None, indent=None, compact=False, semicolon=True,
+                 profile=None):
+        self.path = path
+        self.profile = resolve(profile, path)
+        self.var_name = var_name
+        self.header = header or {}
+        self.indent = indent
+        self.semicolon = semicolon
+        if compact:
+            self.separators = (',', ':')
+        elif indent is not None:
+            self.separators = (',', ': ')
+        else:
+            self.separators = (', ', ': ')
+        self.count = 0
+        self.file = None
+
+    def _dumps(self, value, depth):
+        text = json.dumps(value, ensure_ascii=False, indent=self.indent, separators=self.separators)
+        if self.indent is not None:
+            text = text.replace('\n', '\n' + ' ' * (self.indent * depth))
+        return text
+
+    def _newline(self, depth):
+        return '' if self.indent is None else '\n' + ' ' * (self.indent * depth)
+
+    def _member(self, key, value):
+        return self._newline(1) + json.dumps(key, ensure_ascii=False) + self.separators[1] + self._dumps(value, 1)
+
+    def open(self):
+        self.file = open(self.path, 'w', encoding='utf-8')
+        if self.var_name:
+            self.file.write(f'var {self.var_name} = ')
+        members = [self._member('type', 'FeatureCollection')]
+        members += [self._member(key, value) for key, value in self.header.items()]
+        self.file.write('{' + self.separators[0].join(members) + self.separators[0])
+        self.file.write(self._newline(1) + '"features"' + self.separators[1] + '[')
+        return self
+
+    def write(self, feature):
+        if self.profile is not None:
+            feature = self.profile.apply(feature)
+        if self.count:
+            self.file.write(self.separators[0])
+        self.file.write(self._newline(2) + self._dumps(feature, 2))
+        self.count += 1
+
+    def write_all(self, features):
+        for feature in features:
+            self.write(feature)
+
+    def close(self, footer=None):
+        """Close the features array, add the `footer` members and the file."""
+        if self.file is None:
+            return
+        self.file.write((self._newline(1) if self.count else '') + ']')
+        for key, value in (footer or {}).items():
+            self.file.write(self.separators[0] + self._member(key, value))
+        self.file.write(self._newline(0) + '}')
+        if self.semicolon and self.var_name:
+            self.file.write(';')
+        self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def write_feature_collection(path, features, var_name=None, header=None, footer=None,
+                             indent=None, compact=False, semicolon=True, profile=None):
+    """Stream an iterable of features to `path`; return the feature count.
+
+    `profile`: None applies the publish profile of `path`, False none.
+    """
+    writer = FeatureCollectionWriter(path, var_name, header, indent, compact, semicolon, profile)
+    with writer:
+        writer.write_all(features)
+        writer.close(footer)
+    return writer.count
+
+
+def write_geojson_js(path, var_name, geojson, indent=None, compact=False, semicolon=True, profile=None):
+    """Write a FeatureCollection dict, keeping its member order."""
+    keys = list(geojson)
+    split = keys.index('features')
+    header = {key: geojson[key] for key in keys[:split] if key != 'type'}
+    footer = {key: geojson[key] for key in keys[split + 1:]}
+    return write_feature_collection(path, geojson['features'], var_name, header, footer,
+                                    indent, compact, semicolon, profile)
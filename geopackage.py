@@ -0,0 +1,295 @@
+"""
+GeoPackage export of the map layers for QGIS and ad-hoc SQL.
+
+Each generator writes its FeatureCollection as one table of
+data/vaccination_layers.gpkg (named after the data file, e.g.
+vaccination_individual_data) next to the JS output. Properties become typed
+columns (INTEGER, REAL, TEXT; nested values as JSON text) and the points get
+an R-tree spatial index (the gpkg_rtree_index extension), so QGIS and
+queries on rtree_<table>_geom use indexed bbox lookups.
+
+Only the standard library is needed: the geometry blobs are packed by hand
+and the R-tree is filled directly. The triggers that keep the index in sync
+with later edits (in QGIS) are created after the table is filled, since they
+call the ST_* functions that only GeoPackage-aware clients provide.
+
+The layer gets the generator's full features, not the pruned form the JS
+files are published in (publish_profiles.py); generators that stream their
+features feed a LayerWriter alongside the JS writer.
+"""
+import json
+import os
+import sqlite3
+import struct
+
+GEOPACKAGE_PATH = 'data/vaccination_layers.gpkg'
+SRS_ID = 4326
+
+APPLICATION_ID = 0x47504B47  # 'GPKG'
+USER_VERSION = 10300
+
+WGS84_WKT = ('GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,'
+             'AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,'
+             'AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,AUTHORITY["EPSG","9122"]],'
+             'AXIS["Latitude",NORTH],AXIS["Longitude",EAST],AUTHORITY["EPSG","4326"]]')
+
+CORE_TABLES = """
+CREATE TABLE IF NOT EXISTS gpkg_spatial_ref_sys (
+    srs_name TEXT NOT NULL, srs_id INTEGER NOT NULL PRIMARY KEY,
+    organization TEXT NOT NULL, organization_coordsys_id INTEGER NOT NULL,
+    definition TEXT NOT NULL, description TEXT);
+CREATE TABLE IF NOT EXISTS gpkg_contents (
+    table_name TEXT NOT NULL PRIMARY KEY, data_type TEXT NOT NULL,
+    identifier TEXT UNIQUE, description TEXT DEFAULT '',
+    last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+    min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE,
+    srs_id INTEGER, CONSTRAINT fk_gc_r_srs_id FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys(srs_id));
+CREATE TABLE IF NOT EXISTS gpkg_geometry_columns (
+    table_name TEXT NOT NULL, column_name TEXT NOT NULL,
+    geometry_type_name TEXT NOT NULL, srs_id INTEGER NOT NULL,
+    z TINYINT NOT NULL, m TINYINT NOT NULL,
+    CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name),
+    CONSTRAINT fk_gc_tn FOREIGN KEY (table_name) REFERENCES gpkg_contents(table_name),
+    CONSTRAINT fk_gc_srs FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys (srs_id));
+CREATE TABLE IF NOT EXISTS gpkg_extensions (
+    table_name TEXT, column_name TEXT, extension_name TEXT NOT NULL,
+    definition TEXT NOT NULL, scope TEXT NOT NULL,
+    CONSTRAINT ge_tce UNIQUE (table_name, column_name, extension_name));
+"""
+
+# Triggers of the gpkg_rtree_index extension (GeoPackage 1.3, annex F.3)
+RTREE_TRIGGERS = """
+CREATE TRIGGER rtree_{t}_{c}_insert AFTER INSERT ON "{t}"
+WHEN (new."{c}" NOT NULL AND NOT ST_IsEmpty(NEW."{c}"))
+BEGIN
+  INSERT OR REPLACE INTO rtree_{t}_{c} VALUES (
+    NEW."{i}", ST_MinX(NEW."{c}"), ST_MaxX(NEW."{c}"), ST_MinY(NEW."{c}"), ST_MaxY(NEW."{c}"));
+END;
+CREATE TRIGGER rtree_{t}_{c}_update1 AFTER UPDATE OF "{c}" ON "{t}"
+WHEN OLD."{i}" = NEW."{i}" AND (NEW."{c}" NOTNULL AND NOT ST_IsEmpty(NEW."{c}"))
+BEGIN
+  INSERT OR REPLACE INTO rtree_{t}_{c} VALUES (
+    NEW."{i}", ST_MinX(NEW."{c}"), ST_MaxX(NEW."{c}"), ST_MinY(NEW."{c}"), ST_MaxY(NEW."{c}"));
+END;
+CREATE TRIGGER rtree_{t}_{c}_update2 AFTER UPDATE OF "{c}" ON "{t}"
+WHEN OLD."{i}" = NEW."{i}" AND (NEW."{c}" ISNULL OR ST_IsEmpty(NEW."{c}"))
+BEGIN
+  DELETE FROM rtree_{t}_{c} WHERE id = OLD."{i}";
+END;
+CREATE TRIGGER rtree_{t}_{c}_update3 AFTER UPDATE ON "{t}"
+WHEN OLD."{i}" != NEW."{i}" AND (NEW."{c}" NOTNULL AND NOT ST_IsEmpty(NEW."{c}"))
+BEGIN
+  DELETE FROM rtree_{t}_{c} WHERE id = OLD."{i}";
+  INSERT OR REPLACE INTO rtree_{t}_{c} VALUES (
+    NEW."{i}", ST_MinX(NEW."{c}"), ST_MaxX(NEW."{c}"), ST_MinY(NEW."{c}"), ST_MaxY(NEW."{c}"));
+END;
+CREATE TRIGGER rtree_{t}_{c}_update4 AFTER UPDATE ON "{t}"
+WHEN OLD."{i}" != NEW."{i}" AND (NEW."{c}" ISNULL OR ST_IsEmpty(NEW."{c}"))
+BEGIN
+  DELETE FROM rtree_{t}_{c} WHERE id IN (OLD."{i}", NEW."{i}");
+END;
+CREATE TRIGGER rtree_{t}_{c}_delete AFTER DELETE ON "{t}"
+WHEN old."{c}" NOT NULL
+BEGIN
+  DELETE FROM rtree_{t}_{c} WHERE id = OLD."{i}";
+END;
+"""
+
+
+def point_blob(x, y, srs_id=SRS_ID):
+    """GeoPackage geometry blob of a point: 'GP' header + little-endian WKB."""
+    # version 0, flags: little endian, no envelope (a point is its own bbox)
+    return b'GP\x00\x01' + struct.pack('<i', srs_id) + struct.pack('<BIdd', 1, 1, x, y)
+
+
+def _kind(value):
+    """SQL type of a property value; None for a null."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 'BOOLEAN'
+    if isinstance(value, int):
+        return 'INTEGER'
+    if isinstance(value, float):
+        return 'REAL'
+    return 'TEXT'
+
+
+def column_types(features):
+    """{property: SQL type} in order of first appearance."""
+    types = {}
+    for feature in features:
+        for key, value in feature['properties'].items():
+            kind = _kind(value)
+            previous = types.get(key)
+            if kind is None:
+                types.setdefault(key, None)
+            elif previous is None or previous == kind:
+                types[key] = kind
+            elif {previous, kind} <= {'INTEGER', 'REAL'}:
+                types[key] = 'REAL'
+            else:
+                types[key] = 'TEXT'
+    return {key: kind or 'TEXT' for key, kind in types.items()}
+
+
+def _sql_value(value, kind):
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if kind == 'TEXT' and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _init(db):
+    db.execute(f'PRAGMA application_id = {APPLICATION_ID}')
+    db.execute(f'PRAGMA user_version = {USER_VERSION}')
+    db.executescript(CORE_TABLES)
+    db.executemany('INSERT OR IGNORE INTO gpkg_spatial_ref_sys VALUES (?, ?, ?, ?, ?, ?)', [
+        ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined', 'undefined cartesian coordinate reference system'),
+        ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined', 'undefined geographic coordinate reference system'),
+        ('WGS 84 geodetic', 4326, 'EPSG', 4326, WGS84_WKT, 'longitude/latitude coordinates in decimal degrees on the WGS 84 spheroid'),
+    ])
+
+
+def _drop_layer(db, table):
+    db.execute(f'DROP TABLE IF EXISTS {_quote("rtree_" + table + "_geom")}')
+    db.execute(f'DROP TABLE IF EXISTS {_quote(table)}')
+    for meta in ('gpkg_extensions', 'gpkg_geometry_columns', 'gpkg_contents'):
+        db.execute(f'DELETE FROM {meta} WHERE table_name = ?', (table,))
+
+
+class LayerWriter:
+    """Write (or replace) the point layer `table` of the GeoPackage at `path`
+    one feature at a time, so streamed generators can feed it too.
+
+    Columns come from `columns` ({property: SQL type}) or are added as new
+    properties show up. Everything happens in one transaction: the previous
+    version of the layer stays in place if writing fails. The spatial index,
+    its triggers and the layer metadata are written by close().
+    """
+
+    def __init__(self, table, path=GEOPACKAGE_PATH, description='', columns=None):
+        self.table = table
+        self.path = path
+        self.description = description
+        self.initial_columns = columns or {}
+        self.columns = {}
+        self.boxes = []
+        self.statements = {}
+        self.db = None
+
+    @property
+    def count(self):
+        return len(self.boxes)
+
+    def open(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.db = sqlite3.connect(self.path, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode = MEMORY')
+        self.db.execute('PRAGMA synchronous = OFF')
+        _init(self.db)
+        self.db.execute('BEGIN')
+        _drop_layer(self.db, self.table)
+        self.db.execute(f'CREATE TABLE {_quote(self.table)} '
+                        f'(fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, geom POINT)')
+        for key, kind in self.initial_columns.items():
+            self._add_column(key, kind)
+        return self
+
+    def _add_column(self, key, kind):
+        if key in ('fid', 'geom'):
+            raise ValueError(f"{self.table}: properties 'fid' and 'geom' are reserved")
+        self.db.execute(f'ALTER TABLE {_quote(self.table)} ADD COLUMN {_quote(key)} {kind}')
+        self.columns[key] = kind
+
+    def add(self, feature):
+        """Insert one feature; features without point coordinates are skipped."""
+        geometry = feature.get('geometry') or {}
+        if geometry.get('type') != 'Point':
+            return
+        props = feature['properties']
+        for key, value in props.items():
+            if key not in self.columns:
+                self._add_column(key, _kind(value) or 'TEXT')
+
+        keys = tuple(props)
+        statement = self.statements.get(keys)
+        if statement is None:
+            names = ', '.join(_quote(key) for key in keys)
+            marks = ', '.join('?' * (len(keys) + 2))
+            statement = self.statements[keys] = (
+                f'INSERT INTO {_quote(self.table)} (fid, geom{", " if keys else ""}{names}) VALUES ({marks})')
+
+        fid = self.count + 1
+        x, y = geometry['coordinates'][:2]
+        self.db.execute(statement, [fid, point_blob(x, y)]
+                        + [_sql_value(props[key], self.columns[key]) for key in keys])
+        self.boxes.append((fid, x, x, y, y))
+
+    def observe(self, features):
+        """Pass `features` through, writing each one (for streamed writers)."""
+        for feature in features:
+            self.add(feature)
+            yield feature
+
+    def close(self):
+        db, table = self.db, self.table
+        # Spatial index, filled directly; triggers only once the data is in
+        rtree = 'rtree_' + table + '_geom'
+        db.execute(f'CREATE VIRTUAL TABLE {_quote(rtree)} USING rtree(id, minx, maxx, miny, maxy)')
+        db.executemany(f'INSERT INTO {_quote(rtree)} VALUES (?, ?, ?, ?, ?)', self.boxes)
+        for trigger in RTREE_TRIGGERS.format(t=table, c='geom', i='fid').split('END;')[:-1]:
+            db.execute(trigger + 'END;')
+
+        boxes = self.boxes
+        bbox = (min(b[1] for b in boxes), min(b[3] for b in boxes),
+                max(b[2] for b in boxes), max(b[4] for b in boxes)) if boxes else (None,) * 4
+        db.execute('INSERT INTO gpkg_contents (table_name, data_type, identifier, description, '
+                   'min_x, min_y, max_x, max_y, srs_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                   (table, 'features', table, self.description) + bbox + (SRS_ID,))
+        db.execute('INSERT INTO gpkg_geometry_columns VALUES (?, ?, ?, ?, ?, ?)',
+                   (table, 'geom', 'POINT', SRS_ID, 0, 0))
+        db.execute('INSERT INTO gpkg_extensions VALUES (?, ?, ?, ?, ?)',
+                   (table, 'geom', 'gpkg_rtree_index',
+                    'http://www.geopackage.org/spec120/#extension_rtree', 'write-only'))
+        db.execute('COMMIT')
+        db.close()
+        self.db = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self.db is not None:
+            self.db.execute('ROLLBACK')
+            self.db.close()
+            self.db = None
+
+
+def write_layer(geojson, table, path=GEOPACKAGE_PATH, description=''):
+    """Write (or replace) the point layer `table` from a FeatureCollection.
+
+    Features without point coordinates are skipped. Returns the row count.
+    """
+    features = [f for f in geojson['features']
+                if (f.get('geometry') or {}).get('type') == 'Point']
+    with LayerWriter(table, path, description, column_types(features)) as layer:
+        for feature in features:
+            layer.add(feature)
+    return layer.count
+
+
+def layer_name(data_path):
+    """Table name for a data file: its stem (vaccination_individual_data)."""
+    return os.path.splitext(os.path.basename(data_path))[0]
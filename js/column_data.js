@@ -0,0 +1,123 @@
+// Loads the binary column files written by column_data.py
+// (data/<name>.columns.bin) as typed arrays:
+//
+//   ColumnData.load('json_vaccination_data', 'data/vaccination_data.columns.bin', filterFunc);
+//   var table = ColumnData.table('json_vaccination_data');
+//   table.columns['Total Children']    // Int32Array, one value per feature
+//   ColumnData.values(table, 'Governorate')    // decoded strings
+//
+// A table is plain data (typed arrays and the string dictionaries), so it
+// can be posted to a worker as is. It is fetched, so the page must be
+// served over HTTP; without it ColumnData.table() stays null and the pages
+// read the feature objects as before.
+var ColumnData = (function() {
+    var MAGIC = 'GZCOL1';
+    var tables = {};
+    var types = {
+        int32: Int32Array,
+        float32: Float32Array,
+        string: Int32Array,
+        float64: Float64Array
+    };
+
+    function parse(buffer) {
+        var bytes = new Uint8Array(buffer);
+        if (String.fromCharCode.apply(null, bytes.subarray(0, MAGIC.length)) !== MAGIC) {
+            throw new Error('Not a column file');
+        }
+        var headerLength = new DataView(buffer).getUint32(8, true);
+        var header = JSON.parse(new TextDecoder('utf-8').decode(bytes.subarray(12, 12 + headerLength)));
+        var start = 12 + headerLength;
+
+        var table = {
+            type: 'ColumnTable',
+            count: header.count,
+            columns: {},
+            dictionaries: header.dictionaries || {},
+            x: null,
+            y: null
+        };
+        header.columns.forEach(function(entry) {
+            var values = new types[entry.type](buffer, start + entry.offset, entry.length);
+            if (entry.type === 'float64') {
+                table[entry.name] = values;
+            } else {
+                table.columns[entry.name] = values;
+            }
+        });
+        return table;
+    }
+
+    function load(name, url, callback) {
+        var xhr = new XMLHttpRequest();
+        xhr.open('GET', url);
+        xhr.responseType = 'arraybuffer';
+        xhr.onload = function() {
+            if (xhr.status !== 200 && xhr.status !== 0) {
+                return;
+            }
+            try {
+                tables[name] = parse(xhr.response);
+            } catch (err) {
+                return;
+            }
+            if (callback) {
+                callback(tables[name]);
+            }
+        };
+        xhr.send();
+    }
+
+    function table(name) {
+        return tables[name] || null;
+    }
+
+    // Values of one column, strings decoded (null where missing)
+    function values(table, name) {
+        var column = table.columns[name];
+        var dictionary = table.dictionaries[name];
+        if (!column || !dictionary) {
+            return column || null;
+        }
+        var result = new Array(column.length);
+        for (var i = 0; i < column.length; i++) {
+            result[i] = column[i] < 0 ? null : dictionary[column[i]];
+        }
+        return result;
+    }
+
+    // Whether the table rows are `features`, in order: the file may be older
+    // or newer than the data the page holds (patches, shards loaded later)
+    function matches(table, features) {
+        if (!table || table.count !== features.length) {
+            return false;
+        }
+        var keys = ['Health Facility', 'Health_Facility', 'ObjectID'];
+        for (var k = 0; k < keys.length; k++) {
+            var column = table.columns[keys[k]];
+            if (!column) {
+                continue;
+            }
+            var dictionary = table.dictionaries[keys[k]];
+            for (var i = 0; i < features.length; i++) {
+                var value = features[i].properties[keys[k]];
+                if (value === undefined || value === null) {
+                    value = dictionary ? null : 0;   // as column_data.py stores missing values
+                }
+                var stored = dictionary ? (column[i] < 0 ? null : dictionary[column[i]]) : column[i];
+                if (value !== stored) {
+                    return false;
+                }
+            }
+        }
+        return true;
+    }
+
+    return {
+        load: load,
+        parse: parse,
+        table: table,
+        values: values,
+        matches: matches
+    };
+})();
@@ -0,0 +1,185 @@
+// Keeps a localStorage copy of a data file up to date with the patches
+// written by data_patches.py.
+//
+// Usage, where the page used to load the data file with a <script> tag:
+//
+//   <script src="js/data_patches.js"></script>
+//   <script>DataPatches.loadManifest('vaccination_data');</script>
+//   <script>DataPatches.restore('vaccination_data', 'json_vaccination_data', 'data/vaccination_data.js');</script>
+//
+// The scripts are added with document.write while the page is parsed, so
+// window[varName] is ready for the page scripts that follow, as before.
+// Without a manifest, patches or localStorage the full file is loaded.
+var DataPatches = (function() {
+    var baseUrl = 'data/patches/';
+    var storagePrefix = 'data_patches:';
+    var manifests = {};
+    var current = {};   // key -> version held in window[varName]
+    var varNames = {};  // key -> window variable
+
+    var NAME_KEYS = ['Health Facility', 'Health_Facility'];
+    var ID_KEY = 'ObjectID';
+
+    function writeScript(src) {
+        document.write('<script src="' + src + '"><\/script>');
+    }
+
+    function writeCall(call) {
+        document.write('<script>' + call + '<\/script>');
+    }
+
+    function manifest(key, data) {
+        manifests[key] = data;
+    }
+
+    function loadManifest(key) {
+        writeScript(baseUrl + key + '/manifest.js?t=' + Date.now());
+    }
+
+    function readCache(key) {
+        try {
+            return JSON.parse(window.localStorage.getItem(storagePrefix + key));
+        } catch (err) {
+            return null;
+        }
+    }
+
+    function store(key) {
+        var m = manifests[key];
+        if (!m || current[key] !== m.version) {
+            return;
+        }
+        try {
+            window.localStorage.setItem(storagePrefix + key,
+                JSON.stringify({version: m.version, data: window[varNames[key]]}));
+        } catch (err) {
+            // Storage full or disabled: the next visit downloads the file again
+        }
+    }
+
+    function loadFull(key, dataUrl) {
+        var m = manifests[key];
+        current[key] = m ? m.version : null;
+        writeScript(dataUrl + (m ? '?v=' + m.version : ''));
+        writeCall("DataPatches.store('" + key + "')");
+    }
+
+    function restore(key, varName, dataUrl) {
+        varNames[key] = varName;
+        var m = manifests[key];
+        var cached = m ? readCache(key) : null;
+        if (!cached || !cached.data || cached.version > m.version) {
+            loadFull(key, dataUrl);
+            return;
+        }
+        if (cached.version === m.version) {
+            window[varName] = cached.data;
+            current[key] = cached.version;
+            return;
+        }
+
+        // Patches must continue the cached version without gaps
+        var needed = m.patches.filter(function(p) {
+            return p.version > cached.version;
+        });
+        for (var i = 0; i < needed.length; i++) {
+            if (needed[i].version !== cached.version + i + 1) {
+                loadFull(key, dataUrl);
+                return;
+            }
+        }
+        if (needed.length === 0 || needed[needed.length - 1].version !== m.version) {
+            loadFull(key, dataUrl);
+            return;
+        }
+
+        window[varName] = cached.data;
+        current[key] = cached.version;
+        needed.forEach(function(p) {
+            writeScript(baseUrl + key + '/' + p.file);
+        });
+        writeCall("DataPatches.finish('" + key + "', '" + dataUrl + "')");
+    }
+
+    // After the patches: keep the result, or fall back if one was missing
+    function finish(key, dataUrl) {
+        if (current[key] === manifests[key].version) {
+            store(key);
+        } else {
+            loadFull(key, dataUrl);
+        }
+    }
+
+    function featureKeys(features) {
+        var seen = {};
+        return features.map(function(feature) {
+            var props = feature.properties;
+            var name = '';
+            for (var i = 0; i < NAME_KEYS.length; i++) {
+                var value = props[NAME_KEYS[i]];
+                if (value !== undefined && value !== null && value !== '') {
+                    name = String(value);
+                    break;
+                }
+            }
+            var objectId = props[ID_KEY];
+            var key = (objectId === undefined || objectId === null || objectId === '') ? name : name + '#' + objectId;
+            seen[key] = (seen[key] || 0) + 1;
+            return seen[key] === 1 ? key : key + '~' + seen[key];
+        });
+    }
+
+    function apply(collection, p) {
+        var keys = featureKeys(collection.features);
+        var removed = {};
+        p.removed.forEach(function(key) {
+            removed[key] = true;
+        });
+        var features = [];
+        collection.features.forEach(function(feature, i) {
+            if (removed[keys[i]]) {
+                return;
+            }
+            var change = p.changed[keys[i]];
+            if (change) {
+                var props = feature.properties;
+                for (var name in (change.properties || {})) {
+                    props[name] = change.properties[name];
+                }
+                (change.removed_properties || []).forEach(function(name) {
+                    delete props[name];
+                });
+                if (change.geometry) {
+                    feature.geometry = change.geometry;
+                }
+            }
+            features.push(feature);
+        });
+        collection.features = features.concat(p.added);
+        for (var member in (p.meta || {})) {
+            collection[member] = p.meta[member];
+        }
+        (p.meta_removed || []).forEach(function(member) {
+            delete collection[member];
+        });
+    }
+
+    function patch(key, version, p) {
+        if (current[key] !== version - 1) {
+            current[key] = null;
+            return;
+        }
+        apply(window[varNames[key]], p);
+        current[key] = version;
+    }
+
+    return {
+        apply: apply,
+        finish: finish,
+        loadManifest: loadManifest,
+        manifest: manifest,
+        patch: patch,
+        restore: restore,
+        store: store
+    };
+})();
@@ -0,0 +1,525 @@
+// Indexed filtering for the filter panels; filterFunc in the map pages is
+// generated by add_filters_to_html.py to use it.
+//
+// Each filtered property is a dimension. Numeric dimensions keep the
+// features sorted by value, so a slider move only visits the features
+// between the old and the new bound. Text dimensions group the features by
+// value. Every feature has a bitmask with one bit per dimension that
+// rejects it and is shown when the mask is 0. A filter that did not change
+// costs nothing, and commit() reports only the features whose visibility
+// flipped, so the page moves those markers instead of rebuilding the layer.
+//
+// `features` is the array of GeoJSON features or a ColumnData table
+// (js/column_data.js) of the same rows; with a table the values are read
+// from its typed arrays and selected() returns row indexes.
+function FilterEngine(features, dimensions) {
+    var table = features.type === 'ColumnTable';
+    var n = table ? features.count : features.length;
+    var masks = new Uint32Array(n);
+    var touched = new Uint8Array(n);   // 1: shown before this update, 2: hidden
+    var touchedList = [];
+    var dims = {};
+
+    function setBit(i, bit, reject) {
+        if (!touched[i]) {
+            touched[i] = masks[i] === 0 ? 1 : 2;
+            touchedList.push(i);
+        }
+        masks[i] = reject ? (masks[i] | bit) : (masks[i] & ~bit);
+    }
+
+    function setRange(order, from, to, bit, reject) {
+        for (var p = from; p < to; p++) {
+            setBit(order[p], bit, reject);
+        }
+    }
+
+    // First position in `sorted` whose value is >= value (> value if `after`)
+    function bound(sorted, value, after) {
+        var lo = 0, hi = sorted.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >>> 1;
+            if (sorted[mid] < value || (after && sorted[mid] === value)) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        return lo;
+    }
+
+    function numeric(key, bit) {
+        var raw = FilterEngine.values(features, key);
+        var values = new Float64Array(n);
+        for (var i = 0; i < n; i++) {
+            values[i] = (typeof raw[i] === 'number' ? Math.trunc(raw[i]) : parseInt(raw[i])) || 0;
+        }
+        var order = new Uint32Array(n);
+        for (var i = 0; i < n; i++) {
+            order[i] = i;
+        }
+        order.sort(function(a, b) {
+            return values[a] - values[b];
+        });
+        var sorted = new Float64Array(n);
+        for (var i = 0; i < n; i++) {
+            sorted[i] = values[order[i]];
+        }
+
+        var lo = 0, hi = n;   // features order[lo..hi) pass this dimension
+        return {
+            range: function(min, max) {
+                var newLo = isNaN(min) ? 0 : bound(sorted, min, false);
+                var newHi = isNaN(max) ? n : bound(sorted, max, true);
+                if (newHi < newLo) {
+                    newHi = newLo;
+                }
+                setRange(order, lo, Math.min(hi, newLo), bit, true);
+                setRange(order, Math.max(lo, newHi), hi, bit, true);
+                setRange(order, newLo, Math.min(newHi, lo), bit, false);
+                setRange(order, Math.max(newLo, hi), newHi, bit, false);
+                lo = newLo;
+                hi = newHi;
+            }
+        };
+    }
+
+    function text(key, bit) {
+        var raw = FilterEngine.values(features, key);
+        var groups = {};
+        var others = [];   // non-text values never match a selection
+        for (var i = 0; i < n; i++) {
+            var value = raw[i];
+            if (typeof value === 'string') {
+                (groups[value] = groups[value] || []).push(i);
+            } else {
+                others.push(i);
+            }
+        }
+
+        var selected = null;   // null: no selection, everything passes
+        function apply(ids, reject) {
+            for (var j = 0; j < ids.length; j++) {
+                setBit(ids[j], bit, reject);
+            }
+        }
+        return {
+            select: function(values) {
+                var next = null;
+                if (values && values.length) {
+                    next = {};
+                    values.forEach(function(value) {
+                        next[value] = true;
+                    });
+                }
+                for (var value in groups) {
+                    var was = selected === null || selected[value] === true;
+                    var now = next === null || next[value] === true;
+                    if (was !== now) {
+                        apply(groups[value], !now);
+                    }
+                }
+                if ((selected === null) !== (next === null)) {
+                    apply(others, next !== null);
+                }
+                selected = next;
+            }
+        };
+    }
+
+    var bit = 0;
+    for (var key in dimensions) {
+        if (bit === 32 || n === 0 || !FilterEngine.has(features, key)) {
+            continue;
+        }
+        if (dimensions[key] === 'int') {
+            dims[key] = numeric(key, 1 << bit);
+        } else if (dimensions[key] === 'str') {
+            dims[key] = text(key, 1 << bit);
+        } else {
+            continue;
+        }
+        bit++;
+    }
+
+    return {
+        size: n,
+        has: function(key) {
+            return key in dims;
+        },
+        filterRange: function(key, min, max) {
+            if (dims[key] && dims[key].range) {
+                dims[key].range(min, max);
+            }
+        },
+        filterIn: function(key, values) {
+            if (dims[key] && dims[key].select) {
+                dims[key].select(values);
+            }
+        },
+        // Controls as read by LayerFilter.controls
+        update: function(controls) {
+            for (var key in controls) {
+                if (controls[key].range) {
+                    this.filterRange(key, controls[key].range[0], controls[key].range[1]);
+                } else {
+                    this.filterIn(key, controls[key].values);
+                }
+            }
+        },
+        // {added: [...], removed: [...]} feature indexes since the last commit
+        commit: function() {
+            var added = [], removed = [];
+            for (var j = 0; j < touchedList.length; j++) {
+                var i = touchedList[j];
+                var was = touched[i] === 1, now = masks[i] === 0;
+                if (was && !now) {
+                    removed.push(i);
+                } else if (!was && now) {
+                    added.push(i);
+                }
+                touched[i] = 0;
+            }
+            touchedList = [];
+            return {added: added, removed: removed};
+        },
+        isShown: function(i) {
+            return masks[i] === 0;
+        },
+        // {name: total} of FilterEngine.columns over the shown features
+        sums: function(columns) {
+            var totals = {};
+            for (var name in columns) {
+                var column = columns[name], total = 0;
+                for (var i = 0; i < n; i++) {
+                    if (masks[i] === 0) {
+                        total += column[i];
+                    }
+                }
+                totals[name] = total;
+            }
+            return totals;
+        },
+        selected: function() {
+            var result = [];
+            for (var i = 0; i < n; i++) {
+                if (masks[i] === 0) {
+                    result.push(table ? i : features[i]);
+                }
+            }
+            return result;
+        }
+    };
+}
+
+// Whether the rows of a feature array or ColumnData table have `key`
+FilterEngine.has = function(features, key) {
+    if (features.type === 'ColumnTable') {
+        return key in features.columns;
+    }
+    return features.length > 0 && key in features[0].properties;
+};
+
+// Values of `key` per row of a feature array or ColumnData table
+FilterEngine.values = function(features, key) {
+    if (features.type === 'ColumnTable') {
+        return ColumnData.values(features, key) || new Array(features.count);
+    }
+    return features.map(function(feature) {
+        return feature.properties[key];
+    });
+};
+
+// Per-feature sums of a summary spec {name: [property, ...]} as
+// {name: Float64Array}; missing or non-numeric values count as 0.
+FilterEngine.columns = function(features, summary) {
+    var n = features.type === 'ColumnTable' ? features.count : features.length;
+    var columns = {};
+    for (var name in summary) {
+        var column = new Float64Array(n);
+        summary[name].forEach(function(key) {
+            var raw = FilterEngine.values(features, key);
+            for (var i = 0; i < n; i++) {
+                column[i] += Number(raw[i]) || 0;
+            }
+        });
+        columns[name] = column;
+    }
+    return columns;
+};
+
+// {name: total} of a summary spec over `features`
+FilterEngine.totals = function(features, summary) {
+    var columns = FilterEngine.columns(features, summary);
+    var totals = {};
+    for (var name in columns) {
+        totals[name] = columns[name].reduce(function(a, b) {
+            return a + b;
+        }, 0);
+    }
+    return totals;
+};
+
+// An engine plus the markers of one L.geoJson layer.
+//
+// With a summary spec the engine runs in a Web Worker (js/filter_worker.js)
+// that holds the filtered and summed properties as typed arrays and answers
+// each update with the markers to add/remove and the summary totals, so the
+// page only moves markers and writes numbers. At most one update is in the
+// worker at a time; controls arriving meanwhile replace each other and only
+// the newest is sent next. Where workers are unavailable (pages opened from
+// file://) the same engine runs in the page. A ColumnData table of the
+// layer's rows, when the page has loaded one, is used instead of the
+// feature objects in either place.
+var LayerFilter = {
+    workerUrl: 'js/filter_worker.js',
+
+    // Filter state for `features`; a previous state is reused while the
+    // data is unchanged and rebuilt when features were added (shards loaded
+    // after the page), creating markers for the new ones.
+    sync: function(state, layer, features, dimensions, summary, table) {
+        var sameData = state && state.size === features.length;
+        if (sameData && (!table || table === state.table || table === state.rejected)) {
+            return state;
+        }
+        if (table && !ColumnData.matches(table, features)) {
+            if (sameData) {
+                state.rejected = table;
+                return state;
+            }
+            table = null;
+        }
+        if (state && state.worker) {
+            state.worker.terminate();
+        }
+        // A marker can stand for several features (merged sites of
+        // js/map_layers.js, marker.features)
+        var byFeature = new Map();
+        function register(marker) {
+            (marker.features || [marker.feature]).forEach(function(feature) {
+                byFeature.set(feature, marker);
+            });
+        }
+        ((state && state.markers) || []).forEach(function(marker) {
+            if (marker) {
+                register(marker);
+            }
+        });
+        layer.eachLayer(register);
+        var missing = features.filter(function(feature) {
+            return !byFeature.has(feature);
+        });
+        if (missing.length) {
+            layer.addData(missing);
+            layer.eachLayer(register);
+        }
+        // A new engine starts with everything shown; refs counts the shown
+        // features of each marker
+        var refs = new Map();
+        var markers = features.map(function(feature) {
+            var marker = byFeature.get(feature) || null;
+            if (marker) {
+                if (!layer.hasLayer(marker)) {
+                    layer.addLayer(marker);
+                }
+                refs.set(marker, (refs.get(marker) || 0) + 1);
+            }
+            return marker;
+        });
+
+        state = {
+            size: features.length,
+            features: features,
+            dimensions: dimensions,
+            summary: summary || null,
+            table: table || null,
+            rejected: null,
+            layer: layer,
+            markers: markers,
+            refs: refs,
+            shown: new Uint8Array(features.length).fill(1),
+            count: features.length,
+            engine: null,
+            columns: null,
+            worker: null,
+            inFlight: null,
+            queued: null
+        };
+        if (state.summary && typeof Worker !== 'undefined') {
+            try {
+                LayerFilter.startWorker(state);
+            } catch (err) {
+                state.worker = null;
+            }
+        }
+        if (!state.worker) {
+            LayerFilter.startEngine(state);
+        }
+        return state;
+    },
+
+    startEngine: function(state) {
+        var rows = state.table || state.features;
+        state.engine = new FilterEngine(rows, state.dimensions);
+        state.columns = state.summary ? FilterEngine.columns(rows, state.summary) : null;
+    },
+
+    startWorker: function(state) {
+        // Only the properties filtered or summed are copied to the worker
+        var keys = Object.keys(state.dimensions);
+        for (var name in state.summary) {
+            keys = keys.concat(state.summary[name]);
+        }
+        var rows;
+        if (state.table) {
+            rows = {type: 'ColumnTable', count: state.table.count, columns: {}, dictionaries: {}};
+            keys.forEach(function(key) {
+                if (key in state.table.columns) {
+                    rows.columns[key] = state.table.columns[key];
+                }
+                if (key in state.table.dictionaries) {
+                    rows.dictionaries[key] = state.table.dictionaries[key];
+                }
+            });
+        } else {
+            rows = state.features.map(function(feature) {
+                var properties = {};
+                keys.forEach(function(key) {
+                    properties[key] = feature.properties[key];
+                });
+                return {properties: properties};
+            });
+        }
+
+        var worker = new Worker(LayerFilter.workerUrl);
+        worker.onmessage = function(e) {
+            var request = state.inFlight;
+            state.inFlight = null;
+            LayerFilter.show(state, e.data);
+            request.done(LayerFilter.result(state, e.data.totals));
+            if (state.queued) {
+                LayerFilter.send(state, state.queued);
+            }
+        };
+        worker.onerror = function(e) {
+            // Fall back to filtering in the page from an unfiltered start
+            if (e.preventDefault) {
+                e.preventDefault();
+            }
+            worker.terminate();
+            state.worker = null;
+            var request = state.queued || state.inFlight;
+            state.inFlight = state.queued = null;
+            var all = [];
+            for (var i = 0; i < state.size; i++) {
+                if (!state.shown[i]) {
+                    all.push(i);
+                }
+            }
+            LayerFilter.show(state, {added: all, removed: []});
+            LayerFilter.startEngine(state);
+            if (request) {
+                LayerFilter.update(state, request.controls, request.done);
+            }
+        };
+        worker.postMessage({type: 'init', features: rows, dimensions: state.dimensions, summary: state.summary});
+        state.worker = worker;
+    },
+
+    send: function(state, request) {
+        state.queued = null;
+        state.inFlight = request;
+        state.worker.postMessage({type: 'filter', controls: request.controls});
+    },
+
+    // Current values of the sel_<key> selects and div_<key> sliders
+    controls: function(dimensions) {
+        var result = {};
+        for (var key in dimensions) {
+            var keyS = key.replace(/[^a-zA-Z0-9_]/g, "");
+            if (dimensions[key] === 'str') {
+                var el = document.getElementById("sel_" + keyS);
+                if (!el) continue;
+                var selection = [];
+                for (var i = 0; i < el.options.length; i++) {
+                    if (el.options[i].selected) selection.push(el.options[i].value);
+                }
+                result[key] = {values: selection};
+            } else if (dimensions[key] === 'int') {
+                var sliderEl = document.getElementById("div_" + keyS);
+                if (!sliderEl || !sliderEl.noUiSlider) continue;
+                var sliderVals = sliderEl.noUiSlider.get();
+                result[key] = {range: [parseInt(sliderVals[0]), parseInt(sliderVals[1])]};
+            }
+        }
+        return result;
+    },
+
+    // Apply the control values, then call done({count, totals, features()})
+    // - totals of the summary spec (null without one), features() the
+    // features now shown. Synchronous unless a worker is running.
+    update: function(state, controls, done) {
+        var request = {controls: controls, done: done};
+        if (state.worker) {
+            if (state.inFlight) {
+                state.queued = request;
+            } else {
+                LayerFilter.send(state, request);
+            }
+            return;
+        }
+        state.engine.update(controls);
+        LayerFilter.show(state, state.engine.commit());
+        done(LayerFilter.result(state, state.columns ? state.engine.sums(state.columns) : null));
+    },
+
+    // Move the markers of a commit() change in or out of the layer
+    show: function(state, change) {
+        var remove = [], add = [];
+        for (var j = 0; j < change.removed.length; j++) {
+            var i = change.removed[j], marker = state.markers[i];
+            state.shown[i] = 0;
+            state.count--;
+            if (marker) {
+                var left = state.refs.get(marker) - 1;
+                state.refs.set(marker, left);
+                if (left === 0) remove.push(marker);
+            }
+        }
+        for (var j = 0; j < change.added.length; j++) {
+            var i = change.added[j], marker = state.markers[i];
+            state.shown[i] = 1;
+            state.count++;
+            if (marker) {
+                var shown = state.refs.get(marker) + 1;
+                state.refs.set(marker, shown);
+                if (shown === 1) add.push(marker);
+            }
+        }
+        // Marker cluster groups re-cluster once per batch
+        var layer = state.layer;
+        if (layer.removeLayers) {
+            layer.removeLayers(remove);
+            layer.addLayers(add);
+        } else {
+            remove.forEach(function(marker) {
+                layer.removeLayer(marker);
+            });
+            add.forEach(function(marker) {
+                layer.addLayer(marker);
+            });
+        }
+    },
+
+    result: function(state, totals) {
+        return {
+            count: state.count,
+            totals: totals,
+            features: function() {
+                return state.features.filter(function(feature, i) {
+                    return state.shown[i] === 1;
+                });
+            }
+        };
+    }
+};
@@ -0,0 +1,102 @@
+// Filter panel built from the FilterSpec that add_filters_to_html.py
+// embeds in index_with_filters.html:
+//
+//   var FilterSpec = [
+//       {"name": "all_child", "id": "all_child", "type": "int", "min": 0, "max": 120},
+//       {"name": "Governorate", "id": "Governorate", "type": "str", "values": ["..."]}
+//   ];
+//   FilterPanel.render(document.getElementById("menu"), FilterSpec, filterFunc);
+//
+// "int" entries become noUiSlider range sliders (div_<id>, value in
+// val_<id>), "str" entries multiple selects (sel_<id>), each with a
+// "clear filter" link - the element ids LayerFilter.controls reads.
+var FilterPanel = (function() {
+    function label(html) {
+        var lab = document.createElement('div');
+        lab.innerHTML = html;
+        lab.className = 'filterlabel';
+        return lab;
+    }
+
+    function slider(menu, filter, onChange) {
+        var div = document.createElement('div');
+        div.id = 'div_' + filter.id;
+        div.className = 'slider';
+        menu.appendChild(div);
+
+        var lab = label('');
+        lab.textContent = filter.name + ': ';
+        var val = document.createElement('span');
+        val.id = 'val_' + filter.id;
+        lab.appendChild(val);
+        menu.appendChild(lab);
+
+        var reset = label('clear filter');
+        reset.onclick = function() {
+            div.noUiSlider.reset();
+        };
+        menu.appendChild(reset);
+
+        noUiSlider.create(div, {
+            start: [filter.min, filter.max],
+            connect: true,
+            step: 1,
+            range: {
+                'min': filter.min,
+                'max': filter.max
+            }
+        });
+        div.noUiSlider.on('update', function(values) {
+            val.innerHTML = values.join(' - ');
+            onChange();
+        });
+    }
+
+    function select(menu, filter, onChange) {
+        var div = document.createElement('div');
+        div.id = 'div_' + filter.id;
+        div.className = 'filterselect';
+        menu.appendChild(div);
+
+        var sel = document.createElement('select');
+        sel.multiple = true;
+        sel.size = Math.min(filter.values.length, 10);
+        sel.id = 'sel_' + filter.id;
+        sel.appendChild(new Option('', ''));
+        filter.values.forEach(function(value) {
+            sel.appendChild(new Option(value, value));
+        });
+        sel.onchange = function() {
+            onChange();
+        };
+        div.appendChild(sel);
+
+        var lab = label('');
+        lab.textContent = filter.name;
+        div.appendChild(lab);
+
+        var reset = label('clear filter');
+        reset.onclick = function() {
+            for (var i = 0; i < sel.options.length; i++) {
+                sel.options[i].selected = false;
+            }
+            onChange();
+        };
+        div.appendChild(reset);
+    }
+
+    function render(menu, spec, onChange) {
+        spec.forEach(function(filter) {
+            menu.appendChild(document.createElement('div'));
+            if (filter.type === 'int') {
+                slider(menu, filter, onChange);
+            } else if (filter.type === 'str') {
+                select(menu, filter, onChange);
+            }
+        });
+    }
+
+    return {
+        render: render
+    };
+})();
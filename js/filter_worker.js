@@ -0,0 +1,23 @@
+// Worker side of LayerFilter (js/filter_engine.js): keeps a FilterEngine and
+// the per-feature summary columns (from the feature properties or a
+// ColumnData table), and answers each filter message with the feature
+// indexes to add/remove and the summary totals of the shown features.
+importScripts('column_data.js', 'filter_engine.js');
+
+var engine = null;
+var columns = null;
+
+onmessage = function(e) {
+    var message = e.data;
+    if (message.type === 'init') {
+        engine = new FilterEngine(message.features, message.dimensions);
+        columns = FilterEngine.columns(message.features, message.summary);
+    } else if (message.type === 'filter') {
+        engine.update(message.controls);
+        var change = engine.commit();
+        var added = Uint32Array.from(change.added);
+        var removed = Uint32Array.from(change.removed);
+        postMessage({added: added, removed: removed, totals: engine.sums(columns)},
+                    [added.buffer, removed.buffer]);
+    }
+};
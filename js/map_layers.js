@@ -0,0 +1,162 @@
+// Point layers of the map pages, drawn as set per layer in map_layers.json
+// (data/map_layers.js, written by map_layers.py):
+//
+//   var layer_vaccination_data = MapLayers.pointLayer('vaccination_data', json_vaccination_data, {
+//       dataVar: 'json_vaccination_data',
+//       pointToLayer: ..., onEachFeature: ...    // the L.geoJson options
+//   });
+//
+// "svg" is the plain L.geoJson layer. "canvas" draws the same circle
+// markers on a canvas in the layer's pane instead of one SVG element each.
+// "cluster" puts canvas markers into an L.markerClusterGroup
+// (js/leaflet.markercluster.js); the facilities of each shared site listed
+// in MAP_LAYERS[name].sites become one marker first, with their numeric
+// properties summed and differing names joined. Such a marker keeps its
+// features in marker.features, which LayerFilter (js/filter_engine.js)
+// uses to show it while any of them passes the filters.
+var MapLayers = (function() {
+    function config(name) {
+        return (window.MAP_LAYERS && window.MAP_LAYERS[name]) || {render: 'svg'};
+    }
+
+    function onCanvas(options) {
+        var renderer = L.canvas({pane: options.pane || 'overlayPane'});
+        var pointToLayer = options.pointToLayer || function(feature, latlng) {
+            return L.circleMarker(latlng);
+        };
+        return L.extend({}, options, {
+            pointToLayer: function(feature, latlng) {
+                var marker = pointToLayer(feature, latlng);
+                marker.options.renderer = renderer;
+                return marker;
+            }
+        });
+    }
+
+    // The feature a site's marker is drawn and described with
+    function merge(features) {
+        var properties = {};
+        var names = {};
+        features.forEach(function(feature) {
+            var p = feature.properties;
+            for (var key in p) {
+                var value = p[key];
+                if (typeof value === 'number' && (properties[key] === undefined || typeof properties[key] === 'number')) {
+                    properties[key] = (properties[key] || 0) + value;
+                } else if (typeof value === 'string') {
+                    names[key] = names[key] || [];
+                    if (names[key].indexOf(value) === -1) {
+                        names[key].push(value);
+                    }
+                } else if (!(key in properties)) {
+                    properties[key] = value;
+                }
+            }
+        });
+        for (var key in names) {
+            properties[key] = names[key].join(' / ');
+        }
+        return {type: 'Feature', properties: properties, geometry: features[0].geometry};
+    }
+
+    // The cluster animations hide and show the markers they move with
+    // clusterHide/clusterShow, which the plugin defines for L.Marker only
+    function clusterableCircles() {
+        if (L.CircleMarker.prototype.clusterHide) {
+            return;
+        }
+        L.CircleMarker.include({
+            clusterHide: function() {
+                this._clusterStyle = {opacity: this.options.opacity, fillOpacity: this.options.fillOpacity};
+                return this.setStyle({opacity: 0, fillOpacity: 0});
+            },
+            clusterShow: function() {
+                if (this._clusterStyle) {
+                    this.setStyle(this._clusterStyle);
+                    this._clusterStyle = null;
+                }
+                return this;
+            }
+        });
+    }
+
+    function clusterLayer(data, options, settings) {
+        clusterableCircles();
+        options = onCanvas(options);
+        var precision = settings.site_precision || 5;
+        var sites = settings.sites || {};
+        var group = L.markerClusterGroup(L.extend({
+            maxClusterRadius: settings.cluster_radius || 40,
+            chunkedLoading: true,
+            showCoverageOnHover: false
+        }, options));
+        // Only used to build the markers and reset their style
+        var geojson = L.geoJson(null, options);
+
+        function marker(feature) {
+            var layer = L.GeoJSON.geometryToLayer(feature, options);
+            layer.feature = feature;
+            layer.defaultOptions = layer.options;
+            if (options.onEachFeature) {
+                options.onEachFeature(feature, layer);
+            }
+            return layer;
+        }
+
+        // Same as L.geoJson.addData for a FeatureCollection or feature array
+        group.addData = function(data) {
+            var features = L.Util.isArray(data) ? data : data.features;
+            var bySite = {};
+            var markers = [];
+            features.forEach(function(feature) {
+                var geometry = feature.geometry;
+                if (!geometry) {
+                    return;
+                }
+                var key = null;
+                if (geometry.type === 'Point') {
+                    key = geometry.coordinates[0].toFixed(precision) + ',' + geometry.coordinates[1].toFixed(precision);
+                }
+                if (key !== null && sites[key]) {
+                    (bySite[key] = bySite[key] || []).push(feature);
+                } else {
+                    markers.push(marker(feature));
+                }
+            });
+            for (var key in bySite) {
+                var site = bySite[key].length > 1 ? marker(merge(bySite[key])) : marker(bySite[key][0]);
+                site.features = bySite[key];
+                markers.push(site);
+            }
+            group.addLayers(markers);
+            return group;
+        };
+        // For the mouseout handlers of the pages' onEachFeature
+        group.resetStyle = function(layer) {
+            geojson.resetStyle(layer);
+            return group;
+        };
+
+        if (data) {
+            group.addData(data);
+        }
+        return group;
+    }
+
+    function pointLayer(name, data, options) {
+        var settings = config(name);
+        if (settings.render === 'cluster' && L.markerClusterGroup) {
+            return clusterLayer(data, options, settings);
+        }
+        if (settings.render === 'canvas' || settings.render === 'cluster') {
+            options = onCanvas(options);
+        }
+        return new L.geoJson(data, options);
+    }
+
+    return {
+        config: config,
+        merge: merge,
+        pointLayer: pointLayer
+    };
+})();
@@ -0,0 +1,39 @@
+// Rebuilds a GeoJSON FeatureCollection from the columnar
+// "PackedFeatureCollection" written by packed_geojson.py.
+// Plain FeatureCollections are returned unchanged, so pages work with both.
+function unpackFeatureCollection(data) {
+    if (!data || data.type !== 'PackedFeatureCollection') {
+        return data;
+    }
+    var names = data.properties;
+    var columns = data.columns;
+    var dictionaries = data.dictionaries || {};
+    var lookups = names.map(function(name) {
+        return dictionaries[name] || null;
+    });
+
+    var features = new Array(data.count);
+    for (var i = 0; i < data.count; i++) {
+        var props = {};
+        for (var j = 0; j < names.length; j++) {
+            var value = columns[j][i];
+            if (value === null) {
+                continue;
+            }
+            props[names[j]] = lookups[j] ? lookups[j][value] : value;
+        }
+        features[i] = {
+            type: 'Feature',
+            properties: props,
+            geometry: {type: 'Point', coordinates: [data.x[i], data.y[i]]}
+        };
+    }
+
+    var collection = {type: 'FeatureCollection', features: features};
+    for (var key in data) {
+        if (['type', 'count', 'properties', 'columns', 'dictionaries', 'x', 'y'].indexOf(key) === -1) {
+            collection[key] = data[key];
+        }
+    }
+    return collection;
+}
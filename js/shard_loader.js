@@ -0,0 +1,119 @@
+// On-demand loader for the per-governorate shards written by shards.py.
+//
+// index.js calls DataShards.addIndex(name, index) and every shard calls
+// DataShards.add(name, key, collection). DataShards.collection(name) is a
+// FeatureCollection that holds the index summary right away and gains the
+// features of each shard as it arrives, so existing code that reads
+// window[dataVar].features keeps working.
+var DataShards = (function() {
+    var baseUrl = 'data/shards/';
+    var indexes = {};
+    var collections = {};
+    var requested = {};
+    var listeners = {};
+
+    function collection(name) {
+        if (!collections[name]) {
+            collections[name] = {type: 'FeatureCollection', features: []};
+        }
+        return collections[name];
+    }
+
+    function addIndex(name, index) {
+        indexes[name] = index;
+        var target = collection(name);
+        for (var key in index) {
+            if (key !== 'shards') {
+                target[key] = index[key];
+            }
+        }
+    }
+
+    function add(name, key, data) {
+        if (typeof unpackFeatureCollection === 'function') {
+            data = unpackFeatureCollection(data);
+        }
+        var target = collection(name);
+        Array.prototype.push.apply(target.features, data.features);
+        (listeners[name] || []).forEach(function(callback) {
+            callback(data.features, key);
+        });
+    }
+
+    function onLoad(name, callback) {
+        (listeners[name] = listeners[name] || []).push(callback);
+    }
+
+    // Facility names of all shards, loaded or not
+    function names(name) {
+        var result = [];
+        ((indexes[name] || {}).shards || []).forEach(function(shard) {
+            Array.prototype.push.apply(result, shard.names || []);
+        });
+        return result;
+    }
+
+    function overlaps(bbox, bounds) {
+        return !(bbox[0] > bounds.getEast() || bbox[2] < bounds.getWest() ||
+                 bbox[1] > bounds.getNorth() || bbox[3] < bounds.getSouth());
+    }
+
+    // Features of all shards, loaded or not (the index's shard counts)
+    function count(name) {
+        return ((indexes[name] || {}).shards || []).reduce(function(sum, shard) {
+            return sum + (shard.count || 0);
+        }, 0);
+    }
+
+    // Shards needed for options.governorates (all if empty) within
+    // options.bounds (a L.LatLngBounds), plus those holding options.names
+    function select(name, options) {
+        options = options || {};
+        var governorates = options.governorates || [];
+        var wanted = options.names || [];
+        return ((indexes[name] || {}).shards || []).filter(function(shard) {
+            var byName = wanted.some(function(n) {
+                return (shard.names || []).indexOf(n) >= 0;
+            });
+            if (byName) {
+                return true;
+            }
+            if (governorates.length && governorates.indexOf(shard.governorate) < 0) {
+                return false;
+            }
+            return !options.bounds || overlaps(shard.bbox, options.bounds);
+        });
+    }
+
+    function load(name, options) {
+        requested[name] = requested[name] || {};
+        select(name, options).forEach(function(shard) {
+            if (requested[name][shard.key]) {
+                return;
+            }
+            requested[name][shard.key] = true;
+            var script = document.createElement('script');
+            script.src = baseUrl + name + '/' + shard.file;
+            script.onerror = function() {
+                requested[name][shard.key] = false;
+            };
+            document.head.appendChild(script);
+        });
+    }
+
+    function setBaseUrl(url) {
+        baseUrl = url;
+    }
+
+    return {
+        add: add,
+        addIndex: addIndex,
+        collection: collection,
+        count: count,
+        load: load,
+        names: names,
+        onLoad: onLoad,
+        select: select,
+        setBaseUrl: setBaseUrl
+    };
+})();
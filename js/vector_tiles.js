@@ -0,0 +1,74 @@
+// Static vector tiles written by build_tiles.py, drawn with
+// Leaflet.VectorGrid (js/Leaflet.VectorGrid.js) on canvas tiles.
+//
+//   VectorTiles.layer('vaccination_data', {
+//       pane: 'pane_vaccination_data',
+//       style: function(properties, zoom) { return {radius: 6, ...}; },
+//       popup: function(properties) { return '<h3>...</h3>'; }
+//   }).addTo(map);
+//
+// Points merged at low zoom carry properties.point_count (and the summed
+// counts listed in build_tiles.py) and are drawn with clusterStyle; a click
+// on one zooms in. Tiles are fetched, so the page must be served over HTTP.
+var VectorTiles = (function() {
+    var baseUrl = 'tiles/';
+    var MIN_ZOOM = 8;    // vector_tiles.MIN_ZOOM / MAX_ZOOM
+    var MAX_ZOOM = 14;
+
+    function clusterStyle(properties) {
+        return {
+            radius: Math.min(10 + 4 * Math.log(properties.point_count) / Math.LN2, 30),
+            fill: true,
+            fillColor: '#34495e',
+            fillOpacity: 0.75,
+            color: '#ffffff',
+            weight: 2
+        };
+    }
+
+    function layer(name, options) {
+        options = options || {};
+        var style = options.style || function() {
+            return {radius: 6};
+        };
+        var styles = {};
+        styles[name] = function(properties, zoom) {
+            var s = properties.point_count ? clusterStyle(properties) : style(properties, zoom);
+            s.fill = true;
+            return s;
+        };
+
+        var grid = L.vectorGrid.protobuf(baseUrl + name + '/{z}/{x}/{y}.pbf', {
+            vectorTileLayerStyles: styles,
+            rendererFactory: L.canvas.tile,
+            interactive: true,
+            pane: options.pane || 'overlayPane',
+            minNativeZoom: MIN_ZOOM,
+            maxNativeZoom: MAX_ZOOM
+        });
+
+        grid.on('click', function(e) {
+            var properties = e.layer.properties;
+            var map = grid._map;
+            if (properties.point_count) {
+                map.setView(e.latlng, Math.min(map.getZoom() + 2, MAX_ZOOM + 1));
+            } else if (options.popup) {
+                L.popup({maxHeight: 450, maxWidth: 320})
+                    .setLatLng(e.latlng)
+                    .setContent(options.popup(properties))
+                    .openOn(map);
+            }
+        });
+        return grid;
+    }
+
+    function setBaseUrl(url) {
+        baseUrl = url;
+    }
+
+    return {
+        clusterStyle: clusterStyle,
+        layer: layer,
+        setBaseUrl: setBaseUrl
+    };
+})();
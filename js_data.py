@@ -0,0 +1,146 @@
+"""
+Read and write the `var name = {...};` data wrappers in data/*.js.
+
+The file is memory-mapped and the JSON between the `=` and the trailing `;`
+is handed to orjson (json when orjson is not installed) without building an
+intermediate string. Parsed results are cached per file, keyed by mtime and
+size, so several post-processing steps in one build parse a file once.
+Values returned from the cache are shared: pass cache=False to get a copy
+that is safe to modify.
+
+load_summary() reads only the top-level "summary" member, which the
+generators write last, without parsing the features at all.
+"""
+import json
+import mmap
+import os
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from geojson_writer import write_geojson_js
+
+VAR_PATTERN = re.compile(rb'\s*(?:var|let|const)\s+([A-Za-z_$][\w$]*)\s*=\s*')
+HEAD_SIZE = 256
+
+_cache = {}
+
+
+def _loads(buffer):
+    if orjson is not None:
+        return orjson.loads(buffer)
+    return json.loads(bytes(buffer))
+
+
+class _Mapped:
+    """Memory map of a file; an empty file maps to b''."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.file = open(self.path, 'rb')
+        if os.fstat(self.file.fileno()).st_size == 0:
+            self.buffer = b''
+        else:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.buffer
+
+    def __exit__(self, *exc):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self.file.close()
+
+
+def _bounds(buffer, path):
+    """(variable name or None, start, end) of the JSON payload."""
+    match = VAR_PATTERN.match(buffer[:HEAD_SIZE])
+    name = match.group(1).decode('ascii') if match else None
+    start = match.end() if match else 0
+    end = len(buffer)
+    while end > start and buffer[end - 1:end] in (b' ', b'\n', b'\r', b'\t', b';'):
+        end -= 1
+    if end <= start:
+        raise ValueError(f"No data found in {path}")
+    return name, start, end
+
+
+def var_name(path):
+    """Name of the variable a data file assigns, or None for plain JSON."""
+    with open(path, 'rb') as f:
+        match = VAR_PATTERN.match(f.read(HEAD_SIZE))
+    return match.group(1).decode('ascii') if match else None
+
+
+def _select(data, properties):
+    for feature in data.get('features', ()):
+        props = feature.get('properties') or {}
+        feature['properties'] = {key: props[key] for key in properties if key in props}
+    return data
+
+
+def load(path, properties=None, cache=True):
+    """Parsed content of a data file.
+
+    `properties`: keep only these feature properties (saves memory when a
+    script needs a few columns of a large layer).
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), tuple(properties) if properties is not None else None)
+    if cache and key in _cache and _cache[key][0] == (stat.st_mtime_ns, stat.st_size):
+        return _cache[key][1]
+
+    with _Mapped(path) as buffer:
+        _, start, end = _bounds(buffer, path)
+        view = memoryview(buffer)[start:end]
+        try:
+            data = _loads(view)
+        finally:
+            view.release()
+    if properties is not None:
+        data = _select(data, properties)
+
+    if cache:
+        _cache[key] = ((stat.st_mtime_ns, stat.st_size), data)
+    return data
+
+
+def load_summary(path, member='summary'):
+    """Only the top-level `member` (default "summary") of a data file.
+
+    The last occurrence of the key is decoded and accepted only if nothing
+    but the closing brace follows it; otherwise (or if the member is missing
+    there) the whole file is parsed. Returns None if there is no such member.
+    """
+    needle = json.dumps(member).encode('utf-8')
+    with _Mapped(path) as buffer:
+        _, start, end = _bounds(buffer, path)
+        position = buffer.rfind(needle, start, end)
+        if position >= 0:
+            tail = bytes(buffer[position + len(needle):end]).decode('utf-8')
+            colon = tail.lstrip()
+            if colon.startswith(':'):
+                decoder = json.JSONDecoder()
+                text = colon[1:].lstrip()
+                try:
+                    value, used = decoder.raw_decode(text)
+                except ValueError:
+                    value, used = None, -1
+                if used >= 0 and text[used:].strip() == '}':
+                    return value
+    return load(path).get(member)
+
+
+def write(path, name, data, indent=None, compact=False):
+    """Write `var <name> = <data>;` (FeatureCollections are streamed)."""
+    if isinstance(data, dict) and data.get('type') == 'FeatureCollection' and 'features' in data:
+        write_geojson_js(path, name, data, indent=indent, compact=compact)
+        return
+    separators = (',', ':') if compact else None
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'var {name} = ')
+        json.dump(data, f, ensure_ascii=False, indent=indent, separators=separators)
+        f.write(';')
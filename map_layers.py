@@ -0,0 +1,74 @@
+"""
+Rendering mode of the map pages' point layers, and the co-located
+facility groups used by the cluster mode.
+
+map_layers.json sets, per layer, how js/map_layers.js draws it:
+
+    "svg"      one SVG circle marker per feature (the default)
+    "canvas"   the same markers drawn on one canvas per pane
+    "cluster"  canvas markers in a MarkerClusterGroup; facilities sharing
+               a location are merged into one marker first
+
+Many facilities share coordinates (PHC centers mapped onto the same
+clinic in phc_locations.py), and a cluster of points at one spot can never
+split when zooming in. This stage finds those groups once, from the
+published data files, so the page only looks them up: a site is keyed by
+its coordinates formatted with "site_precision" decimals, as the page
+does with toFixed(). Run after the data scripts; the result is written to
+data/map_layers.js as `var MAP_LAYERS = {...}`.
+"""
+import json
+import os
+from collections import Counter
+
+import js_data
+from packed_geojson import unpack_features
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'map_layers.json')
+RENDER_MODES = ('svg', 'canvas', 'cluster')
+
+
+def site_key(coordinates, precision):
+    return f'{coordinates[0]:.{precision}f},{coordinates[1]:.{precision}f}'
+
+
+def colocated_sites(features, precision):
+    """{site key: feature count} of the locations shared by 2+ Point features."""
+    counts = Counter(
+        site_key(feature['geometry']['coordinates'], precision)
+        for feature in features
+        if (feature.get('geometry') or {}).get('type') == 'Point'
+    )
+    return {key: count for key, count in counts.items() if count > 1}
+
+
+def build_map_layers(config_file=CONFIG_FILE):
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    precision = config.get('site_precision', 5)
+
+    layers = {}
+    for name, layer in config['layers'].items():
+        render = layer.get('render', 'svg')
+        if render not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode for {name}: {render!r}")
+        entry = {'render': render}
+        if render == 'cluster':
+            entry['cluster_radius'] = layer.get('cluster_radius', 40)
+            entry['site_precision'] = precision
+            entry['sites'] = {}
+            if os.path.exists(layer['data']):
+                features = unpack_features(js_data.load(layer['data']))['features']
+                entry['sites'] = colocated_sites(features, precision)
+                grouped = sum(entry['sites'].values())
+                print(f"{name}: {grouped} of {len(features)} features at {len(entry['sites'])} shared sites")
+            else:
+                print(f"Skipping missing data file: {layer['data']}")
+        layers[name] = entry
+
+    js_data.write(config.get('output', 'data/map_layers.js'), 'MAP_LAYERS', layers, indent=1)
+    return layers
+
+
+if __name__ == '__main__':
+    build_map_layers()
@@ -0,0 +1,105 @@
+"""
+Columnar "packed" encoding of Point FeatureCollections for the map pages.
+
+Instead of repeating every property key in every feature, the collection is
+written as a schema (the property names) plus one array per property, with
+the point coordinates as two flat arrays. Low-cardinality string columns
+(Governorate, Organization) are dictionary-encoded. js/packed_geojson.js
+rebuilds the features in the browser:
+
+    {"type": "PackedFeatureCollection", "count": n,
+     "properties": [name, ...], "columns": [[value, ...], ...],
+     "dictionaries": {name: [value, ...]},
+     "x": [lon, ...], "y": [lat, ...], "summary": {...}}
+
+A null in a column means the feature does not have that property. Any other
+top-level members of the collection (summary, ...) are copied unchanged.
+"""
+import json
+
+from publish_profiles import resolve
+
+PACKED_TYPE = 'PackedFeatureCollection'
+
+
+def _dictionary_encode(column, max_size):
+    """(codes, values) for a string column worth encoding, else None."""
+    present = [value for value in column if value is not None]
+    if not present or not all(isinstance(value, str) for value in present):
+        return None
+    values = list(dict.fromkeys(present))
+    if len(values) > max_size or 2 * len(values) > len(present):
+        return None
+    code = {value: i for i, value in enumerate(values)}
+    return [None if value is None else code[value] for value in column], values
+
+
+def pack_features(geojson, dictionary_max=64):
+    """Packed dict for a FeatureCollection of Point features."""
+    features = geojson['features']
+    for feature in features:
+        if feature['geometry']['type'] != 'Point':
+            raise ValueError(f"Only Point features can be packed, got {feature['geometry']['type']}")
+
+    names = list(dict.fromkeys(key for feature in features for key in feature['properties']))
+    columns = []
+    dictionaries = {}
+    for name in names:
+        column = [feature['properties'].get(name) for feature in features]
+        encoded = _dictionary_encode(column, dictionary_max)
+        if encoded:
+            column, dictionaries[name] = encoded
+        columns.append(column)
+
+    packed = {'type': PACKED_TYPE, 'count': len(features), 'properties': names, 'columns': columns}
+    if dictionaries:
+        packed['dictionaries'] = dictionaries
+    packed['x'] = [feature['geometry']['coordinates'][0] for feature in features]
+    packed['y'] = [feature['geometry']['coordinates'][1] for feature in features]
+    for key, value in geojson.items():
+        if key not in ('type', 'features'):
+            packed[key] = value
+    return packed
+
+
+def unpack_features(data):
+    """FeatureCollection from a packed dict (the Python side of
+    js/packed_geojson.js); plain collections are returned unchanged."""
+    if data.get('type') != PACKED_TYPE:
+        return data
+    names = data['properties']
+    dictionaries = data.get('dictionaries', {})
+    lookups = [dictionaries.get(name) for name in names]
+
+    features = []
+    for i in range(data['count']):
+        props = {}
+        for name, column, lookup in zip(names, data['columns'], lookups):
+            value = column[i]
+            if value is not None:
+                props[name] = lookup[value] if lookup else value
+        features.append({
+            'type': 'Feature',
+            'properties': props,
+            'geometry': {'type': 'Point', 'coordinates': [data['x'][i], data['y'][i]]},
+        })
+
+    collection = {'type': 'FeatureCollection', 'features': features}
+    for key, value in data.items():
+        if key not in ('type', 'count', 'properties', 'columns', 'dictionaries', 'x', 'y'):
+            collection[key] = value
+    return collection
+
+
+def write_packed_js(path, var_name, geojson, profile=None):
+    """Write `var <var_name> = <packed collection>;` without whitespace.
+
+    `profile`: None applies the publish profile of `path`, False none.
+    """
+    profile = resolve(profile, path)
+    if profile is not None:
+        geojson = profile.apply_all(geojson)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'var {var_name} = ')
+        json.dump(pack_features(geojson), f, ensure_ascii=False, separators=(',', ':'))
+        f.write(';')
@@ -1,24 +1,14 @@
-import xml.etree.ElementTree as ET
 import json
 from collections import defaultdict
 
-# Parse XML
-tree = ET.parse('sheet_data.xml')
-root = tree.getroot()
+from xlsx_stream import iter_rows
 
-# Define namespace
-ns = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-
-# Get all rows
-rows = root.findall('.//x:row', ns)
+# Stream rows straight from the S123 export (no sheet_data.xml extraction)
+excel_file = 'S123_2adf56689a684dc2b08d6be6b905a2d6_EXCEL (22).xlsx'
+rows = iter_rows(excel_file)
 
 # Parse header row
-headers = []
-header_row = rows[0]
-for cell in header_row.findall('.//x:c', ns):
-    value = cell.find('.//x:v', ns)
-    if value is not None:
-        headers.append(value.text)
+headers = [value for value in next(rows) if value is not None]
 
 print(f"Total columns: {len(headers)}")
 print("\nColumn mapping:")
@@ -54,23 +44,13 @@ aggregated = defaultdict(lambda: {col: 0 for col in numeric_columns if col in he
 facilities = set()
 
 # Parse data rows
-for row in rows[1:]:  # Skip header
-    cells = row.findall('.//x:c', ns)
+for row in rows:
     cell_values = {}
 
     # Extract cell values
-    for cell in cells:
-        ref = cell.get('r')  # e.g., "A2", "B2"
-        col_letter = ''.join(filter(str.isalpha, ref))
-        col_idx = 0
-        for i, c in enumerate(col_letter):
-            col_idx = col_idx * 26 + (ord(c) - ord('A') + 1)
-        col_idx -= 1
-
-        if col_idx < len(headers):
-            value_elem = cell.find('.//x:v', ns)
-            if value_elem is not None:
-                cell_values[col_idx] = value_elem.text
+    for col_idx, value in enumerate(row[:len(headers)]):
+        if value is not None:
+            cell_values[col_idx] = value
 
     # Get facility name
     if health_facility_idx in cell_values:
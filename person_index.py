@@ -0,0 +1,102 @@
+"""
+Sorted on-disk index of the person table for joining person attributes
+(DOB, ...) onto dose rows.
+
+PERSON_ID and the requested columns are held as NumPy arrays sorted by id
+and saved next to the workbook as .cache/<stem>-<key>.npz, rebuilt only when
+the workbook fingerprint changes. Lookups are np.searchsorted gathers, so no
+hash table is built per run however many dose rows are joined.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from excel_cache import cache_path, is_fresh, read_excel, write_meta
+
+PERSON_FILE = 'data/person.xlsx'
+ID_COLUMN = 'PERSON_ID'
+
+
+def _column_array(series):
+    """Column as an array np.savez can store without pickling."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy(dtype='datetime64[ns]')
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy()
+    return series.fillna('').astype(str).to_numpy(dtype=str)
+
+
+def _missing_like(values):
+    if values.dtype.kind == 'M':
+        return np.datetime64('NaT', 'ns')
+    if values.dtype.kind in 'iufb':
+        return np.nan
+    return ''
+
+
+class PersonIndex:
+    def __init__(self, ids, columns):
+        self.ids = ids          # sorted PERSON_IDs
+        self.columns = columns  # column name -> array aligned with ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def positions(self, person_ids):
+        """Row of each person id in the index, -1 if absent or missing."""
+        keys = pd.to_numeric(pd.Series(person_ids), errors='coerce').to_numpy()
+        valid = np.ones(len(keys), dtype=bool)
+        if keys.dtype.kind == 'f':
+            valid = ~np.isnan(keys)
+            keys = np.where(valid, keys, 0)
+        keys = keys.astype(np.int64)
+        if not len(self.ids):
+            return np.full(len(keys), -1, dtype=np.intp)
+        found = np.minimum(np.searchsorted(self.ids, keys), len(self.ids) - 1)
+        return np.where(valid & (self.ids[found] == keys), found, -1)
+
+    def get(self, column, person_ids):
+        """`column` value per person id (NaT/NaN/'' for unknown persons).
+
+        Returns an array, or a Series aligned with `person_ids` if it is one.
+        """
+        values = self.columns[column]
+        positions = self.positions(person_ids)
+        missing = positions < 0
+        result = values[np.maximum(positions, 0)] if len(values) else np.empty(len(positions), values.dtype)
+        if missing.any():
+            if values.dtype.kind in 'iub':
+                result = result.astype(np.float64)
+            result[missing] = _missing_like(values)
+        if isinstance(person_ids, pd.Series):
+            return pd.Series(result, index=person_ids.index, name=column)
+        return result
+
+
+def build_person_index(person, columns=('DOB',)):
+    """PersonIndex from a person DataFrame (first row wins for repeated ids)."""
+    person = person.dropna(subset=[ID_COLUMN]).drop_duplicates(ID_COLUMN)
+    order = np.argsort(person[ID_COLUMN].to_numpy(dtype=np.int64), kind='stable')
+    person = person.iloc[order]
+    return PersonIndex(
+        person[ID_COLUMN].to_numpy(dtype=np.int64),
+        {column: _column_array(person[column]) for column in columns},
+    )
+
+
+def load_person_index(path=PERSON_FILE, columns=('DOB',)):
+    """PersonIndex for a person workbook, served from the .npz cache if fresh."""
+    columns = list(columns)
+    index_path = cache_path(path, '.npz', columns=columns)
+    meta_path = os.path.splitext(index_path)[0] + '.json'
+
+    if is_fresh(path, meta_path) and os.path.exists(index_path):
+        with np.load(index_path, allow_pickle=False) as arrays:
+            return PersonIndex(arrays[ID_COLUMN], {column: arrays[column] for column in columns})
+
+    index = build_person_index(read_excel(path), columns)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    np.savez(index_path, **{ID_COLUMN: index.ids}, **index.columns)
+    write_meta(path, meta_path, format='npz')
+    return index
@@ -0,0 +1,377 @@
+"""
+Persistent PHC_CENTER_ID -> location resolution table.
+
+Every PHC center in phc_center_tb.xlsx / phc_center_updated.xlsx is resolved
+once to coordinates, governorate and organization, and the result is stored
+in data/phc_locations.csv together with the method that produced it. On
+later runs only IDs whose source rows changed (or whose matched location
+row in location_point_unified_corrected.csv changed) are resolved again;
+everything else is read back from the table.
+"""
+import csv
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from excel_cache import read_excel
+from facility_index import FacilityIndex, normalize_name
+
+TABLE_FILE = 'phc_locations.csv'
+TABLE_COLUMNS = [
+    'PHC_CENTER_ID', 'NAME_EN', 'NAME_AR', 'en_name', 'ar_name',
+    'Long', 'Lat', 'Governorate', 'Organization', 'method',
+    'location_name', 'location_name_ar', 'source_hash', 'location_hash',
+]
+
+# Bumped when the matching rules change, so every row is resolved again
+RESOLVER_VERSION = 2
+
+# GEOLOCATION_ID -> governorate, used when no location row gives one
+GOV_BY_GEOLOCATION = {
+    3: 'North Gaza',
+    5: 'Gaza',
+    6: 'Middle zone',
+    7: 'Khan Younis',
+    8: 'Rafah'
+}
+
+# Manual mapping for known facilities
+MANUAL_COORDS = {
+    # PHC_CENTER_ID: (Long, Lat, Governorate, Organization)
+    # North Gaza
+    308: (34.255361, 31.337389, 'Rafah', 'MoH'),  # regional / الاقليمي -> AL EQLEMI
+    313: (34.469722, 31.543056, 'North Gaza', 'MSF'),  # MSF Belgium
+    314: (34.478056, 31.543333, 'North Gaza', 'NGO'),  # Al Fursan Medical Center
+    315: (34.485000, 31.537500, 'North Gaza', 'NGO'),  # Civil Defense Medical Root Point
+    316: (34.494167, 31.541111, 'North Gaza', 'MoH'),  # Haider Abdel Shafi Medical Center
+    317: (34.500556, 31.544444, 'North Gaza', 'NGO'),  # Insan Medical Center
+    318: (34.470556, 31.535556, 'North Gaza', 'NGO'),  # Al-Mustafa Medical Point
+    319: (34.496111, 31.536944, 'North Gaza', 'NGO'),  # Anwar Aziz Medical Roots Point
+    320: (34.483611, 31.551389, 'North Gaza', 'NGO'),  # roots of the medicinal herbs / Al-Atatreh
+    321: (34.466389, 31.540556, 'North Gaza', 'PRCS'),  # Red Crescent Medical Point
+
+    # Khan Younis
+    90: (34.294914, 31.362098, 'Khan Younis', 'UNRWA'),  # Japanese HC
+    206: (34.448430, 31.528658, 'Gaza', 'UNRWA'),  # Asmaa Preparatory School
+    103: (34.389554, 31.448438, 'Middle zone', 'UNRWA'),  # Nusairat
+    217: (34.343242, 31.422712, 'Middle zone', 'PRCS'),  # Red Crescent Dr. Fathi Arafat
+    292: (34.270385, 31.361199, 'Khan Younis', 'UNRWA'),  # Al-Mawasi Clinic
+    112: (34.338754, 31.424086, 'Middle zone', 'UNRWA'),  # Deir el balah
+    240: (34.455794, 31.521171, 'Gaza', 'UNRWA'),  # Salah al-Din
+    237: (34.460410, 31.516160, 'Gaza', 'PRCS'),  # Al Sahaba Clinic
+    229: (34.302078, 31.392643, 'Khan Younis', 'UNRWA'),  # Hanin
+    139: (34.279500, 31.347417, 'Khan Younis', 'MSF'),  # MSF-ASP-ELATTAR
+    223: (34.293417, 31.385778, 'Khan Younis', 'MSF'),  # Mawasi Khan Younis MSF Belgium
+    306: (34.306698, 31.394863, 'Khan Younis', 'UNRWA'),  # Hamad UN Health Center
+    130: (34.298306, 31.352056, 'Khan Younis', 'PRCS'),  # الهلال الأحمر-الأمل -> Al-Amal Hospital
+    221: (34.256200, 31.352339, 'Khan Younis', 'UNRWA'),  # Zaarab Health Center
+    41: (34.405607, 31.438834, 'Middle zone', 'MoH'),  # عيادة البريج الجديده -> Burij
+    258: (34.476944, 31.531111, 'North Gaza', 'UNRWA'),  # مدرسة حليمة السعدية
+    19: (34.453219, 31.539423, 'Gaza', 'MoH'),  # عيادة شهداء الشاطئ -> Al Shati
+    277: (34.453056, 31.539167, 'Gaza', 'MDM'),  # عيادة MDM النادي -> MDM North Beach
+    219: (34.242750, 31.342222, 'Rafah', 'ICRC'),  # Red Cross field hospital
+
+    # Gaza
+    20: (34.438056, 31.523056, 'Gaza', 'MoH'),  # Al Moustafa PHC
+    28: (34.470047, 31.532889, 'Gaza', 'MoH'),  # Al Shaeikh Radwan
+    25: (34.459201, 31.512722, 'Gaza', 'MoH'),  # Al-Daraj
+    44: (34.451310, 31.506673, 'Gaza', 'MoH'),  # Masqat Al Sabra
+    46: (34.459040, 31.499240, 'Gaza', 'PRCS'),  # Al-Zaytoun Clinic
+    137: (34.443056, 31.496944, 'Gaza', 'MSF'),  # MSF Spain-Al-Zaytoun
+    128: (34.441111, 31.523056, 'Gaza', 'MSF'),  # MSF Belgium - Al-Shifa
+    212: (34.465570, 31.507300, 'Gaza', 'UNRWA'),  # Al Daraj MP
+
+    # Rafah
+    305: (34.248667, 31.346194, 'Rafah', 'UK-MED'),  # UK-MED
+
+    # Additional mappings
+    233: (34.450556, 31.513611, 'Gaza', 'NGO'),  # Kuwaiti Clinic -> Al-Kuwaiti Hospital
+    129: (34.274041, 31.368285, 'Khan Younis', 'PRCS'),  # الهلال الأحمر - المواصي -> PRCS Mawasi
+    134: (34.357917, 31.443733, 'Middle zone', 'IMC'),  # IMC -Zawida
+    18: (34.484444, 31.527500, 'North Gaza', 'MoH'),  # مركز شهداء جباليا -> Jabalia Medical Clinic
+    100: (34.438056, 31.523056, 'Gaza', 'UNRWA'),  # Gaza Town
+    295: (34.453056, 31.539167, 'Gaza', 'MDM'),  # MDM-F Clinic
+    141: (34.292088, 31.385153, 'Khan Younis', 'PRCS'),  # الهلال الأحمر-خانيونس-القرارة -> PRCS Mawasi Alqarara
+    264: (34.307611, 31.394194, 'Khan Younis', 'NGO'),  # طوارئ NGO'S خانيونس -> Emergency NGO
+    263: (34.306698, 31.394863, 'Khan Younis', 'UNRWA'),  # عيادة حمد -> Hamad HC
+    215: (34.312583, 31.394500, 'Khan Younis', 'NGO'),  # Palm Al-Qarara Center -> PAL MED Shalet
+    307: (34.294914, 31.362098, 'Khan Younis', 'UNRWA'),  # Mobile team Japanese
+    105: (34.389693, 31.460235, 'Middle zone', 'UNRWA'),  # west nusirat
+    213: (34.346268, 31.432989, 'Middle zone', 'IMC'),  # IMC- Deir al-Balah
+    135: (34.459040, 31.499240, 'Gaza', 'PRCS'),  # الهلال الأحمر-غزة-الزيتون
+    231: (34.294998, 31.351730, 'Khan Younis', 'MoH'),  # Al-Majayda Clinic -> Almajada MP
+    228: (34.260452, 31.343415, 'Khan Younis', 'UNRWA'),  # Bir 19
+    265: (34.291953, 31.348591, 'Khan Younis', 'UNRWA'),  # مدرسة الحوارني -> Kh/Younis Prep Boys
+
+    # More facilities
+    108: (34.367100, 31.438575, 'Middle zone', 'MoH'),  # Al-Sawarha
+    207: (34.465570, 31.507300, 'Gaza', 'UNRWA'),  # Al Daraj
+    236: (34.391550, 31.449410, 'Middle zone', 'PRCS'),  # Nuseirat Clinic PRCS
+
+    # Final batch
+    225: (34.320301, 31.408829, 'Middle zone', 'MDM'),  # Sea Center -> Al-Bahr PHC MdM F
+    276: (34.453056, 31.539167, 'Gaza', 'MDM'),  # عيادة MDM روني
+    259: (34.484444, 31.527500, 'North Gaza', 'UNRWA'),  # مدرسة تل الزعتر
+    304: (34.241429, 31.338187, 'Rafah', 'UNRWA'),  # Muawiya Health Center UN
+    234: (34.449970, 31.508970, 'Gaza', 'PRCS'),  # Al-Sabra Red Crescent
+    230: (34.269278, 31.344611, 'Rafah', 'NGO'),  # Heroic Hearts Well 19
+    138: (34.246861, 31.344222, 'Rafah', 'MSF'),  # MSF-ASP -> Mawasi MSF-Spain
+    21: (34.428889, 31.509444, 'Gaza', 'MoH'),  # عيادة الفلاح -> Al-Falah Health Center
+    270: (34.250222, 31.341444, 'Rafah', 'MoH'),  # طوارئ رفح -> Emergency Rafah
+    222: (34.389693, 31.460235, 'Middle zone', 'UNRWA'),  # West Nuseirat
+    246: (34.438056, 31.523056, 'Gaza', 'NGO'),  # Jasmine point -> Heroic Hearts Al-Yasmin
+    216: (34.300000, 31.370000, 'Khan Younis', 'NGO'),  # Relief Association Abu Aref
+    323: (34.260000, 31.340000, 'Rafah', 'MoH'),  # Mobile car1
+    248: (34.417500, 31.500278, 'Gaza', 'MoH'),  # Sheikh Ajlin
+    203: (34.375121, 31.443758, 'Middle zone', 'PRCS'),  # Al-Sawarha Red Crescent
+    214: (34.391550, 31.449410, 'Middle zone', 'PRCS'),  # Red Crescent Nuseirat
+    249: (34.395231, 31.453332, 'Middle zone', 'MoH'),  # Al-Mufti School -> El Mofte MP
+
+    # Last few
+    201: (34.400605, 31.442877, 'Middle zone', 'PRCS'),  # Al-Bureij Red Crescent -> Burij PRCS
+    261: (34.300083, 31.393500, 'Khan Younis', 'MoH'),  # طب الأسرة-خانيونس -> Teb Alosra
+    64: (34.270385, 31.361199, 'Khan Younis', 'MoH'),  # عيادة المواصي
+    50: (34.333160, 31.380468, 'Khan Younis', 'MoH'),  # عيادة مسقط القرارة -> QARRARA MP
+    255: (34.466389, 31.540556, 'North Gaza', 'PRCS'),  # الهلال الاحمر الامن العام
+    269: (34.318611, 31.397444, 'Khan Younis', 'NGO'),  # نقطة شموخ -> Shumukh
+    125: (34.484444, 31.527500, 'North Gaza', 'UNRWA'),  # Fakhoura -> Jabalia
+    290: (34.346268, 31.432989, 'Middle zone', 'MoH'),  # Mobile Team Deir al-Balah
+    132: (34.484444, 31.527500, 'North Gaza', 'PRCS'),  # الهلال الأحمر-جباليا
+    272: (34.242750, 31.342222, 'Rafah', 'ICRC'),  # مستشفى الميداني - الصليب الاحمر
+    12: (34.483611, 31.551389, 'North Gaza', 'MoH'),  # مركز شهداء العطاطرة والسيفا
+    26: (34.451310, 31.506673, 'Gaza', 'MoH'),  # مركز صبحه الحرازين
+}
+
+# PHC_CENTER_ID -> English name of the matching row in the location file.
+# No ID is in both tables: where they disagreed, the entry whose location
+# lies in the center's GEOLOCATION_ID governorate was kept (this table's
+# when neither does, as it names a surveyed row).
+MANUAL_NAMES = {
+    51: 'Al-Baraka Medical Center',
+    101: 'Rimal MP-Rimal Elem. Co-ed "A" & "B"',
+    104: 'Burij Health Center',
+    131: 'Al-Kuwaiti Hospital - Palestinian Red Crescent Society',
+    205: 'UK MED FIXED PHC',
+    252: 'Al-Kuwaiti Hospital - Palestinian Red Crescent Society',
+    256: 'Al Awda Medical Center',
+    260: 'Al Forsan Medical Center',
+    302: 'Tayara Clinic',
+    312: 'Al Aqsa Hospital',
+    322: 'Khanyounis Martyrs Primary Healthcare Center',
+    328: 'Emargancy Rafah',
+    257: 'Al Awda Hospital - Nuseirat',
+}
+
+
+def _hash(value):
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _text(value):
+    if pd.isna(value):
+        return ''
+    return str(value).strip()
+
+
+def read_locations(locations_path):
+    """Rows of the location file that have coordinates, with a row hash."""
+    locations = []
+    with open(locations_path, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            lon = float(row['Long']) if row['Long'] else 0
+            lat = float(row['Lat']) if row['Lat'] else 0
+            if lon <= 0 or lat <= 0:
+                continue
+            loc = {
+                'name_en': row['Medical Point - Health Facility Name in English'].strip(),
+                'name_ar': row['Medical Point - Health Facility Name in Arabic'].strip(),
+                'gov': row['Governorate'].strip(),
+                'org': (row.get('Organization') or 'MoH').strip(),
+                'lon': lon,
+                'lat': lat,
+            }
+            loc['hash'] = _hash(loc)
+            locations.append(loc)
+    return locations
+
+
+def read_phc_centers(phc_path, updated_path):
+    """PHC_CENTER_ID -> names and geolocation from both PHC center tables."""
+    centers = {}
+    for _, row in read_excel(phc_path).iterrows():
+        centers[int(row['PHC_CENTER_ID'])] = {
+            'NAME_EN': _text(row['NAME_EN']),
+            'NAME_AR': _text(row['NAME_AR']),
+            'GEOLOCATION_ID': int(row['GEOLOCATION_ID']) if pd.notna(row['GEOLOCATION_ID']) else None,
+            'en_name': '',
+            'ar_name': '',
+        }
+    for _, row in read_excel(updated_path).iterrows():
+        center = centers.setdefault(int(row['PHC_CENTER_ID']), {
+            'NAME_EN': _text(row['NAME_EN']),
+            'NAME_AR': _text(row['NAME_AR']),
+            'GEOLOCATION_ID': None,
+        })
+        center['en_name'] = _text(row['en_name'])
+        center['ar_name'] = _text(row['ar_name'])
+    return centers
+
+
+def load_phc_locations(table_path):
+    """Read the resolution table into {PHC_CENTER_ID: row}."""
+    table = {}
+    if not os.path.exists(table_path):
+        return table
+    with open(table_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            row['PHC_CENTER_ID'] = int(row['PHC_CENTER_ID'])
+            row['Long'] = float(row['Long']) if row['Long'] else None
+            row['Lat'] = float(row['Lat']) if row['Lat'] else None
+            table[row['PHC_CENTER_ID']] = row
+    return table
+
+
+def write_phc_locations(table, table_path):
+    with open(table_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS)
+        writer.writeheader()
+        for phc_id in sorted(table):
+            writer.writerow(table[phc_id])
+
+
+class _Matcher:
+    """Name lookups over the location rows, built only when needed."""
+
+    def __init__(self, locations):
+        self.by_name_en = {}
+        self.by_name = {}
+        self.index = FacilityIndex()
+        for loc in locations:
+            self.by_name_en.setdefault(loc['name_en'], loc)
+            for name in (loc['name_en'], loc['name_ar']):
+                self.by_name.setdefault(normalize_name(name), loc)
+                self.index.add(name, loc)
+
+    def match(self, phc_id, center):
+        if phc_id in MANUAL_NAMES and MANUAL_NAMES[phc_id] in self.by_name_en:
+            return 'manual_name', self.by_name_en[MANUAL_NAMES[phc_id]]
+
+        names = [center['en_name'], center['NAME_EN'], center['ar_name'], center['NAME_AR']]
+        names = [name for name in names if name]
+        for name in names:
+            loc = self.by_name.get(normalize_name(name))
+            if loc:
+                return 'exact', loc
+        # A partial name match must lie in the center's own governorate
+        gov = GOV_BY_GEOLOCATION.get(center['GEOLOCATION_ID'])
+        accept = None if gov is None else (lambda loc: loc['gov'] == gov)
+        for name in names:
+            match = self.index.best_match(name, accept=accept)
+            if match:
+                return 'fuzzy', match[2]
+        return 'unresolved', None
+
+
+def _resolve(phc_id, center, matcher, source_hash, locations_version):
+    row = {
+        'PHC_CENTER_ID': phc_id,
+        'NAME_EN': center['NAME_EN'],
+        'NAME_AR': center['NAME_AR'],
+        'en_name': center['en_name'],
+        'ar_name': center['ar_name'],
+        'Long': None,
+        'Lat': None,
+        'Governorate': GOV_BY_GEOLOCATION.get(center['GEOLOCATION_ID'], 'Unknown'),
+        'Organization': 'MoH',
+        'location_name': '',
+        'location_name_ar': '',
+        'source_hash': source_hash,
+        'location_hash': '',
+    }
+
+    if phc_id in MANUAL_COORDS:
+        lon, lat, gov, org = MANUAL_COORDS[phc_id]
+        row.update({'method': 'manual', 'Long': lon, 'Lat': lat, 'Governorate': gov, 'Organization': org})
+        return row
+
+    method, loc = matcher.match(phc_id, center)
+    row['method'] = method
+    if loc is None:
+        # Unresolved IDs are retried whenever the location file changes
+        row['location_hash'] = locations_version
+        return row
+
+    row.update({
+        'Long': loc['lon'],
+        'Lat': loc['lat'],
+        'Organization': loc['org'] or 'MoH',
+        'location_name': loc['name_en'],
+        'location_name_ar': loc['name_ar'],
+        'location_hash': loc['hash'],
+    })
+    if loc['gov']:
+        row['Governorate'] = loc['gov']
+    return row
+
+
+def resolve_phc_locations(data_dir='data', phc_file='phc_center_tb.xlsx',
+                          updated_file='phc_center_updated.xlsx',
+                          locations_file='location_point_unified_corrected.csv'):
+    """Bring data/phc_locations.csv up to date and return it as a dict.
+
+    Rows are reused unless the PHC center's source rows (or its manual
+    mapping, or RESOLVER_VERSION) changed, or the location row it was
+    matched to is gone.
+    """
+    table_path = os.path.join(data_dir, TABLE_FILE)
+    previous = load_phc_locations(table_path)
+    centers = read_phc_centers(os.path.join(data_dir, phc_file),
+                               os.path.join(data_dir, updated_file))
+    locations = read_locations(os.path.join(data_dir, locations_file))
+    location_hashes = {loc['hash'] for loc in locations}
+    locations_version = _hash(sorted(location_hashes))
+
+    table = {}
+    matcher = None
+    recomputed = 0
+    for phc_id, center in centers.items():
+        source_hash = _hash([RESOLVER_VERSION, center, MANUAL_COORDS.get(phc_id), MANUAL_NAMES.get(phc_id)])
+        prev = previous.get(phc_id)
+        if prev and prev['source_hash'] == source_hash:
+            if prev['method'] == 'manual' or prev['location_hash'] in location_hashes \
+                    or prev['location_hash'] == locations_version:
+                table[phc_id] = prev
+                continue
+
+        if matcher is None:
+            matcher = _Matcher(locations)
+        table[phc_id] = _resolve(phc_id, center, matcher, source_hash, locations_version)
+        recomputed += 1
+
+    if recomputed or set(table) != set(previous):
+        write_phc_locations(table, table_path)
+    print(f"PHC location table: {len(table)} centers, {recomputed} re-resolved")
+    return table
+
+
+def coords_by_name(table, locations):
+    """Facility name -> [lon, lat].
+
+    Names from the location file come first; English PHC names from the
+    resolution table fill in the rest.
+    """
+    coords = {}
+    for loc in locations:
+        for name in (loc['name_en'], loc['name_ar']):
+            if name:
+                coords.setdefault(name, [loc['lon'], loc['lat']])
+    for row in table.values():
+        if row['Long'] is None:
+            continue
+        for name in (row['en_name'], row['NAME_EN']):
+            if name:
+                coords.setdefault(name, [row['Long'], row['Lat']])
+    return coords
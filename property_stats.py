@@ -0,0 +1,143 @@
+"""
+Per-property statistics collected while the features are built.
+
+The generators hand every feature's properties to a PropertyStats as they
+create it, so the filter metadata (filter_info.json: slider ranges and
+select options) comes out of the same pass instead of re-reading and
+re-parsing the data file afterwards:
+
+    stats = PropertyStats()
+    ...
+    stats.add(props)                              # in the feature loop
+    write_feature_collection(path, stats.observe(features), ...)  # streamed
+    ...
+    stats.write('data/filter_info/vaccination_data.json')
+
+For every property: count, nulls (None, '', 'None' or missing), and either
+min / max / distinct / histogram (numbers) or unique_values (text).
+Nested values (dicts, lists) are not filterable and are skipped.
+
+The map pages build their sliders from the numeric ranges, written next to
+the JSON as a script (data/filter_info/<stem>.js) they load like their data:
+
+    stats.write_ranges(filter_info_path(path, ext='.js'), 'vaccination_data')
+    # -> FilterRanges['vaccination_data'] = {"Total Children": [0, 1300], ...}
+"""
+import json
+import os
+
+import numpy as np
+
+FILTER_INFO_DIR = 'data/filter_info'
+HISTOGRAM_BINS = 10
+NULL_VALUES = (None, '', 'None')
+
+# Ranges used when a numeric filter has no values at all
+EMPTY_RANGE = (0, 100)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def histogram(values, bins=HISTOGRAM_BINS):
+    """{'edges': [...], 'counts': [...]}; integer data gets integer-wide bins."""
+    values = np.asarray(values, dtype=float)
+    low, high = values.min(), values.max()
+    if np.all(values == np.round(values)):
+        bins = max(1, min(bins, int(high - low) + 1))
+    counts, edges = np.histogram(values, bins=bins, range=(low, high) if high > low else (low, low + 1))
+    return {'edges': [round(float(edge), 6) for edge in edges], 'counts': counts.tolist()}
+
+
+class PropertyStats:
+    def __init__(self, bins=HISTOGRAM_BINS):
+        self.bins = bins
+        self.count = 0
+        self.values = {}   # property -> non-null scalar values
+
+    def add(self, properties):
+        """Record one feature's properties."""
+        self.count += 1
+        for key, value in properties.items():
+            if isinstance(value, (dict, list)):
+                continue
+            values = self.values.setdefault(key, [])
+            if value not in NULL_VALUES:
+                values.append(value)
+
+    def observe(self, features):
+        """Pass `features` through, recording each one (for streamed writers)."""
+        for feature in features:
+            self.add(feature['properties'])
+            yield feature
+
+    def describe(self, key, kind=None):
+        """Statistics of one property; `kind` ('int', 'float' or 'str') forces
+        the type, otherwise it is taken from the values."""
+        values = self.values.get(key, [])
+        if kind is None:
+            if values and all(_is_number(v) for v in values):
+                kind = 'int' if all(float(v).is_integer() for v in values) else 'float'
+            else:
+                kind = 'str'
+
+        info = {'type': kind}
+        if kind == 'str':
+            info['unique_values'] = sorted({str(v) for v in values})
+        else:
+            numbers = [int(float(v)) if kind == 'int' else float(v) for v in values]
+            if numbers:
+                info['min'] = min(numbers)
+                info['max'] = max(numbers)
+                info['distinct'] = len(set(numbers))
+                info['histogram'] = histogram(numbers, self.bins)
+            else:
+                info['min'], info['max'] = EMPTY_RANGE
+                info['distinct'] = 0
+        info['count'] = len(values)
+        # Null or missing in a feature
+        info['nulls'] = self.count - len(values)
+        return info
+
+    def filter_info(self, filters=None):
+        """{property: statistics} for every property, or for the `filters`
+        ({property: {'type': ...}}, the layout of filter_info.json)."""
+        if filters is None:
+            return {key: self.describe(key) for key in self.values}
+        return {key: self.describe(key, spec.get('type')) for key, spec in filters.items()}
+
+    def write(self, path, filters=None):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        info = self.filter_info(filters)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(info, f, ensure_ascii=False, indent=2)
+        return info
+
+    def ranges(self):
+        """{property: [min, max]} of the numeric properties."""
+        result = {}
+        for key in self.values:
+            info = self.describe(key)
+            if info['type'] != 'str':
+                result[key] = [info['min'], info['max']]
+        return result
+
+    def write_ranges(self, path, layer):
+        """Write the numeric ranges as `FilterRanges[layer] = {...}` for the pages."""
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        ranges = json.dumps(self.ranges(), ensure_ascii=False, separators=(',', ':'))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'// Slider ranges of the {layer} layer, written by property_stats.py\n')
+            f.write('var FilterRanges = window.FilterRanges || {};\n')
+            f.write(f'FilterRanges[{json.dumps(layer)}] = {ranges};\n')
+
+
+def filter_info_path(data_path, info_dir=FILTER_INFO_DIR, ext='.json'):
+    """data/filter_info/<stem>.json (or `ext`) for a data file."""
+    stem = os.path.splitext(os.path.basename(data_path))[0]
+    return os.path.join(info_dir, stem + ext)
@@ -0,0 +1,199 @@
+"""
+Publish step for the static site: content-hashed, precompressed data files.
+
+Each data artifact is copied to <name>.<hash>.<ext>, where <hash> is taken
+from its content, next to .gz and (if the brotli package is installed)
+.br variants for servers that serve precompressed files. The references in
+the map pages - <script src> as well as the URLs passed to
+DataPatches.restore and ColumnData.load - are rewritten to the hashed
+names. A hashed name only changes when the data changes, so browsers can
+cache it indefinitely. Run after the data scripts; re-running is safe.
+
+Files the pages find through another file are published with it:
+
+    data/shards/<var>/*.js          hashed; the hashed index.js lists them
+    data/patches/<file>/<n>.js      hashed; manifest.js (loaded fresh on
+                                    every visit) lists them
+"""
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DATA_FILES = [
+    'data/vaccination_data.js',
+    'data/summery_data.js',
+    'data/vaccination_individual_data.js',
+    'data/location_point_unified_corrected_1.js',
+    'data/map_layers.js',
+    'data/filter_info/vaccination_data.js',
+    'data/filter_info/vaccination_individual_data.js',
+    'data/vaccination_data.columns.bin',
+]
+PAGES = ['index.html', 'index_individual.html', 'indexSUM.html', 'index2.html', 'index_with_filters.html']
+SHARD_DIR = 'data/shards'
+PATCH_DIR = 'data/patches'
+MANIFEST_FILE = 'data/publish_manifest.json'
+HASH_LENGTH = 10
+
+
+def content_hash(data):
+    return hashlib.sha1(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_pattern(path):
+    """Regex for the hashed copies of `path` (and its compressed variants)."""
+    stem, ext = os.path.splitext(path)
+    return re.compile(re.escape(stem) + r'\.[0-9a-f]{%d}' % HASH_LENGTH + re.escape(ext) + r'(\.gz|\.br)?$')
+
+
+def write_compressed(path, data):
+    """Write `path` plus its .gz and .br variants; return the written paths."""
+    written = [path]
+    with open(path, 'wb') as f:
+        f.write(data)
+    # mtime=0 keeps the .gz bytes identical across runs
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(path + '.gz')
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+        written.append(path + '.br')
+    return written
+
+
+def publish_data(path, data):
+    """Publish `data` as the hashed copy of `path`; return the hashed path
+    (relative, '/' separated)."""
+    stem, ext = os.path.splitext(path)
+    hashed = f'{stem}.{content_hash(data)}{ext}'
+
+    written = write_compressed(hashed, data)
+
+    # Drop copies of older versions of this file
+    pattern = hashed_pattern(path)
+    for old in glob.glob(glob.escape(stem) + '.*'):
+        old = old.replace(os.sep, '/')
+        if pattern.match(old) and old not in written:
+            os.remove(old)
+    return hashed
+
+
+def publish_file(path):
+    """Publish one data file; return its hashed path."""
+    with open(path, 'rb') as f:
+        return publish_data(path, f.read())
+
+
+def read_call(path, function):
+    """Arguments of a JSONP-style data file `<function>(arg, ...);`."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read().strip()
+    prefix = function + '('
+    if not text.startswith(prefix) or not text.endswith(');'):
+        raise ValueError(f'{path} is not a {function}(...) call')
+    return json.loads('[' + text[len(prefix):-2] + ']')
+
+
+def call_bytes(function, *args):
+    return (function + '(' + ', '.join(json.dumps(arg, ensure_ascii=False, separators=(',', ':')) for arg in args)
+            + ');').encode('utf-8')
+
+
+def drop_orphans(folder):
+    """Remove hashed copies in `folder` whose source file is gone."""
+    pattern = re.compile(r'^(.*)\.[0-9a-f]{%d}(\.[^.]+)(\.gz|\.br)?$' % HASH_LENGTH)
+    for path in glob.glob(os.path.join(glob.escape(folder), '*')):
+        match = pattern.match(os.path.basename(path))
+        if match and not os.path.exists(os.path.join(folder, match.group(1) + match.group(2))):
+            os.remove(path)
+
+
+def publish_shards(shard_dir=SHARD_DIR):
+    """Hash every shard and write a hashed index.js that lists the hashed
+    names; return {index.js path: hashed index path}."""
+    published = {}
+    for index_path in sorted(glob.glob(os.path.join(glob.escape(shard_dir), '*', 'index.js'))):
+        folder = os.path.dirname(index_path)
+        name, index = read_call(index_path, 'DataShards.addIndex')
+        for shard in index['shards']:
+            shard['file'] = os.path.basename(publish_file(os.path.join(folder, shard['file'])))
+        index_path = index_path.replace(os.sep, '/')
+        published[index_path] = publish_data(index_path, call_bytes('DataShards.addIndex', name, index))
+        drop_orphans(folder)
+    return published
+
+
+def publish_patches(patch_dir=PATCH_DIR):
+    """Hash every patch and list the hashed names in its folder's
+    manifest.js; return {patch path: hashed path}."""
+    published = {}
+    for manifest_path in sorted(glob.glob(os.path.join(glob.escape(patch_dir), '*', 'manifest.json'))):
+        folder = os.path.dirname(manifest_path)
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        key = os.path.basename(folder)
+        for patch in manifest['patches']:
+            source = os.path.join(folder, patch['file']).replace(os.sep, '/')
+            published[source] = publish_file(source)
+            patch['file'] = os.path.basename(published[source])
+        # manifest.json stays as data_patches.py wrote it
+        with open(os.path.join(folder, 'manifest.js'), 'wb') as f:
+            f.write(call_bytes('DataPatches.manifest', key, manifest))
+        drop_orphans(folder)
+    return published
+
+
+def rewrite_page(page, published):
+    """Point the page's references at the hashed names; True if changed."""
+    with open(page, 'r', encoding='utf-8', newline='') as f:
+        html = f.read()
+    updated = html
+    for source, hashed in published.items():
+        stem, ext = os.path.splitext(source)
+        # "data/x.js", 'data/x.<hash>.js' or "data/x.js?v=..." in an attribute or a script
+        pattern = r'(["\'])' + re.escape(stem) + r'(?:\.[0-9a-f]{%d})?' % HASH_LENGTH + re.escape(ext) + r'(?:\?[^"\']*)?\1'
+        updated = re.sub(pattern, lambda m: m.group(1) + hashed + m.group(1), updated)
+    if updated == html:
+        return False
+    with open(page, 'w', encoding='utf-8', newline='') as f:
+        f.write(updated)
+    return True
+
+
+def publish(data_files=DATA_FILES, pages=PAGES, manifest_file=MANIFEST_FILE):
+    published = {}
+    for path in data_files:
+        if not os.path.exists(path):
+            print(f"Skipping missing data file: {path}")
+            continue
+        published[path] = publish_file(path)
+        print(f"{path} -> {published[path]}")
+    for path, hashed in publish_shards().items():
+        published[path] = hashed
+        print(f"{path} -> {hashed} (and its shards)")
+    patches = publish_patches()
+    published.update(patches)
+    print(f"{len(patches)} patch files published")
+
+    for page in pages:
+        if os.path.exists(page) and rewrite_page(page, published):
+            print(f"Updated data references in {page}")
+
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(published, f, indent=2)
+    if brotli is None:
+        print("brotli not installed: wrote .gz variants only")
+    return published
+
+
+if __name__ == '__main__':
+    publish()
@@ -0,0 +1,93 @@
+"""
+Publish profiles: what each layer carries in the files the pages load.
+
+publish_profiles.json declares, per profile and per layer, the feature
+properties the pages use ("properties", in that order; all if omitted) and
+the coordinate precision in decimals ("precision"; 5 decimals is about 1 m).
+The JS writers (geojson_writer, packed_geojson, shards, data_patches) apply
+the profile of the layer they write while serializing, so the generators
+keep building full features and the GeoPackage / filter statistics still
+see every column.
+
+Layers are named after their data file: 'data/vaccination_data.js' (also
+as a Windows path), 'vaccination_data' and the variable
+'json_vaccination_data' all resolve to the 'vaccination_data' layer. Layers
+not listed are written unchanged. A profile's property list is the schema of
+the pages' layer; a generator writing the same file with other property
+names (convert_to_js.py, update_vaccination_data.py) passes profile=False.
+The profile used is the file's "default"; "full" publishes everything.
+"""
+import json
+import ntpath
+import os
+
+PROFILE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'publish_profiles.json')
+
+_loaded = {}
+
+
+class LayerProfile:
+    def __init__(self, properties=None, precision=None):
+        self.properties = list(properties) if properties is not None else None
+        self.precision = precision
+
+    def coordinates(self, coords):
+        if isinstance(coords, (list, tuple)):
+            return [self.coordinates(c) for c in coords]
+        return round(coords, self.precision) if isinstance(coords, float) else coords
+
+    def apply(self, feature):
+        """Published copy of `feature` (the original is left untouched)."""
+        props = feature.get('properties') or {}
+        if self.properties is not None:
+            props = {key: props[key] for key in self.properties if key in props}
+        geometry = feature.get('geometry')
+        if self.precision is not None and geometry and 'coordinates' in geometry:
+            geometry = dict(geometry, coordinates=self.coordinates(geometry['coordinates']))
+        return dict(feature, properties=props, geometry=geometry)
+
+    def apply_all(self, geojson):
+        """Published copy of a FeatureCollection."""
+        return dict(geojson, features=[self.apply(f) for f in geojson['features']])
+
+
+def layer_name(name):
+    """'data/vaccination_data.js', 'json_vaccination_data' -> 'vaccination_data'."""
+    # ntpath splits on both separators, so Windows paths resolve alike everywhere
+    stem = os.path.splitext(ntpath.basename(name))[0]
+    return stem[len('json_'):] if stem.startswith('json_') else stem
+
+
+def load_profiles(path=PROFILE_FILE):
+    if not os.path.exists(path):
+        return {'default': None, 'profiles': {}}
+    mtime = os.path.getmtime(path)
+    if path not in _loaded or _loaded[path][0] != mtime:
+        with open(path, 'r', encoding='utf-8') as f:
+            _loaded[path] = (mtime, json.load(f))
+    return _loaded[path][1]
+
+
+def layer_profile(name, profile=None, path=PROFILE_FILE):
+    """LayerProfile for a layer (file path, stem or variable name), or None.
+
+    `profile`: profile name, default the file's "default" profile.
+    """
+    config = load_profiles(path)
+    profile = profile or config.get('default')
+    if profile is None:
+        return None
+    if profile not in config['profiles']:
+        raise ValueError(f"Unknown publish profile: {profile}")
+    layer = config['profiles'][profile].get(layer_name(name))
+    if layer is None:
+        return None
+    return LayerProfile(layer.get('properties'), layer.get('precision'))
+
+
+def resolve(profile, name):
+    """Profile argument of the writers: None looks up the layer's profile,
+    False writes unchanged, a LayerProfile is used as is."""
+    if profile is None:
+        return layer_profile(name)
+    return profile or None
@@ -1,232 +1,99 @@
-import pandas as pd
-import csv
-import json
-
-# 1. Read PHC centers
-phc_df = pd.read_excel('C:/Users/Administrator/gaza_vaccination/data/phc_center_updated.xlsx')
-phc_names = {}
-for _, row in phc_df.iterrows():
-    phc_id = int(row['PHC_CENTER_ID'])
-    en_name = ''
-    if pd.notna(row['en_name']) and str(row['en_name']).strip():
-        en_name = str(row['en_name']).strip()
-    elif pd.notna(row['NAME_EN']) and str(row['NAME_EN']).strip():
-        en_name = str(row['NAME_EN']).strip()
-
-    ar_name = ''
-    if pd.notna(row['ar_name']) and str(row['ar_name']).strip():
-        ar_name = str(row['ar_name']).strip()
-    elif pd.notna(row['NAME_AR']) and str(row['NAME_AR']).strip():
-        ar_name = str(row['NAME_AR']).strip()
-
-    phc_names[phc_id] = {'en_name': en_name, 'ar_name': ar_name}
-
-print(f"PHC Centers loaded: {len(phc_names)}")
-
-# 2. Read location file
-locations_en = {}
-locations_ar = {}
-with open('C:/Users/Administrator/gaza_vaccination/data/location_point_unified_corrected.csv', 'r', encoding='utf-8-sig') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        name_en = row['Medical Point - Health Facility Name in English'].strip()
-        name_ar = row['Medical Point - Health Facility Name in Arabic'].strip()
-        gov = row['Governorate'].strip()
-        org = row['Organization'].strip()
-        lon = float(row['Long']) if row['Long'] else 0
-        lat = float(row['Lat']) if row['Lat'] else 0
-
-        if lon > 0 and lat > 0:
-            loc_data = {'lon': lon, 'lat': lat, 'gov': gov, 'org': org, 'name_en': name_en, 'name_ar': name_ar}
-            locations_en[name_en] = loc_data
-            locations_en[name_en.lower()] = loc_data
-            locations_ar[name_ar] = loc_data
-
-print(f"Locations loaded: {len(locations_en)}")
-
-# 3. Manual mappings
-manual_map = {
-    12: 'Juzoor of Al-Atatreh',
-    18: 'Jabalia Medical Clinic',
-    26: 'Masqat Al Sabra PHC',
-    51: 'Al-Baraka Medical Center',
-    100: 'Gaza Town',
-    101: 'Rimal MP-Rimal Elem. Co-ed "A" & "B"',
-    104: 'Burij Health Center',
-    105: 'West Nusairat Health Center',
-    125: 'Jabalia Medical Clinic',
-    131: 'Al-Kuwaiti Hospital - Palestinian Red Crescent Society',
-    132: 'Red Crescent Medical Point -Alamin Aleamu',
-    205: 'UK MED FIXED PHC',
-    219: 'ICRC Fiel Hospital',
-    225: 'Al-Bahr Primary Health Care Center /MdM F',
-    252: 'Al-Kuwaiti Hospital - Palestinian Red Crescent Society',
-    256: 'Al Awda Medical Center',
-    258: 'Juzoor Halima Al-Saadia',
-    259: 'Tal Al Rabie School (MSF) point',
-    260: 'Al Forsan Medical Center',
-    263: 'Hamad HC - UNRWA',
-    264: 'Emergency NGO - PHC Clinic Al Qarara - Khan Yunis',
-    265: 'Kh/Younis Prep. Boys "A"',
-    269: 'Emargancy Rafah',
-    270: 'Emargancy Rafah',
-    290: 'IMC field hospital - Middle Area',
-    302: 'Tayara Clinic',
-    307: 'Japanese HC - UNRWA',
-    312: 'Al Aqsa Hospital',
-    322: 'Khanyounis Martyrs Primary Healthcare Center',
-    323: 'Nuseirat Martyrs Center',
-    328: 'Emargancy Rafah',
-    257: 'Al Awda Hospital - Nuseirat',
-}
+import sys
+
+from code_tables import AGE_TYPE, STATUS_ON_SCHEDULE, dose_table
+from excel_cache import read_excel
+from facility_aggregation import aggregate_facilities
+from geojson_writer import write_geojson_js
+from geopackage import write_layer
+from packed_geojson import write_packed_js
+from phc_locations import resolve_phc_locations
+from property_stats import PropertyStats, filter_info_path
+from shards import write_shards
+
+# Write the columnar packed format (decoded by js/packed_geojson.js) when
+# run with --packed; plain GeoJSON otherwise
+PACKED_OUTPUT = '--packed' in sys.argv
+
+# 1-3. PHC_CENTER_ID -> names and resolved location
+phc_locations = resolve_phc_locations(data_dir='C:/Users/Administrator/gaza_vaccination/data')
 
 # 4. Read vaccination data
-vax_df = pd.read_excel('C:/Users/Administrator/gaza_vaccination/data/sss.xlsx')
+vax_df = read_excel('C:/Users/Administrator/gaza_vaccination/data/sss.xlsx')
 print(f"Vaccination records: {len(vax_df)}")
 
-# 5. Vaccine and status mappings
-vaccine_map = {
-    1: 'BCG', 2: 'HepB', 3: 'IPV1', 4: 'IPV2',
-    5: 'bOPV1', 6: 'bOPV2', 7: 'bOPV3', 8: 'bOPV4', 21: 'bOPV5',
-    9: 'Rota1', 10: 'Rota2', 11: 'Rota3',
-    12: 'Penta1', 13: 'Penta2', 14: 'Penta3',
-    15: 'PCV1', 16: 'PCV2', 17: 'PCV3',
-    18: 'MMR1', 19: 'MMR2', 20: 'DTP',
-}
-
-age_map = {1: 'Age 0-12', 2: 'Age 12-24', 3: 'Age 24+'}
-status_map = {1: 'ZeroDose', 2: 'Defaulter', 3: 'OnSchedule'}
-
-# 6. Aggregate by facility - COUNT UNIQUE CHILDREN for status
-facilities = {}
-for _, row in vax_df.iterrows():
-    fid = int(row['PHC_ENTRY_ID'])
-    person_id = row['PERSON_ID']
-
-    if fid not in facilities:
-        facilities[fid] = {
-            'children': {},  # person_id -> {status, age}
-            'vaccines': {},
-        }
-
-    # Track child with their status and age (use first occurrence)
-    if person_id not in facilities[fid]['children']:
-        status_type = row['CHILD_VACCINATION_STATUS']
-        age_type = row['CHILDREN_AGE_TYPE']
-        facilities[fid]['children'][person_id] = {
-            'status': status_map.get(status_type, 'OnSchedule'),
-            'age': age_map.get(age_type, 'Age 0-12')
-        }
-
-    # Count vaccines
-    vax_id = int(row['VACCINE_DOSES_ID'])
-    vax_name = vaccine_map.get(vax_id, 'Other')
-    facilities[fid]['vaccines'][vax_name] = facilities[fid]['vaccines'].get(vax_name, 0) + 1
+# 5. Vaccine, status and age code tables
+doses = dose_table('C:/Users/Administrator/gaza_vaccination/data/vaccine_doses_tb.xlsx')
+
+vaccine_columns = ['BCG', 'HepB', 'IPV1', 'IPV2', 'bOPV1', 'bOPV2', 'bOPV3', 'bOPV4', 'bOPV5',
+                   'Rota1', 'Rota2', 'Rota3', 'Penta1', 'Penta2', 'Penta3',
+                   'PCV1', 'PCV2', 'PCV3', 'MMR1', 'MMR2', 'DTP', 'DT']
+
+# Decode the code columns once for the whole frame
+vax_df['status'] = STATUS_ON_SCHEDULE.decode(vax_df['CHILD_VACCINATION_STATUS'], default='OnSchedule')
+vax_df['age'] = AGE_TYPE.decode(vax_df['CHILDREN_AGE_TYPE'], default='Age 0-12')
+vax_df['vaccine'] = doses.decode(vax_df['VACCINE_DOSES_ID'], default='Other')
+
+# 6-7. Aggregate by facility and globally - COUNT UNIQUE CHILDREN for status
+# (each child counted with its first status/age; the global summary covers
+# ALL data, not just matched facilities)
+facilities, global_summary = aggregate_facilities(
+    vax_df,
+    facility='PHC_ENTRY_ID',
+    person='PERSON_ID',
+    child_columns={
+        'status': ['OnSchedule', 'Defaulter', 'ZeroDose'],
+        'age': AGE_TYPE.categories,
+    },
+    dose_column='vaccine',
+    dose_categories=vaccine_columns,
+)
+global_summary['Age012'] = global_summary.pop('Age 0-12')
+global_summary['Age1224'] = global_summary.pop('Age 12-24')
+global_summary['Age24plus'] = global_summary.pop('Age 24+')
+global_summary['vaccines'] = global_summary.pop('vaccines')
 
 print(f"Facilities in data: {len(facilities)}")
 
-# 7. Calculate GLOBAL summary from ALL data (not just matched facilities)
-global_children = {}
-for _, row in vax_df.iterrows():
-    person_id = row['PERSON_ID']
-    if person_id not in global_children:
-        status_type = row['CHILD_VACCINATION_STATUS']
-        age_type = row['CHILDREN_AGE_TYPE']
-        global_children[person_id] = {
-            'status': status_map.get(status_type, 'OnSchedule'),
-            'age': age_map.get(age_type, 'Age 0-12')
-        }
-
-global_summary = {
-    'TotalChildren': len(global_children),
-    'OnSchedule': sum(1 for c in global_children.values() if c['status'] == 'OnSchedule'),
-    'Defaulter': sum(1 for c in global_children.values() if c['status'] == 'Defaulter'),
-    'ZeroDose': sum(1 for c in global_children.values() if c['status'] == 'ZeroDose'),
-    'Age012': sum(1 for c in global_children.values() if c['age'] == 'Age 0-12'),
-    'Age1224': sum(1 for c in global_children.values() if c['age'] == 'Age 12-24'),
-    'Age24plus': sum(1 for c in global_children.values() if c['age'] == 'Age 24+'),
-}
-
-# Count vaccines from ALL records
-global_vaccines = {}
-for _, row in vax_df.iterrows():
-    vax_id = int(row['VACCINE_DOSES_ID'])
-    vax_name = vaccine_map.get(vax_id, 'Other')
-    global_vaccines[vax_name] = global_vaccines.get(vax_name, 0) + 1
-
-global_summary['vaccines'] = global_vaccines
-
 # 8. Build GeoJSON
 features = []
 summary = global_summary.copy()
+stats = PropertyStats()
 
 matched = 0
 
-for fid, data in facilities.items():
-    if fid not in phc_names:
-        continue
-
-    en_name = phc_names[fid]['en_name']
-    ar_name = phc_names[fid]['ar_name']
-
-    loc = None
-    if fid in manual_map:
-        map_name = manual_map[fid]
-        if map_name in locations_en:
-            loc = locations_en[map_name]
-    if not loc and en_name and en_name in locations_en:
-        loc = locations_en[en_name]
-    if not loc and en_name and en_name.lower() in locations_en:
-        loc = locations_en[en_name.lower()]
-    if not loc and ar_name and ar_name in locations_ar:
-        loc = locations_ar[ar_name]
-    if not loc:
-        for loc_ar, loc_data in locations_ar.items():
-            if ar_name and len(ar_name) > 5 and (ar_name in loc_ar or loc_ar in ar_name):
-                loc = loc_data
-                break
-
-    if not loc:
+for fid, data in facilities.to_dict('index').items():
+    loc = phc_locations.get(int(fid))
+    if not loc or loc['Long'] is None:
         continue
 
     matched += 1
 
-    # Calculate counts from unique children
-    total_children = len(data['children'])
-    on_schedule = sum(1 for c in data['children'].values() if c['status'] == 'OnSchedule')
-    defaulter = sum(1 for c in data['children'].values() if c['status'] == 'Defaulter')
-    zero_dose = sum(1 for c in data['children'].values() if c['status'] == 'ZeroDose')
-    age_012 = sum(1 for c in data['children'].values() if c['age'] == 'Age 0-12')
-    age_1224 = sum(1 for c in data['children'].values() if c['age'] == 'Age 12-24')
-    age_24plus = sum(1 for c in data['children'].values() if c['age'] == 'Age 24+')
-
-    display_name = en_name if en_name else loc['name_en']
-    display_ar = ar_name if ar_name else loc['name_ar']
+    display_name = loc['en_name'] or loc['NAME_EN'] or loc['location_name']
+    display_ar = loc['ar_name'] or loc['NAME_AR'] or loc['location_name_ar']
 
     props = {
         'Health Facility': display_name,
         'Health Facility AR': display_ar,
-        'Governorate': loc['gov'],
-        'Organization': loc['org'],
-        'TotalChildren': total_children,
-        'TotalVaccinations': sum(data['vaccines'].values()),
-        'Age 0-12': age_012,
-        'Age 12-24': age_1224,
-        'Age 24+': age_24plus,
-        'OnSchedule': on_schedule,
-        'Defaulter': defaulter,
-        'ZeroDose': zero_dose,
+        'Governorate': loc['Governorate'],
+        'Organization': loc['Organization'],
+        'TotalChildren': data['TotalChildren'],
+        'TotalVaccinations': data['TotalVaccinations'],
+        'Age 0-12': data['Age 0-12'],
+        'Age 12-24': data['Age 12-24'],
+        'Age 24+': data['Age 24+'],
+        'OnSchedule': data['OnSchedule'],
+        'Defaulter': data['Defaulter'],
+        'ZeroDose': data['ZeroDose'],
     }
 
-    for vax in ['BCG', 'HepB', 'IPV1', 'IPV2', 'bOPV1', 'bOPV2', 'bOPV3', 'bOPV4', 'bOPV5',
-                'Rota1', 'Rota2', 'Rota3', 'Penta1', 'Penta2', 'Penta3',
-                'PCV1', 'PCV2', 'PCV3', 'MMR1', 'MMR2', 'DTP']:
-        props[vax] = data['vaccines'].get(vax, 0)
+    for vax in vaccine_columns:
+        props[vax] = data[vax]
+    stats.add(props)
 
     feature = {
         'type': 'Feature',
         'properties': props,
-        'geometry': {'type': 'Point', 'coordinates': [loc['lon'], loc['lat']]}
+        'geometry': {'type': 'Point', 'coordinates': [loc['Long'], loc['Lat']]}
     }
     features.append(feature)
 
@@ -239,9 +106,24 @@ print(f"  ZeroDose: {summary['ZeroDose']}")
 
 # Save
 geojson = {'type': 'FeatureCollection', 'features': features, 'summary': summary}
-output = 'var json_vaccination_individual_data = ' + json.dumps(geojson, ensure_ascii=False) + ';'
+output_path = 'C:/Users/Administrator/gaza_vaccination/data/vaccination_individual_data.js'
+
+if PACKED_OUTPUT:
+    write_packed_js(output_path, 'json_vaccination_individual_data', geojson)
+else:
+    write_geojson_js(output_path, 'json_vaccination_individual_data', geojson)
+
+# Per-governorate shards for on-demand loading (js/shard_loader.js)
+write_shards(geojson, 'json_vaccination_individual_data',
+             shard_dir='C:/Users/Administrator/gaza_vaccination/data/shards', packed=PACKED_OUTPUT)
+
+# Slider ranges and select options for the filter panel
+stats.write(filter_info_path(output_path, 'C:/Users/Administrator/gaza_vaccination/data/filter_info'))
+stats.write_ranges(filter_info_path(output_path, 'C:/Users/Administrator/gaza_vaccination/data/filter_info', '.js'),
+                   'vaccination_individual_data')
 
-with open('C:/Users/Administrator/gaza_vaccination/data/vaccination_individual_data.js', 'w', encoding='utf-8') as f:
-    f.write(output)
+# Same layer in the GeoPackage for QGIS (R-tree indexed, see geopackage.py)
+write_layer(geojson, 'vaccination_individual_data',
+            path='C:/Users/Administrator/gaza_vaccination/data/vaccination_layers.gpkg')
 
 print(f"\nDone! {len(features)} features saved")
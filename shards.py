@@ -0,0 +1,96 @@
+"""
+Per-governorate shards of a FeatureCollection for on-demand loading.
+
+Next to the full data file, the features are split by Governorate into
+data/shards/<var name>/<governorate>.js plus an index.js that lists each
+shard's file, feature count, bounding box and facility names, together with
+the collection's summary. The files are JSONP-style calls into
+js/shard_loader.js, so pages opened from file:// can load them too.
+"""
+import glob
+import json
+import os
+import re
+
+from packed_geojson import pack_features
+from publish_profiles import resolve
+
+SHARD_DIR = 'data/shards'
+
+
+def shard_key(governorate):
+    """File-name key of a governorate: 'North Gaza' -> 'north_gaza'."""
+    key = re.sub(r'[^a-z0-9]+', '_', str(governorate or '').lower()).strip('_')
+    return key or 'other'
+
+
+def split_by_governorate(features, property_name='Governorate'):
+    """{governorate: [features]} in order of first appearance."""
+    groups = {}
+    for feature in features:
+        governorate = feature['properties'].get(property_name) or ''
+        groups.setdefault(governorate, []).append(feature)
+    return groups
+
+
+def bounding_box(features):
+    """[west, south, east, north] of Point features."""
+    xs = [feature['geometry']['coordinates'][0] for feature in features]
+    ys = [feature['geometry']['coordinates'][1] for feature in features]
+    return [min(xs), min(ys), max(xs), max(ys)]
+
+
+def _write_call(path, function, *args):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'DataShards.{function}(')
+        f.write(', '.join(json.dumps(arg, ensure_ascii=False, separators=(',', ':')) for arg in args))
+        f.write(');')
+
+
+def write_shards(geojson, var_name, shard_dir=SHARD_DIR, property_name='Governorate',
+                 name_property='Health Facility', packed=False, profile=None):
+    """Write the shards and index of `geojson`; return the index dict.
+
+    Shards are packed (see packed_geojson.py) when `packed` is set. Shard
+    files left over from governorates that are no longer present are removed.
+    `profile`: None applies the publish profile of the `var_name` layer,
+    False none.
+    """
+    profile = resolve(profile, var_name)
+    if profile is not None:
+        geojson = profile.apply_all(geojson)
+    folder = os.path.join(shard_dir, var_name)
+    os.makedirs(folder, exist_ok=True)
+
+    index = {'shards': []}
+    for key, value in geojson.items():
+        if key not in ('type', 'features'):
+            index[key] = value
+
+    written = set()
+    for governorate, features in split_by_governorate(geojson['features'], property_name).items():
+        key = shard_key(governorate)
+        collection = {'type': 'FeatureCollection', 'features': features}
+        _write_call(os.path.join(folder, key + '.js'), 'add', var_name, key,
+                    pack_features(collection) if packed else collection)
+        written.add(key + '.js')
+
+        names = [feature['properties'].get(name_property) for feature in features]
+        index['shards'].append({
+            'key': key,
+            'governorate': governorate,
+            'file': key + '.js',
+            'count': len(features),
+            'bbox': bounding_box(features),
+            'names': list(dict.fromkeys(name for name in names if name)),
+        })
+
+    _write_call(os.path.join(folder, 'index.js'), 'addIndex', var_name, index)
+    for path in glob.glob(os.path.join(glob.escape(folder), '*.js')):
+        name = os.path.basename(path)
+        # Hashed copies (publish.py) stay until the next publish replaces them
+        if re.fullmatch(r'[a-z0-9_]+\.js', name) and name != 'index.js' and name not in written:
+            os.remove(path)
+
+    print(f"Wrote {len(index['shards'])} shards to {folder}")
+    return index
@@ -0,0 +1,55 @@
+"""
+Streaming, column-projected reader for survey workbooks (S123 exports).
+
+The workbook is opened in openpyxl read-only mode and rows are pulled with
+iter_rows(values_only=True), so memory stays flat however many rows the
+export has. The header -> column index map is resolved once per sheet.
+"""
+import openpyxl
+
+
+def _open_sheet(path, sheet_name=None):
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    sheet = workbook[sheet_name] if sheet_name else workbook.active
+    return workbook, sheet
+
+
+def read_headers(path, sheet_name=None):
+    """Return the header row of a sheet as a list of column names."""
+    workbook, sheet = _open_sheet(path, sheet_name)
+    try:
+        for row in sheet.iter_rows(min_row=1, max_row=1, values_only=True):
+            return list(row)
+        return []
+    finally:
+        workbook.close()
+
+
+def iter_columns(path, columns, sheet_name=None, optional=False):
+    """Yield one tuple per data row holding only `columns`, in that order.
+
+    A column missing from the header raises KeyError, unless `optional` is
+    set, in which case its value is None in every tuple.
+    """
+    workbook, sheet = _open_sheet(path, sheet_name)
+    try:
+        rows = sheet.iter_rows(values_only=True)
+        headers = next(rows, None) or ()
+        header_index = {}
+        for idx, name in enumerate(headers):
+            header_index.setdefault(name, idx)
+
+        indices = []
+        for column in columns:
+            if column in header_index:
+                indices.append(header_index[column])
+            elif optional:
+                indices.append(None)
+            else:
+                raise KeyError(f"Column not found in {path}: {column}")
+
+        for row in rows:
+            width = len(row)
+            yield tuple(row[i] if i is not None and i < width else None for i in indices)
+    finally:
+        workbook.close()
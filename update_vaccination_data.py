@@ -1,8 +1,12 @@
 import pandas as pd
-import json
+
+from column_data import write_columns
+from data_patches import write_versioned_js
+from excel_cache import read_excel
+from geopackage import write_layer
 
 # Read the new summary file
-df = pd.read_excel('data/summery.xlsx')
+df = read_excel('data/summery.xlsx')
 
 # Read location coordinates
 locations = pd.read_csv('data/location_point_unified_corrected.csv')
@@ -83,10 +87,16 @@ geojson = {
 print(f'Matched coordinates: {matched}')
 
 # Save as JS file (overwrite old vaccination_data.js)
-with open('data/vaccination_data.js', 'w', encoding='utf-8') as f:
-    f.write('var vaccinationData = ')
-    json.dump(geojson, f, ensure_ascii=False)
-    f.write(';')
+# (plus a patch against the previous version, see data_patches.py).
+# Written unpruned: these underscore property names (Health_Facility,
+# all_child, ...) are not the ones the "vaccination_data" publish profile lists
+write_versioned_js('data/vaccination_data.js', 'vaccinationData', geojson, profile=False)
+
+# Typed-array columns of the same rows for the map pages (js/column_data.js)
+write_columns('data/vaccination_data.js', geojson, profile=False)
+
+# Same layer in the GeoPackage for QGIS (R-tree indexed, see geopackage.py)
+write_layer(geojson, 'vaccination_data')
 
 print('Updated: data/vaccination_data.js')
 
@@ -0,0 +1,226 @@
+"""
+Static Mapbox Vector Tiles (z/x/y.pbf) of the point layers.
+
+The features are cut into tiles/<layer>/<z>/<x>/<y>.pbf for
+L.vectorGrid.protobuf (js/Leaflet.VectorGrid.js), so a page draws only the
+tiles in view instead of one marker per point. Per zoom, points closer than
+CLUSTER_PIXELS on screen are merged into one point at their mean position,
+carrying point_count and the sum of the numeric properties listed in
+`sums`; lone points keep all their properties. From cluster_max_zoom + 1 on
+every point is drawn as is.
+
+The tiles are encoded here (points only, MVT spec 2.1) so no protobuf
+package is needed. tiles/<layer>/metadata.json is a TileJSON description
+(zoom range, bounds, fields) for other clients such as QGIS; keep
+MIN_ZOOM / MAX_ZOOM in step with js/vector_tiles.js.
+"""
+import glob
+import json
+import math
+import os
+import struct
+
+TILE_DIR = 'tiles'
+EXTENT = 4096
+TILE_SIZE = 256
+BUFFER_PIXELS = 32        # points this close to a tile edge go into both tiles
+CLUSTER_PIXELS = 32
+MIN_ZOOM = 8
+MAX_ZOOM = 14
+CLUSTER_MAX_ZOOM = 12
+
+
+# --- protobuf encoding -----------------------------------------------------
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _field(number, wire_type):
+    return _varint((number << 3) | wire_type)
+
+
+def _bytes_field(number, data):
+    return _field(number, 2) + _varint(len(data)) + data
+
+
+def _uint_field(number, value):
+    return _field(number, 0) + _varint(value)
+
+
+def _packed(number, values):
+    return _bytes_field(number, b''.join(_varint(v) for v in values))
+
+
+def _value(value):
+    """Encoded tile Value message."""
+    if isinstance(value, bool):
+        return _uint_field(7, int(value))
+    if isinstance(value, int):
+        return _field(6, 0) + _varint(_zigzag(value))
+    if isinstance(value, float):
+        return _field(3, 1) + struct.pack('<d', value)
+    return _bytes_field(1, str(value).encode('utf-8'))
+
+
+def encode_tile(layer_name, points):
+    """MVT bytes of one layer of (fid, x, y, properties), x/y in tile units."""
+    keys, values = {}, {}
+    features = []
+    for fid, x, y, props in points:
+        tags = []
+        for key, value in props.items():
+            if value is None or isinstance(value, (dict, list)):
+                continue
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault((type(value).__name__, value), len(values)))
+        # MoveTo(1) with one point: command integer 9
+        feature = _uint_field(1, fid) + _packed(2, tags) + _uint_field(3, 1)
+        feature += _packed(4, [9, _zigzag(x), _zigzag(y)])
+        features.append(_bytes_field(2, feature))
+
+    layer = _uint_field(15, 2) + _bytes_field(1, layer_name.encode('utf-8'))
+    layer += b''.join(features)
+    layer += b''.join(_bytes_field(3, key.encode('utf-8')) for key in keys)
+    layer += b''.join(_bytes_field(4, _value(value)) for _, value in values)
+    layer += _uint_field(5, EXTENT)
+    return _bytes_field(3, layer)
+
+
+# --- tiling ------------------------------------------------------------------
+
+def world_pixels(lon, lat, zoom):
+    """Web Mercator position in pixels of a TILE_SIZE tile grid at `zoom`."""
+    scale = TILE_SIZE * 2 ** zoom
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    sin = math.sin(math.radians(lat))
+    x = (lon + 180) / 360 * scale
+    y = (0.5 - math.log((1 + sin) / (1 - sin)) / (4 * math.pi)) * scale
+    return x, y
+
+
+def _points(features):
+    """(fid, lon, lat, properties) of the Point features; [0, 0] placeholders
+    of facilities without coordinates are left out."""
+    points = []
+    for fid, feature in enumerate(features, start=1):
+        geometry = feature.get('geometry') or {}
+        if geometry.get('type') != 'Point':
+            continue
+        lon, lat = geometry['coordinates'][:2]
+        if lon == 0 and lat == 0:
+            continue
+        points.append((fid, lon, lat, feature['properties']))
+    return points
+
+
+def _number(value):
+    """Numeric value of a summed property; the location layer stores its
+    counts as strings ("20")."""
+    if isinstance(value, str):
+        try:
+            return float(value) if '.' in value else int(value)
+        except ValueError:
+            return 0
+    return value or 0
+
+
+def cluster(points, zoom, sums=()):
+    """Points of one zoom level as (fid, px, py, properties) in world pixels."""
+    cells = {}
+    for fid, lon, lat, props in points:
+        px, py = world_pixels(lon, lat, zoom)
+        cells.setdefault((int(px // CLUSTER_PIXELS), int(py // CLUSTER_PIXELS)), []).append((fid, px, py, props))
+
+    result = []
+    for members in cells.values():
+        if len(members) == 1:
+            result.append(members[0])
+            continue
+        props = {'point_count': len(members)}
+        for key in sums:
+            props[key] = sum(_number(m[3].get(key)) for m in members)
+        result.append((0, sum(m[1] for m in members) / len(members),
+                       sum(m[2] for m in members) / len(members), props))
+    return result
+
+
+def tiles_of_zoom(points, buffer=BUFFER_PIXELS):
+    """{(x, y): [(fid, tx, ty, properties)]} with tile-local coordinates."""
+    tiles = {}
+    scale = EXTENT / TILE_SIZE
+    for fid, px, py, props in points:
+        xs = {int((px + d) // TILE_SIZE) for d in (-buffer, 0, buffer)}
+        ys = {int((py + d) // TILE_SIZE) for d in (-buffer, 0, buffer)}
+        for tx in xs:
+            for ty in ys:
+                local = (round((px - tx * TILE_SIZE) * scale), round((py - ty * TILE_SIZE) * scale))
+                tiles.setdefault((tx, ty), []).append((fid,) + local + (props,))
+    return tiles
+
+
+def write_tiles(geojson, name, tile_dir=TILE_DIR, sums=(), min_zoom=MIN_ZOOM,
+                max_zoom=MAX_ZOOM, cluster_max_zoom=CLUSTER_MAX_ZOOM):
+    """Write tiles/<name>/<z>/<x>/<y>.pbf and metadata.json; return the
+    metadata. Tiles of an earlier run that are not written again are removed.
+    """
+    folder = os.path.join(tile_dir, name)
+    points = _points(geojson['features'])
+    written = set()
+    counts = {}
+
+    for zoom in range(min_zoom, max_zoom + 1):
+        if zoom <= cluster_max_zoom:
+            zoom_points = cluster(points, zoom, sums)
+        else:
+            zoom_points = [(fid,) + world_pixels(lon, lat, zoom) + (props,) for fid, lon, lat, props in points]
+        tiles = tiles_of_zoom(zoom_points)
+        counts[zoom] = len(tiles)
+        for (x, y), tile_points in tiles.items():
+            path = os.path.join(folder, str(zoom), str(x), f'{y}.pbf')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(encode_tile(name, tile_points))
+            written.add(os.path.normpath(path))
+
+    for path in glob.glob(os.path.join(glob.escape(folder), '*', '*', '*.pbf')):
+        if os.path.normpath(path) not in written:
+            os.remove(path)
+
+    fields = {}
+    for _, _, _, props in points:
+        for key, value in props.items():
+            if key not in fields and value is not None and not isinstance(value, (dict, list)):
+                fields[key] = 'Number' if isinstance(value, (int, float)) and not isinstance(value, bool) else 'String'
+    fields['point_count'] = 'Number'
+
+    lons = [p[1] for p in points] or [0]
+    lats = [p[2] for p in points] or [0]
+    metadata = {
+        'tilejson': '2.2.0',
+        'name': name,
+        'tiles': ['{z}/{x}/{y}.pbf'],
+        'minzoom': min_zoom,
+        'maxzoom': max_zoom,
+        'cluster_maxzoom': cluster_max_zoom,
+        'bounds': [min(lons), min(lats), max(lons), max(lats)],
+        'vector_layers': [{'id': name, 'fields': fields, 'minzoom': min_zoom, 'maxzoom': max_zoom}],
+        'sums': list(sums),
+    }
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, 'metadata.json'), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    print(f"{name}: {len(points)} points, {sum(counts.values())} tiles in {folder}")
+    return metadata
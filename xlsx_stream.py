@@ -0,0 +1,105 @@
+"""
+Incremental worksheet parser that reads rows straight from an .xlsx file.
+
+The worksheet XML and xl/sharedStrings.xml are read from the zip with
+ElementTree.iterparse and elements are cleared as soon as they are consumed,
+so memory use does not grow with the number of rows. No manual extraction
+of sheet_data.xml is needed.
+"""
+import posixpath
+import string
+import xml.etree.ElementTree as ET
+import zipfile
+from itertools import product
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Column letters -> 0-based index, precomputed for A..ZZZ (Excel's max is XFD)
+COLUMN_INDEX = {}
+for _width in (1, 2, 3):
+    for _letters in product(string.ascii_uppercase, repeat=_width):
+        COLUMN_INDEX[''.join(_letters)] = len(COLUMN_INDEX)
+
+
+def column_index(ref):
+    """0-based column index of a cell reference such as 'AB12'."""
+    return COLUMN_INDEX[ref.rstrip('0123456789')]
+
+
+def _sheet_path(archive, sheet):
+    """Zip member name of a worksheet, given its 1-based position or name."""
+    workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+    sheets = workbook.iter(MAIN_NS + 'sheet')
+    for position, entry in enumerate(sheets, 1):
+        if sheet in (position, entry.get('name')):
+            rel_id = entry.get(REL_NS + 'id')
+            break
+    else:
+        raise KeyError(f"Worksheet not found: {sheet}")
+
+    rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels.iter(PKG_REL_NS + 'Relationship'):
+        if rel.get('Id') == rel_id:
+            target = rel.get('Target')
+            if target.startswith('/'):
+                return target.lstrip('/')
+            return posixpath.normpath(posixpath.join('xl', target))
+    raise KeyError(f"Relationship not found for worksheet: {sheet}")
+
+
+def read_shared_strings(archive):
+    """List of shared strings; rich-text runs are joined into one string."""
+    if 'xl/sharedStrings.xml' not in archive.namelist():
+        return []
+    strings = []
+    with archive.open('xl/sharedStrings.xml') as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == MAIN_NS + 'si':
+                strings.append(''.join(t.text or '' for t in elem.iter(MAIN_NS + 't')))
+                elem.clear()
+    return strings
+
+
+def iter_rows(xlsx_path, sheet=1):
+    """Yield every row of a worksheet as a list of cell values.
+
+    Values are the raw cell text (shared and inline strings resolved), with
+    None for empty cells; number conversion is left to the caller.
+    """
+    with zipfile.ZipFile(xlsx_path) as archive:
+        shared = read_shared_strings(archive)
+        with archive.open(_sheet_path(archive, sheet)) as f:
+            sheet_data = None
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    if elem.tag == MAIN_NS + 'sheetData':
+                        sheet_data = elem
+                    continue
+                if elem.tag != MAIN_NS + 'row':
+                    continue
+
+                values = []
+                for cell in elem.iter(MAIN_NS + 'c'):
+                    cell_type = cell.get('t')
+                    if cell_type == 'inlineStr':
+                        value = ''.join(t.text or '' for t in cell.iter(MAIN_NS + 't'))
+                    else:
+                        v = cell.find(MAIN_NS + 'v')
+                        value = v.text if v is not None else None
+                        if cell_type == 's' and value is not None:
+                            value = shared[int(value)]
+
+                    ref = cell.get('r')
+                    idx = column_index(ref) if ref else len(values)
+                    if idx >= len(values):
+                        values.extend([None] * (idx + 1 - len(values)))
+                    values[idx] = value
+
+                # Drop the finished row so the tree never holds more than one
+                if sheet_data is not None:
+                    sheet_data.clear()
+                else:
+                    elem.clear()
+                yield values